@@ -10,6 +10,9 @@ core.lib.stdlib.argparse is all CRUD on parsers
 core.lib are modules that contain code that is about (but does not modify) the library. somewhat referential to core.functor and core.types.
 
 Updates:
+    2026-10-18 - core.lib.stdlib.argparse - FIX: LazyUsageArgumentParser takes an explicit usage_factory, lazy_usage is typed as the Callable[[], str] it is
+    2026-10-18 - core.lib.stdlib.argparse - FIX: LazyUsageArgumentParser._usage is typed, added lazy_usage for add_parser
+    2026-10-18 - core.lib.stdlib.argparse - added LazyUsageArgumentParser
     2024-11-26 - core.lib.stdlib.argparse - initial commit
 '''
 
@@ -21,7 +24,8 @@ import pydoc
 import logging
 import argparse
 import inspect
-from typing import Callable
+import functools
+from typing import Any, Callable, Optional
 
 # third party imports
 
@@ -42,3 +46,42 @@ LOGGER.addHandler(logging.NullHandler())
 
 class ArgparseNiceFormat(argparse.RawDescriptionHelpFormatter, argparse.ArgumentDefaultsHelpFormatter):
     pass
+
+
+class LazyUsageArgumentParser(argparse.ArgumentParser):
+    '''
+    usage_factory makes the usage string the first time usage is needed (-h, an error, etc.) rather than up front,
+    so a cli with a lot of subparsers doesnt pay for pydoc.render_doc on every one of them at startup.
+    >>> subparsers = parser.add_subparsers(parser_class=LazyUsageArgumentParser)
+    >>> subparsers.add_parser('tdd', usage_factory=lazy_usage(audit_tdd))
+    '''
+    _usage = None  # type: Optional[str]
+    _usage_factory = None  # type: Optional[Callable[[], str]]
+
+    def __init__(self, *args, usage_factory=None, **kwargs):
+        # type: (Any, Optional[Callable[[], str]], Any) -> None
+        super().__init__(*args, **kwargs)
+        if usage_factory is not None:
+            if self._usage is not None:
+                raise ValueError('give usage or usage_factory, not both')
+            self._usage_factory = usage_factory
+
+    @property
+    def usage(self):
+        # type: () -> Optional[str]
+        if self._usage_factory is not None:
+            self._usage, self._usage_factory = self._usage_factory(), None
+        return self._usage
+
+    @usage.setter
+    def usage(self, value):
+        # type: (Optional[str]) -> None
+        self._usage, self._usage_factory = value, None
+
+
+def lazy_usage(func):
+    # type: (Callable) -> Callable[[], str]
+    '''
+    the pydoc of func as a LazyUsageArgumentParser usage_factory, rendered the first time it is shown rather than now.
+    '''
+    return functools.partial(pydoc.render_doc, func)
@@ -11,6 +11,10 @@ core.lib.stdlib.inspect is all about the framerate
 core.lib are modules that contain code that is about (but does not modify) the library. somewhat referential to core.functor and core.types.
 
 Updates:
+    2026-10-18 - core.lib.stdlib.inspect - FIX: index_module_signatures imports sequentially, FunctionSpecification hashes by func and name
+    2026-10-18 - core.lib.stdlib.inspect - FIX: the frame walked by get_variable_names_linenos is typed Optional[FrameType]
+    2026-10-18 - core.lib.stdlib.inspect - FunctionSpecification is frozen and cached per code object, added index_module_signatures
+    2026-10-18 - core.lib.stdlib.inspect - get_variable_names_linenos and get_this_file_lineno walk sys._getframe instead of inspect.stack, relpath is cached
     2024-11-27 - core.lib.stdlib.inspect - simplified get_variable_names_linenos and FunctionSpecification
     2024-11-26 - core.lib.stdlib.inspect - added FunctionSpecification
                  core.lib.stdlib.inspect - added get_variable_name_lineno
@@ -23,8 +27,13 @@ import os
 import sys
 import inspect
 import logging
+import pkgutil
+import weakref
+import functools
+import importlib
 from dataclasses import dataclass
-from typing import Any, Optional, Callable, List, Tuple
+from types import CodeType, FrameType, MappingProxyType, ModuleType
+from typing import Any, Optional, Callable, List, Tuple, Dict, Mapping, Union
 
 # third party imports
 
@@ -43,22 +52,28 @@ THIS_MODULE = sys.modules[__name__]
 LOGGER = logging.getLogger(__name__)
 LOGGER.addHandler(logging.NullHandler())
 
+RELPATH_CACHE_SIZE = 1024
+
 
 def get_variable_names_linenos(var, stack_frames=-1, ignore_frames=None):
     # type: (Any, int, Optional[List[int]]) -> List[Tuple[str, int]]
     '''
     https://stackoverflow.com/a/18425523
+    walks the frames with sys._getframe rather than inspect.stack, which would build a FrameInfo and read source context for every frame on the stack
     '''
     name_lineno: List[Tuple[str, int]] = []
     ignore_frames = ignore_frames or []
-    for i, frame_tuple in enumerate(inspect.stack()):
-        if i in ignore_frames:
-            continue
-        frame = frame_tuple[0]
-        lineno = frame_tuple[2]
-        name_lineno += [(k, lineno) for k, v in frame.f_locals.items() if v is var]
-        if i == stack_frames:
-            break
+    frame = sys._getframe(0)  # type: Optional[FrameType]  # pylint: disable=protected-access
+    i = 0
+    while frame is not None:
+        if i not in ignore_frames:
+            lineno = frame.f_lineno
+            name_lineno += [(k, lineno) for k, v in frame.f_locals.items() if v is var]
+            if i == stack_frames:
+                break
+        frame = frame.f_back
+        i += 1
+    del frame
     if len(name_lineno) == 0:
         name_lineno.append(('<anonymous>', -1))
     return name_lineno
@@ -73,18 +88,26 @@ def get_variable_name_lineno(var, stack_frames=-1):
     return names_linenos[-1]
 
 
-@dataclass
+@dataclass(frozen=True)
 class FunctionSpecification(object):
+    '''
+    Description:
+        what a function takes. frozen, positional is a tuple and optional is read-only, so get can hand out what it has cached.
+        equality compares every field, the hash only the func and name since a mappingproxy has none of its own.
+    '''
     func: Callable
     name: str
-    positional: List[str]
-    optional: dict
+    positional: Tuple[str, ...]
+    optional: Mapping[str, Any]
     varargs: Optional[str]
     varkwargs: Optional[str]
 
+    def __hash__(self):
+        return hash((self.func, self.name))
+
     def __str__(self):
         return '{}(name="{}", positional={}, optional={}, varargs={}, varkwargs={})'.format(
-            self.__class__.__name__, self.name, self.positional, unordered_dict(self.optional), repr(self.varargs), repr(self.varkwargs)
+            self.__class__.__name__, self.name, list(self.positional), unordered_dict(dict(self.optional)), repr(self.varargs), repr(self.varkwargs)
         )
 
     def to_invocation_string(self, ignore_self=False):
@@ -96,7 +119,7 @@ class FunctionSpecification(object):
         return invocation_string(
             self.func,
             args=positionals,
-            kwargs=self.optional,
+            kwargs=dict(self.optional),
             varargs=self.varargs,
             varkwargs=self.varkwargs,
             func_name=self.name,
@@ -111,13 +134,26 @@ class FunctionSpecification(object):
             ...     pass
             ...
             ... FunctionSpecification(func)
+            getfullargspec only runs once per code object (and its defaults), see _SPECIFICATION_CACHE
         Raises:
             ValueError if not a function or method
         '''
         if not inspect.isfunction(func) and not inspect.ismethod(func):
             raise ValueError('provided func {} is not a function, or at least its not by inspect standards'.format(repr(func)))
-        name = func.__name__
+        function = func.__func__ if inspect.ismethod(func) else func
+        code = function.__code__
+        defaults, kwdefaults = function.__defaults__, function.__kwdefaults__
+        cached = _SPECIFICATION_CACHE.get(code)
+        # closures share a code object but not necessarily their defaults
+        if cached is None or cached[0] is not defaults or cached[1] is not kwdefaults:
+            cached = (defaults, kwdefaults, FunctionSpecification._arguments(func))
+            _SPECIFICATION_CACHE[code] = cached
+        positional, optional, varargs, varkwargs = cached[2]
+        return FunctionSpecification(func=func, name=func.__name__, positional=positional, optional=optional, varargs=varargs, varkwargs=varkwargs)
 
+    @staticmethod
+    def _arguments(func):
+        # type: (Callable) -> Tuple[Tuple[str, ...], Mapping[str, Any], Optional[str], Optional[str]]
         # TODO: which python versions trigger this?
         # try:
         #     args, varargs, varkw, defaults = inspect.getargspec(func)
@@ -126,28 +162,86 @@ class FunctionSpecification(object):
         (args, varargs, varkw, defaults, kwonlyargs, kwonlydefaults, annotations) = inspect.getfullargspec(func)  # pylint: disable=no-member
 
         positional = args
-        optional = kwonlydefaults or {}
+        optional = dict(kwonlydefaults or {})  # a copy, this ends up cached
         if defaults is not None and len(defaults) > 0:
             positional = [a for a in args[:-len(defaults)]]
             for i, argname in enumerate(args[-len(defaults):]):
                 if argname != 'self':
                     optional[argname] = defaults[i]
-        varargs = varargs
-        varkwargs = varkw
-        fs = FunctionSpecification(func=func, name=name, positional=positional, optional=optional, varargs=varargs, varkwargs=varkwargs)
-        return fs
+        return tuple(positional), MappingProxyType(optional), varargs, varkw
+
+
+# code object -> (__defaults__, __kwdefaults__, arguments), nothing in the value refers back to the function so the code object can still be collected
+_SPECIFICATION_CACHE = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary[CodeType, Tuple[Optional[tuple], Optional[dict], tuple]]
+
+
+def _module_signatures(module_name):
+    # type: (str) -> Dict[str, FunctionSpecification]
+    try:
+        module = importlib.import_module(module_name)
+    except Exception:
+        LOGGER.warning('%r wasnt importable for some reason!', module_name)
+        LOGGER.debug('exception', exc_info=True)
+        return {}
+    signatures = {}
+    for obj in list(vars(module).values()):
+        if getattr(obj, '__module__', None) != module_name:
+            continue  # imported from elsewhere, it gets indexed where it lives
+        if inspect.isfunction(obj):
+            funcs = [obj]  # type: List[Callable]
+        elif inspect.isclass(obj):
+            funcs = [
+                ele.__func__ if isinstance(ele, (staticmethod, classmethod)) else ele
+                for ele in vars(obj).values()
+                if inspect.isfunction(ele) or isinstance(ele, (staticmethod, classmethod))
+            ]
+        else:
+            continue
+        for func in funcs:
+            signatures['{}.{}'.format(module_name, func.__qualname__)] = FunctionSpecification.get(func)
+    return signatures
+
+
+def index_module_signatures(module):
+    # type: (Union[ModuleType, str]) -> Dict[str, FunctionSpecification]
+    '''
+    Description:
+        the FunctionSpecification of every function (and method) defined in a module, or in every module of a package.
+        the modules are imported one after the other in walk order, so a package is always imported before its submodules,
+        threads would only fight over the import lock, and specs hold functions which dont cross process boundaries.
+        >>> index_module_signatures('chriscarl.tools.shed')['chriscarl.tools.shed.dev.audit_tdd'].to_invocation_string()
+    Returns:
+        Dict[str, FunctionSpecification]
+            'module.qualname' -> spec
+    '''
+    if isinstance(module, str):
+        module = importlib.import_module(module)
+    if hasattr(module, '__path__'):
+        module_names = [module.__name__] + [
+            info.name for info in pkgutil.walk_packages(module.__path__, prefix='{}.'.format(module.__name__), onerror=lambda name: None)
+        ]
+    else:
+        module_names = [module.__name__]
+
+    signatures = {}  # type: Dict[str, FunctionSpecification]
+    for module_name in module_names:
+        signatures.update(_module_signatures(module_name))
+    return signatures
+
+
+@functools.lru_cache(maxsize=RELPATH_CACHE_SIZE)
+def _relpath(filepath, cwd):
+    # type: (str, str) -> str
+    return os.path.relpath(filepath, cwd)
 
 
 def get_this_file_lineno(stack_frames=1):
     # type: (int) -> Tuple[str, int]
-    for i, frame_tuple in enumerate(inspect.stack()):
-        if i != stack_frames:
-            continue
-        if i == stack_frames:
-            relpath = os.path.relpath(frame_tuple[1], os.getcwd())
-            lineno = frame_tuple[2]
-            return relpath, lineno
-    return '', -1
+    try:
+        frame = sys._getframe(stack_frames)  # pylint: disable=protected-access
+    except ValueError:  # the stack isnt that deep
+        return '', -1
+    return _relpath(frame.f_code.co_filename, os.getcwd()), frame.f_lineno
 
 
 def get_caller_file_lineno():
@@ -10,6 +10,8 @@ core.lib.stdlib.io is all about basic input/output operations
 core.lib are modules that contain code that is about (but does not modify) the library. somewhat referential to core.functor and core.types.
 
 Updates:
+    2026-10-18 - core.lib.stdlib.io - FIX: normalize is typed as the NormalizationForm Literal that unicodedata.normalize expects
+    2026-10-18 - core.lib.stdlib.io - added iter_transcode and transcode_file for streaming re-encoding and normalization
     2024-11-24 - core.lib.stdlib.io - initial commit
 '''
 
@@ -17,7 +19,10 @@ Updates:
 from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
 import os
 import sys
+import codecs
 import logging
+import unicodedata
+from typing import Iterable, Generator, Optional, Callable, Tuple, Literal
 
 # third party imports
 
@@ -37,6 +42,12 @@ LOGGER.addHandler(logging.NullHandler())
 
 MODES = ['r', 'w', 'a', 'rb', 'wb', 'ab']
 MODES += ['{}+'.format(__mode) for __mode in MODES]
+NORMALIZATION_FORMS = ['NFC', 'NFKC', 'NFD', 'NFKD']
+NormalizationForm = Literal['NFC', 'NFKC', 'NFD', 'NFKD']
+CHUNK_SIZE = 1 << 20
+NORMALIZE_HOLDBACK = 256  # if no safe place to cut is found this close to the end of a chunk, just cut
+# not combining marks, but canonically compose with the char before them (hangul vowels/trailers are checked by range)
+COMPOSING_STARTERS = frozenset('\u0b3e\u0b56\u0b57\u0bbe\u0bd7\u0cc2\u0cd5\u0cd6\u0d3e\u0d57\u0dcf\u0ddf\u102e\u1b35')
 
 
 def read_text_file(filepath, encoding='utf-8'):
@@ -66,3 +77,106 @@ def write_bytes_file(filepath, content):
     make_file_dirpath(filepath)
     with open(filepath, 'wb') as wb:
         return wb.write(content)
+
+
+def _normalization_boundary(text):
+    # type: (str) -> int
+    '''
+    Description:
+        the last index it is safe to cut text at so that normalize(a) + normalize(b) == normalize(a + b).
+        nothing composes into or reorders across an ascii char, so usually the cut is right before the last one,
+        otherwise right before the last char that (even decomposed) isnt a combining mark or one of the few
+        non-combining chars that compose with whatever is before them.
+    '''
+    stop = max(0, len(text) - NORMALIZE_HOLDBACK)
+    for i in range(len(text) - 1, stop - 1, -1):
+        char = text[i]
+        if char < '\x80':
+            return i
+        head = unicodedata.normalize('NFKD', char)[0]
+        if not unicodedata.combining(head) and head not in COMPOSING_STARTERS and not '\u1160' <= head <= '\u11ff':
+            return i
+    return len(text) if stop else 0
+
+
+def iter_transcode(chunks, encoding='utf-8', errors='strict', normalize=None, transform=None):
+    # type: (Iterable[bytes], str, str, Optional[NormalizationForm], Optional[Callable[[str], str]]) -> Generator[str, None, None]
+    '''
+    Description:
+        decode a stream of byte chunks into text chunks without ever holding more than one chunk (plus a few chars).
+        multi-byte characters split across chunks are stitched back together by an incremental decoder, and
+        if normalizing, the tail of each chunk that might still combine with the next one is held back.
+
+    Arguments:
+        chunks: Iterable[bytes]
+        encoding: str
+        errors: str
+            'strict', 'replace', 'ignore', etc. same as bytes.decode
+        normalize: Optional[NormalizationForm]
+            NFC, NFKC, NFD, NFKD
+        transform: Optional[Callable[[str], str]]
+            any other per-chunk cleanup, applied after normalization, must not care where the chunks are cut
+
+    Returns:
+        Generator[str, None, None]
+    '''
+    if normalize is not None and normalize not in NORMALIZATION_FORMS:
+        raise ValueError('normalize must be one of {}, got {!r}'.format(NORMALIZATION_FORMS, normalize))
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    pending = ''
+    for chunk in chunks:
+        text = pending + decoder.decode(chunk)
+        if normalize:
+            cut = _normalization_boundary(text)
+            text, pending = unicodedata.normalize(normalize, text[:cut]), text[cut:]
+        if transform:
+            text = transform(text)
+        if text:
+            yield text
+    text = pending + decoder.decode(b'', final=True)
+    if normalize:
+        text = unicodedata.normalize(normalize, text)
+    if transform:
+        text = transform(text)
+    if text:
+        yield text
+
+
+def transcode_file(
+    src_filepath,
+    dst_filepath,
+    src_encoding='utf-8',
+    dst_encoding='utf-8',
+    errors='strict',
+    normalize=None,
+    transform=None,
+    chunk_size=CHUNK_SIZE,
+):
+    # type: (str, str, str, str, str, Optional[NormalizationForm], Optional[Callable[[str], str]], int) -> Tuple[int, int]
+    '''
+    Description:
+        re-encode, normalize, and/or clean a file of any size in chunk_size pieces.
+        strip_unicode for a multi-GB file is transcode_file(src, dst, errors='ignore') (or 'replace').
+        >>> transcode_file('in.txt', 'out.txt', src_encoding='utf-16', normalize='NFKC')
+
+    Returns:
+        Tuple[int, int]
+            bytes read, bytes written
+    '''
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1, got {}'.format(chunk_size))
+    make_file_dirpath(dst_filepath)
+    read = written = 0
+    encoder = codecs.getincrementalencoder(dst_encoding)(errors=errors)
+    with open(src_filepath, 'rb') as rb, open(dst_filepath, 'wb') as wb:
+
+        def chunks():
+            nonlocal read
+            for chunk in iter(lambda: rb.read(chunk_size), b''):
+                read += len(chunk)
+                yield chunk
+
+        for text in iter_transcode(chunks(), encoding=src_encoding, errors=errors, normalize=normalize, transform=transform):
+            written += wb.write(encoder.encode(text))
+        written += wb.write(encoder.encode('', final=True))
+    return read, written
@@ -10,6 +10,9 @@ core.lib.stdlib.json is all about making sure I dont have to write indent=4 or c
 core.lib are modules that contain code that is about (but does not modify) the library. somewhat referential to core.functor and core.types.
 
 Updates:
+    2026-10-18 - core.lib.stdlib.json - FIX: LazyJSON raises ValueError on empty or truncated input and rejects encodings that dont write json punctuation as ascii
+    2026-10-18 - core.lib.stdlib.json - FIX: LazyJSON scans only as far as the key, arrays keep checkpoints rather than every member, no whole-file bracket index
+    2026-10-18 - core.lib.stdlib.json - added LazyJSON and read_json_lazy
     2024-11-24 - core.lib.stdlib.json - initial commit
 '''
 
@@ -17,14 +20,20 @@ Updates:
 from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
 import os
 import sys
+import re
 import json
+import mmap
+import array
 import logging
-from typing import Union
+from collections import OrderedDict
+from typing import Union, Optional, Any, Dict, List, Tuple, IO
 
 # third party imports
 
 # project imports
+from chriscarl.core.constants import SENTINEL
 from chriscarl.core.lib.stdlib.os import make_file_dirpath
+from chriscarl.core.types.iterable import CompiledKey, compile_key
 
 SCRIPT_RELPATH = 'chriscarl/core/lib/stdlib/json.py'
 if not hasattr(sys, '_MEIPASS'):
@@ -68,3 +77,279 @@ def dict_to_string(obj, indent=2):
 
 
 json_to_string = dict_to_string
+
+
+STRUCTURE_REGEX = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{}]')
+STRING_REGEX = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+SCALAR_REGEX = re.compile(rb'[^,\]}\s]+')
+WHITESPACE_REGEX = re.compile(rb'[ \t\r\n]*')
+_QUOTE, _OPEN_OBJECT, _OPEN_ARRAY, _CLOSE_OBJECT, _CLOSE_ARRAY, _COMMA, _COLON = b'"{[}],:'
+_CLOSERS = {_OPEN_OBJECT: _CLOSE_OBJECT, _OPEN_ARRAY: _CLOSE_ARRAY}
+STRUCTURE_CHARS = '"{[}],:\\ \t\r\n'  # everything the regexes above look for, an encoding has to write these as ascii
+ARRAY_CHECKPOINT = 256
+
+
+class LazyJSON(object):
+    '''
+    Description:
+        a read-only view over json bytes (or an mmap of a json file) that only decodes the subtrees you ask for.
+        nothing is indexed up front, a lookup scans the containers on the way down to the key, skipping over what comes before it,
+        and only the target gets json.loads'd. what gets remembered is proportional to what was touched:
+            objects     where the values of the keys scanned so far start, and where to pick the scan back up
+            arrays      the offset of every ARRAY_CHECKPOINT-th member and, once seen, the length, so records.5 stops at 5
+        >>> with LazyJSON.from_filepath('huge.json') as lj:
+        ...     lj.get('servers.0.ports')
+        ... [80, 443]
+    '''
+
+    def __init__(self, buffer, encoding='utf-8'):
+        # type: (Union[bytes, bytearray, memoryview, mmap.mmap], str) -> None
+        '''
+        Raises:
+            ValueError: the encoding doesnt write json's punctuation as ascii (utf-16, utf-32, etc.), or there is no document
+        '''
+        # the scan looks for ascii bytes, an encoding that spells them any other way would be misread rather than fail
+        if STRUCTURE_CHARS.encode(encoding) != STRUCTURE_CHARS.encode('ascii'):
+            raise ValueError('LazyJSON only reads ascii compatible encodings like utf-8, transcode {!r} first'.format(encoding))
+        self.buffer = buffer
+        self.encoding = encoding
+        if self._skip_whitespace(0) >= len(buffer):
+            raise ValueError('there is no json document, it is empty')
+        self._file = None  # type: Optional[IO[bytes]]
+        self._members = {}  # type: Dict[int, Dict[str, int]]
+        self._resume = {}  # type: Dict[int, Tuple[int, bool]]
+        self._checkpoints = {}  # type: Dict[int, array.array]
+        self._lengths = {}  # type: Dict[int, int]
+
+    @classmethod
+    def from_filepath(cls, filepath, encoding='utf-8'):
+        # type: (str, str) -> LazyJSON
+        rb = open(filepath, 'rb')
+        try:
+            if os.fstat(rb.fileno()).st_size == 0:
+                raise ValueError('there is no json document, "{}" is empty'.format(filepath))
+            buffer = mmap.mmap(rb.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            rb.close()
+            raise
+        lazy = cls(buffer, encoding=encoding)
+        lazy._file = rb
+        return lazy
+
+    def close(self):
+        # type: () -> None
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_tb):
+        self.close()
+
+    def _container_end(self, start):
+        # type: (int) -> int
+        '''
+        Description:
+            offset just past the bracket that closes the container opening at start,
+            strings are skipped whole by the regex so brackets inside of them dont count
+        '''
+        buffer = self.buffer
+        stack = []  # type: List[int]
+        for mo in STRUCTURE_REGEX.finditer(buffer, start):  # type: ignore
+            pos = mo.start()
+            char = buffer[pos]
+            if char == _QUOTE:
+                continue
+            if char == _OPEN_OBJECT or char == _OPEN_ARRAY:
+                stack.append(char)
+                continue
+            if not stack or _CLOSERS[stack.pop()] != char:
+                raise ValueError('unbalanced {!r} at offset {}'.format(chr(char), pos))
+            if not stack:
+                return pos + 1
+        raise ValueError('unbalanced {!r} at offset {}, json is probably truncated'.format(chr(buffer[start]), start))
+
+    def _skip_whitespace(self, pos):
+        # type: (int) -> int
+        return WHITESPACE_REGEX.match(self.buffer, pos).end()  # type: ignore
+
+    def _value_end(self, pos):
+        # type: (int) -> int
+        if pos >= len(self.buffer):
+            raise ValueError('expected a value at offset {}, json is probably truncated'.format(pos))
+        char = self.buffer[pos]
+        if char == _OPEN_OBJECT or char == _OPEN_ARRAY:
+            return self._container_end(pos)
+        regex = STRING_REGEX if char == _QUOTE else SCALAR_REGEX
+        mo = regex.match(self.buffer, pos)  # type: ignore
+        if mo is None:
+            raise ValueError('unable to find the end of the value at offset {}'.format(pos))
+        return mo.end()
+
+    def _next_member(self, value_end):
+        # type: (int) -> int
+        pos = self._skip_whitespace(value_end)
+        if self.buffer[pos] == _COMMA:
+            pos = self._skip_whitespace(pos + 1)
+        return pos
+
+    def _object_scan(self, start, key=None):
+        # type: (int, Optional[str]) -> Optional[int]
+        '''
+        Description:
+            offset of the value of key in the object that opens at start, None if it isnt there.
+            the object is only scanned as far as the key, and picks up where it left off next time. key=None scans all of it.
+            if a key is repeated the first one wins (json.loads keeps the last), finding the last would mean scanning everything.
+        '''
+        members = self._members.get(start)
+        if members is None:
+            members = self._members[start] = OrderedDict()
+            self._resume[start] = (self._skip_whitespace(start + 1), False)
+        if key is not None and key in members:
+            return members[key]
+        buffer = self.buffer
+        pos, pending = self._resume[start]
+        try:
+            while pos != -1:
+                if pending:  # the value of the last key found, skipped only now that something past it is wanted
+                    pos = self._next_member(self._value_end(pos))
+                    pending = False
+                if buffer[pos] == _CLOSE_OBJECT:
+                    pos = -1
+                    break
+                if buffer[pos] == _CLOSE_ARRAY:
+                    raise ValueError('unbalanced {!r} at offset {}'.format(chr(buffer[pos]), pos))
+                key_end = self._value_end(pos)
+                name = json.loads(bytes(buffer[pos:key_end]).decode(self.encoding))
+                pos = self._skip_whitespace(key_end)
+                if buffer[pos] != _COLON:
+                    raise ValueError('expected ":" at offset {}'.format(pos))
+                pos = self._skip_whitespace(pos + 1)
+                members.setdefault(name, pos)
+                pending = True
+                if name == key:
+                    break
+        except IndexError as ie:  # ran off the end of the buffer
+            raise ValueError('the object at offset {} never closes, json is probably truncated'.format(start)) from ie
+        self._resume[start] = (pos, pending)
+        return None if key is None else members.get(key)
+
+    def _array_scan(self, start, index=-1):
+        # type: (int, int) -> Optional[int]
+        '''
+        Description:
+            offset of member index of the array that opens at start, from the nearest checkpoint at or before it.
+            index=-1 scans to the end so the length is known, returns None if the array ends first.
+        '''
+        buffer = self.buffer
+        checkpoints = self._checkpoints.get(start)
+        if checkpoints is None:
+            checkpoints = self._checkpoints[start] = array.array('q', [self._skip_whitespace(start + 1)])
+        c = len(checkpoints) - 1 if index == -1 else min(index // ARRAY_CHECKPOINT, len(checkpoints) - 1)
+        i, pos = c * ARRAY_CHECKPOINT, checkpoints[c]
+        try:
+            while True:
+                if buffer[pos] == _CLOSE_ARRAY:
+                    self._lengths[start] = i
+                    return None
+                if buffer[pos] == _CLOSE_OBJECT:
+                    raise ValueError('unbalanced {!r} at offset {}'.format(chr(buffer[pos]), pos))
+                if i == index:
+                    return pos
+                pos = self._next_member(self._value_end(pos))
+                i += 1
+                if i % ARRAY_CHECKPOINT == 0 and i // ARRAY_CHECKPOINT == len(checkpoints):
+                    checkpoints.append(pos)
+        except IndexError as ie:  # ran off the end of the buffer
+            raise ValueError('the array at offset {} never closes, json is probably truncated'.format(start)) from ie
+
+    def _array_length(self, start):
+        # type: (int) -> int
+        if start not in self._lengths:
+            self._array_scan(start)
+        return self._lengths[start]
+
+    def _array_member(self, start, index):
+        # type: (int, int) -> int
+        if index < 0:
+            index += self._array_length(start)
+            if index < 0:
+                raise IndexError('list index out of range')
+        elif start in self._lengths and index >= self._lengths[start]:
+            raise IndexError('list index out of range')
+        pos = self._array_scan(start, index)
+        if pos is None:
+            raise IndexError('list index out of range')
+        return pos
+
+    def span(self, key='', split='.'):
+        # type: (Union[str, CompiledKey], str) -> Tuple[int, int]
+        '''
+        Description:
+            byte offsets [start, end) of the value at key, the empty key is the whole document
+        Raises:
+            KeyError
+        '''
+        start = self._skip_whitespace(0)
+        if isinstance(key, CompiledKey):
+            tokens = key.tokens
+        else:
+            tokens = compile_key(key, split=split).tokens if key != '' else tuple()
+        for t, token in enumerate(tokens):
+            char = self.buffer[start]
+            try:
+                if char == _OPEN_OBJECT:
+                    pos = self._object_scan(start, str(token))
+                    if pos is None:
+                        raise KeyError(str(token))
+                    start = pos
+                elif char != _OPEN_ARRAY:
+                    raise TypeError('value at offset {} is not a container'.format(start))
+                elif isinstance(token, int):
+                    start = self._array_member(start, token)
+                else:
+                    raise TypeError('list indices must be integers, not {}'.format(type(token).__name__))
+            except (IndexError, KeyError, TypeError) as ike:
+                raise KeyError('key "{}" does not exist because of {!r}!'.format(split.join(str(tok) for tok in tokens[:t + 1]), ike)) from ike
+        return start, self._value_end(start)
+
+    def get(self, key='', split='.', default=SENTINEL):
+        # type: (Union[str, CompiledKey], str, Any) -> Any
+        '''
+        Description:
+            core.types.iterable.get, but only the value at key is ever decoded
+        '''
+        try:
+            start, end = self.span(key, split=split)
+        except KeyError:
+            if default != SENTINEL:
+                return default
+            raise
+        return json.loads(bytes(self.buffer[start:end]).decode(self.encoding))
+
+    def keys(self, key='', split='.'):
+        # type: (Union[str, CompiledKey], str) -> List[Union[str, int]]
+        '''
+        Description:
+            the member names (or indexes) of the container at key without decoding any of their values
+        '''
+        start, _ = self.span(key, split=split)
+        if self.buffer[start] != _OPEN_OBJECT and self.buffer[start] != _OPEN_ARRAY:
+            return []
+        if self.buffer[start] == _OPEN_OBJECT:
+            self._object_scan(start)
+            return list(self._members[start])
+        return list(range(self._array_length(start)))
+
+
+def read_json_lazy(filepath, encoding='utf-8'):
+    # type: (str, str) -> LazyJSON
+    '''
+    Description:
+        read_json, but for files too big to want to parse in full, close it (or use it as a context manager) when done
+    '''
+    return LazyJSON.from_filepath(filepath, encoding=encoding)
@@ -10,6 +10,9 @@ core.lib.stdlib.re has some nice functions, usually about searching
 core.lib are modules that contain code that is about (but does not modify) the library. somewhat referential to core.functor and core.types.
 
 Updates:
+    2026-10-18 - core.lib.stdlib.re - FIX: find_lineno_colno drops matches after a trailing break and searches line by line where a match would cross one, so LF and CRLF agree
+    2026-10-18 - core.lib.stdlib.re - FIX: find_lineno_colno falls back to the line by line search when the text has CRLF or other non-LF breaks, so $ still matches before them
+    2026-10-18 - core.lib.stdlib.re - find_lineno_colno runs one finditer over the whole text and maps offsets with a LineIndex
     2024-11-27 - core.lib.stdlib.re - initial commit
 '''
 
@@ -19,11 +22,12 @@ import os
 import sys
 import logging
 import re
-from typing import Generator, Tuple
+from typing import Generator, Tuple, Optional
 
 # third party imports
 
 # project imports
+from chriscarl.core.types.str import LineIndex
 
 SCRIPT_RELPATH = 'chriscarl/core/lib/stdlib/re.py'
 if not hasattr(sys, '_MEIPASS'):
@@ -36,6 +40,9 @@ THIS_MODULE = sys.modules[__name__]
 LOGGER = logging.getLogger(__name__)
 LOGGER.addHandler(logging.NullHandler())
 
+# every line break str.splitlines knows about except \n, which is the only one re's ^ and $ understand
+NON_NEWLINE_BREAK_REGEX = re.compile(r'[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+
 
 def find_index(find_text, within, case_insensitive=True):
     # type: (str, str, bool) -> Generator[int, None, None]
@@ -43,11 +50,45 @@ def find_index(find_text, within, case_insensitive=True):
         yield mo.start()
 
 
-def find_lineno_colno(find_text, within, case_insensitive=True):
-    # type: (str, str, bool) -> Generator[Tuple[int, int], None, None]
+def find_lineno_colno(find_text, within, case_insensitive=True, line_index=None):
+    # type: (str, str, bool, Optional[LineIndex]) -> Generator[Tuple[int, int], None, None]
     '''
     NOTE: line no and col no are 1-indexed
+    pass a line_index when searching the same text for several patterns so it is only built once.
+    matches are the ones searching every line of within.splitlines() on its own would find: ^ and $ match at every line,
+    nothing matches across a line break or after a trailing one, and LF and CRLF text give the same answers.
+    the exceptions are \\A, \\Z, and lookarounds like (?<=\\n), which see the whole text rather than one line when it only has LF breaks.
+    re only treats LF as a line end for ^ and $, so text with any other break (CRLF included) is searched line by line instead.
     '''
-    for l, line in enumerate(within.splitlines()):
-        for mo in re.finditer(find_text, line, flags=re.IGNORECASE if case_insensitive else 0):
-            yield l + 1, mo.start() + 1
+    flags = re.IGNORECASE if case_insensitive else 0
+    if NON_NEWLINE_BREAK_REGEX.search(within):
+        for l, line in enumerate(within.splitlines()):
+            for mo in re.finditer(find_text, line, flags=flags):
+                yield l + 1, mo.start() + 1
+        return
+    regex = re.compile(find_text, flags=re.MULTILINE | flags)
+    line_index = line_index or LineIndex(within)
+    # the last offset a match may start at, splitlines() has no line after a trailing break and none at all in ''
+    last_offset = len(within) if within and not within.endswith('\n') else len(within) - 1
+    pos = 0
+    while pos <= last_offset:
+        for mo in regex.finditer(within, pos):
+            start, end = mo.span()
+            if start > last_offset:
+                return
+            if within.find('\n', start, end) == -1:
+                yield line_index.lineno_colno(start)
+                continue
+            # it ran into the next line, search the lines it touched one at a time instead, then carry on after them
+            first, last = line_index.lineno_colno(start)[0], line_index.lineno_colno(end)[0]
+            for lineno in range(first, last + 1):
+                line_start = start if lineno == first else line_index.offset(lineno)
+                if line_start > last_offset:
+                    break
+                line_end = line_index.offset(lineno + 1) - 1 if lineno < len(line_index) else len(within)
+                for sub in regex.finditer(within, line_start, line_end):
+                    yield line_index.lineno_colno(sub.start())
+            pos = line_index.offset(last + 1) if last < len(line_index) else len(within) + 1
+            break
+        else:
+            return
@@ -10,6 +10,11 @@ core.lib.stdlib.typing is tricky, but I think I can hack at it to make it useful
 core.lib are modules that contain code that is about (but does not modify) the library. somewhat referential to core.functor and core.types.
 
 Updates:
+    2026-10-18 - core.lib.stdlib.typing - FIX: sample(n) reads n + 2 elements of a set or dict instead of copying the whole thing
+    2026-10-18 - core.lib.stdlib.typing - FIX: _compile and compile_validator narrow the typing with cast so the closures type check
+    2026-10-18 - core.lib.stdlib.typing - added validation levels (off, fast, debug) with per-module overrides and call site counters for isinstance_raise
+    2026-10-18 - core.lib.stdlib.typing - added ValidationPolicy (full, sample(n), shallow) settable globally, per call, or in a with block
+    2026-10-18 - core.lib.stdlib.typing - added compile_validator, isof and friends check with cached compiled closures
     2024-11-22 - core.lib.stdlib.typing - initial commit
 '''
 
@@ -17,10 +22,20 @@ Updates:
 from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
 import os
 import sys
+import time
 import inspect
+import random
 import logging
+import itertools
+import functools
+import contextlib
+import contextvars
+import threading
+import dataclasses
+from dataclasses import dataclass
 from typing import (  # type: ignore
-    Any, List, Literal, Iterable, Union, _AnyMeta, _UnionGenericAlias, _GenericAlias,
+    Any, List, Literal, Iterable, Union, Callable, Optional, Tuple, Dict, Generator, Sequence, Sized, Reversible, _AnyMeta, _UnionGenericAlias,
+    _GenericAlias, cast,
 )
 from types import ModuleType
 
@@ -43,95 +58,390 @@ _isinstance = isinstance
 T_TYPING = Union[type, Iterable, _AnyMeta, None, _UnionGenericAlias, _GenericAlias, ModuleType]
 
 
-def isof_typing(obj, typing):
-    # type: (Any, Union[_UnionGenericAlias, _GenericAlias]) -> bool
-    if _isinstance(typing, (tuple, list, set, dict)):
-        return any(isof_one(obj, typ) for typ in typing)
+COMPILE_VALIDATOR_CACHE_SIZE = 1024
+Validator = Callable[[Any], bool]
+
+
+@dataclass(frozen=True)
+class ValidationPolicy(object):
+    '''
+    Description:
+        how much of a container isof looks at.
+            full        every element, all the way down
+            sample(n)   the first, the last, and n random elements of every container
+            shallow     just the container type
+        use FULL, SHALLOW, and sample(n) rather than making these directly.
+    '''
+    mode: str = 'full'
+    n: int = 0
+
+    def __post_init__(self):
+        if self.mode not in VALIDATION_MODES:
+            raise ValueError('mode must be one of {}, got {!r}'.format(VALIDATION_MODES, self.mode))
+        if self.mode == 'sample' and self.n < 0:
+            raise ValueError('sample size must be at least 0, got {}'.format(self.n))
+
+
+VALIDATION_MODES = ['full', 'sample', 'shallow']
+FULL = ValidationPolicy('full')
+SHALLOW = ValidationPolicy('shallow')
+
+
+def sample(n):
+    # type: (int) -> ValidationPolicy
+    return ValidationPolicy('sample', n)
+
+
+@dataclass
+class ValidationSettings(object):
+    '''
+    Description:
+        policy for everything, unless the container is bigger than threshold, then large. threshold=-1 means never.
+    '''
+    policy: ValidationPolicy = FULL
+    large: ValidationPolicy = FULL
+    threshold: int = -1
+
+    def resolve(self, obj):
+        # type: (Any) -> ValidationPolicy
+        if self.threshold < 0 or self.large is self.policy:
+            return self.policy
+        try:
+            return self.large if len(obj) > self.threshold else self.policy
+        except TypeError:
+            return self.policy
+
+
+VALIDATION_SETTINGS = ValidationSettings()
+_VALIDATION_OVERRIDE = contextvars.ContextVar('validation_override', default=None)  # type: contextvars.ContextVar[Optional[ValidationSettings]]
+
+
+def set_validation_policy(policy=None, large=None, threshold=None):
+    # type: (Optional[ValidationPolicy], Optional[ValidationPolicy], Optional[int]) -> ValidationSettings
+    '''
+    Description:
+        change the package-wide default, anything left as None stays what it was.
+        >>> set_validation_policy(large=sample(100), threshold=100_000)  # big containers get spot checked
+    Returns:
+        ValidationSettings
+            what it was before, so it can be put back
+    '''
+    previous = dataclasses.replace(VALIDATION_SETTINGS)
+    if policy is not None:
+        VALIDATION_SETTINGS.policy = policy
+    if large is not None:
+        VALIDATION_SETTINGS.large = large
+    if threshold is not None:
+        VALIDATION_SETTINGS.threshold = threshold
+    return previous
+
+
+@contextlib.contextmanager
+def validation_policy(policy=None, large=None, threshold=None):
+    # type: (Optional[ValidationPolicy], Optional[ValidationPolicy], Optional[int]) -> Generator[ValidationSettings, None, None]
+    '''
+    Description:
+        change the policy for just this block (and just this thread / task)
+        >>> with validation_policy(SHALLOW):
+        ...     isof(huge, List[int])  # only checks that it is a list
+    '''
+    current = get_validation_settings()
+    settings = ValidationSettings(
+        policy=current.policy if policy is None else policy,
+        large=current.large if large is None else large,
+        threshold=current.threshold if threshold is None else threshold,
+    )
+    token = _VALIDATION_OVERRIDE.set(settings)
+    try:
+        yield settings
+    finally:
+        _VALIDATION_OVERRIDE.reset(token)
+
+
+def get_validation_settings():
+    # type: () -> ValidationSettings
+    return _VALIDATION_OVERRIDE.get() or VALIDATION_SETTINGS
+
+
+def _always(obj):
+    # type: (Any) -> bool
+    return True
+
+
+def _is_none(obj):
+    # type: (Any) -> bool
+    return obj is None
+
+
+def _leaf_types(typings):
+    # type: (tuple) -> Optional[Tuple[type, ...]]
+    '''
+    Description:
+        if every typing is a plain class (or None), those classes, so "any of these" is one isinstance
+    '''
+    leaves = []
+    for typing in typings:
+        if typing is None:
+            leaves.append(type(None))
+        elif _isinstance(typing, type) and typing is not Any:  # Any is a class as of 3.11
+            leaves.append(typing)
+        else:
+            return None
+    return tuple(leaves)
+
+
+def _sample(elements, n):
+    # type: (Iterable, int) -> list
+    '''
+    Description:
+        the first, the last, and n others, and only those n + 2 are ever touched.
+        lists and tuples are indexed so the n are random, anything else (sets, dict views, generators) can only be walked,
+        so the n are the ones right after the first, and the last comes from reversed() if it has one (dict views do).
+    '''
+    if _isinstance(elements, (list, tuple)):
+        sequence = cast(Sequence, elements)
+        if len(sequence) <= n + 2:
+            return list(sequence)
+        indexes = [0, len(sequence) - 1] + random.sample(range(1, len(sequence) - 1), n)
+        return [sequence[index] for index in indexes]
+    if _isinstance(elements, Sized) and len(cast(Sized, elements)) <= n + 2:
+        return list(elements)
+    try:
+        last = next(reversed(cast(Reversible, elements)))
+    except (TypeError, StopIteration):
+        return list(itertools.islice(elements, n + 2))
+    return list(itertools.islice(elements, n + 1)) + [last]
+
+
+def _all_of(typings, policy):
+    # type: (tuple, ValidationPolicy) -> Callable[[Iterable], bool]
+    '''
+    Description:
+        "every element is one of typings". for plain classes, rather than isinstance per element,
+        each distinct element type is checked once, which for a big homogeneous container is a single issubclass
+    '''
+    if any(typing is Any for typing in typings):
+
+        def all_any(elements):
+            # type: (Iterable) -> bool
+            return True
+
+        return all_any
+
+    leaves = _leaf_types(typings)
+    if leaves is not None:
+
+        def all_leaves(elements):
+            # type: (Iterable) -> bool
+            return all(issubclass(typ, leaves) for typ in set(map(type, elements)))
+
+        check = all_leaves
+    else:
+        validator = compile_validator(typings, policy=policy)
+
+        def all_valid(elements):
+            # type: (Iterable) -> bool
+            return all(map(validator, elements))
+
+        check = all_valid
+
+    if policy.mode != 'sample':
+        return check
+    n = policy.n
+
+    def sampled(elements):
+        # type: (Iterable) -> bool
+        return check(_sample(elements, n))
+
+    return sampled
+
+
+def _compile(typing, policy=FULL):
+    # type: (T_TYPING, ValidationPolicy) -> Validator
+    if typing is Any:
+        return _always
+    if typing is None:
+        return _is_none
+    if _isinstance(typing, type):  # includes ModuleType
+        cls = cast(type, typing)  # closures dont keep the narrowing
+
+        def instance_of(obj):
+            # type: (Any) -> bool
+            return _isinstance(obj, cls)
+
+        return instance_of
+    if _isinstance(typing, tuple):
+        members = cast(tuple, typing)
+        if len(members) == 1:
+            return compile_validator(members[0], policy=policy)
+        leaves = _leaf_types(members)
+        if leaves is not None:
+
+            def instance_of_any(obj):
+                # type: (Any) -> bool
+                return _isinstance(obj, leaves)
+
+            return instance_of_any
+        validators = [compile_validator(typ, policy=policy) for typ in members]
+
+        def any_of(obj):
+            # type: (Any) -> bool
+            return any(validator(obj) for validator in validators)
+
+        return any_of
 
     name = getattr(typing, '_name', '')
     origin = getattr(typing, '__origin__', None)
-    if not isinstance(origin, type):
-        if origin is not Union:
-            raise RuntimeError('ive never encountered an __origin__ whose type was {} - {}!'.format(type(origin), origin))
     args = getattr(typing, '__args__', None)
     if args is None:
         args = tuple()
-    if not isinstance(args, tuple):
+    if origin is Literal:
+        # Literal[True] -> '__args__': (True,)
+
+        def literal(obj):
+            # type: (Any) -> bool
+            return any(obj == arg for arg in args)
+
+        return literal
+    if not _isinstance(origin, type):
+        if origin is not Union:
+            raise RuntimeError('ive never encountered an __origin__ whose type was {} - {}!'.format(type(origin), origin))
+    if not _isinstance(args, tuple):
         raise RuntimeError('ive never encountered an __args__ whose type was {} - {}!'.format(type(args), args))
-    # params: tuple = getattr(typing, '__params__', None)
     if origin:
-        # Tuple, List, Set, Dict | Union | Callable | Generator | Literal
+        # Tuple, List, Set, Dict | Union | Callable | Generator
         if name in ['List', 'Tuple', 'Dict', 'Set']:
             # applies to list, dict, tuple, set
-            if not _isinstance(obj, origin):
-                return False
-            if len(args) == 0:
-                return True  # we can't validate further
+            if len(args) == 0 or (policy.mode == 'shallow' and name != 'Tuple'):
+
+                def container(obj):
+                    # type: (Any) -> bool
+                    return _isinstance(obj, origin)  # we can't (or shouldnt) validate further
+
+                return container
 
             if name == 'Dict':
                 # Dict[str, List[Union[int, float]]] -> '__args__': (<class 'str'>, typing.List[typing.Union[int, float]])
-                return all(isof_one(k, args[0]) and isof_one(v, args[1]) for k, v in obj.items())
+                keys_valid, values_valid = _all_of((args[0], ), policy), _all_of((args[1], ), policy)
+                if policy.mode == 'sample':
+                    n = policy.n
+
+                    def dict_sampled(obj):
+                        # type: (Any) -> bool
+                        if not _isinstance(obj, origin):
+                            return False
+                        items = _sample(obj.items(), n)
+                        return keys_valid([k for k, _ in items]) and values_valid([v for _, v in items])
+
+                    return dict_sampled
+
+                def dict_of(obj):
+                    # type: (Any) -> bool
+                    return _isinstance(obj, origin) and keys_valid(obj.keys()) and values_valid(obj.values())
+
+                return dict_of
             elif name == 'Tuple':
-                if len(obj) != len(args):
-                    return False
                 # Tuple[list, dict, set] -> '__args__': (<class 'list'>, <class 'dict'>, <class 'set'>),
-                return all(isof_one(obj[a], arg) for a, arg in enumerate(args))
+                # a tuple's length is part of its type so even shallow checks it, its elements are each their own typing
+                validators = [_always if policy.mode == 'shallow' else compile_validator(arg, policy=policy) for arg in args]
+
+                def tuple_of(obj):
+                    # type: (Any) -> bool
+                    if not _isinstance(obj, origin) or len(obj) != len(validators):
+                        return False
+                    return all(validator(ele) for validator, ele in zip(validators, obj))
 
-            return all(isof_one(ele, args) for ele in obj)
+                return tuple_of
+
+            elements_valid = _all_of(args, policy)
+
+            def collection_of(obj):
+                # type: (Any) -> bool
+                return _isinstance(obj, origin) and elements_valid(obj)
+
+            return collection_of
         elif origin is Union:
             # Union[int, float] -> '__args__': (<class 'int'>, <class 'float'>)
-            return isof_one(obj, args)
+            return compile_validator(args, policy=policy)
         elif name == 'Callable':
             # Callable[[int, typing.List[float]], typing.Tuple[int, float]] -> '__args__': (<class 'int'>, typing.List[float], typing.Tuple[int, float])
             # TODO: i can definitely do some argspec investigation to be sure, but hey.
-            return callable(obj)
+            return callable
         elif name == 'Generator':
             # Generator[typing.Tuple[int, typing.List[float]], NoneType, NoneType] ->  '__args__': (typing.Tuple[int, typing.List[float]], <class 'NoneType'>, <class 'NoneType'>)
             # TODO: i can definitely do some argspec investigation to be sure, but hey.
-            if callable(obj):
-                raise RuntimeError('you actually cant typecheck a FUNCTION to see if it is a generator, you have to call it first and GET a generator...')
-            return inspect.isgenerator(obj)
-        elif origin is Literal:
-            # Literal[True] -> '__args__': (True,)
-            return obj == args[0]
-
-    # ultimate fallback
+
+            def generator(obj):
+                # type: (Any) -> bool
+                if callable(obj):
+                    raise RuntimeError('you actually cant typecheck a FUNCTION to see if it is a generator, you have to call it first and GET a generator...')
+                return inspect.isgenerator(obj)
+
+            return generator
+
+    # ultimate fallback, whatever it is isinstance gets the last word
+    unknown = cast(Any, typing)
+
+    def fallback(obj):
+        # type: (Any) -> bool
+        try:
+            return _isinstance(obj, unknown)
+        except TypeError:
+            pass
+        raise NotImplementedError('im so sorry, I havent yet figured out how to handle {}'.format(typing))
+
+    return fallback
+
+
+_compile_cached = functools.lru_cache(maxsize=COMPILE_VALIDATOR_CACHE_SIZE)(_compile)
+
+
+def compile_validator(typing, policy=FULL):
+    # type: (T_TYPING, ValidationPolicy) -> Validator
+    '''
+    Description:
+        turn a typing into a closure that checks it, so the _name / __origin__ / __args__ dispatch happens once
+        rather than for every element of every container every time. cached by typing and policy, isof and friends go through here.
+        >>> is_records = compile_validator(List[Dict[str, Union[int, float]]])
+        >>> is_records([{'a': 1}, {'b': 2.0}])
+        ... True
+    '''
+    key = typing  # type: Any
+    if _isinstance(typing, (list, set, frozenset, dict)):
+        key = tuple(cast(Iterable, typing))
     try:
-        return _isinstance(obj, typing)
+        return _compile_cached(key, policy)
     except TypeError:
-        pass
+        if getattr(key, '__hash__', None) is None:
+            return _compile(key, policy)  # unhashable, just cant be cached
+        raise
 
-    raise NotImplementedError('im so sorry, I havent yet figured out how to handle {}'.format(typing))
 
+def isof_typing(obj, typing, policy=None):
+    # type: (Any, Union[_UnionGenericAlias, _GenericAlias], Optional[ValidationPolicy]) -> bool
+    return compile_validator(typing, policy=policy or get_validation_settings().resolve(obj))(obj)
 
-def isof_iterable(obj, itr):
-    # type: (Any, Iterable[Union[type ,_UnionGenericAlias, _GenericAlias]]) -> bool
-    return any(isof_one(obj, typ) for typ in itr)
 
+def isof_iterable(obj, itr, policy=None):
+    # type: (Any, Iterable[Union[type ,_UnionGenericAlias, _GenericAlias]], Optional[ValidationPolicy]) -> bool
+    policy = policy or get_validation_settings().resolve(obj)
+    return any(compile_validator(typ, policy=policy)(obj) for typ in itr)
 
-def isof_one(obj, typing):
-    # type: (Any, T_TYPING) -> bool
-    if typing is Any:
-        return True
-    if typing is None:
-        if obj is None:
-            return True
-        return False
-    if _isinstance(typing, type):
-        return _isinstance(obj, typing)  # type: ignore
-    if typing is ModuleType:
-        return _isinstance(obj, typing)  # type: ignore
 
-    return isof_typing(obj, typing)
+def isof_one(obj, typing, policy=None):
+    # type: (Any, T_TYPING, Optional[ValidationPolicy]) -> bool
+    return compile_validator(typing, policy=policy or get_validation_settings().resolve(obj))(obj)
 
 
-def isof(obj, *typings):
-    # type: (Any, T_TYPING) -> bool
+def isof(obj, *typings, policy=None):
+    # type: (Any, T_TYPING, Optional[ValidationPolicy]) -> bool
     '''
     Description:
         wouldnt it be nice to do something like this?
             isinstance(lst, List[Union[int, float]])
         now you can!
+        how thoroughly containers are checked is up to policy, else validation_policy / set_validation_policy, else FULL
+            isof(huge, List[int], policy=sample(100))
 
     NOTE:
         there are a few cases to handle (not to mention the halting problem with respect to generators...):
@@ -141,20 +451,187 @@ def isof(obj, *typings):
         - prior research had me look at https://stackoverflow.com/questions/37973820
             but I just blew right past it and I'm happy with what I've got
     '''
+    policy = policy or get_validation_settings().resolve(obj)
     if len(typings) == 1:
-        return isof_one(obj, *typings)
-    return any(isof_one(obj, typing) for typing in typings)
+        return compile_validator(typings[0], policy=policy)(obj)
+    return compile_validator(typings, policy=policy)(obj)
+
+
+VALIDATION_LEVELS = ['off', 'fast', 'debug']
+VALIDATION_LEVEL_ENV = 'CHRISCARL_VALIDATION'
+VALIDATION_LEVEL_DEFAULT = 'fast'
+
+
+@dataclass
+class ValidationCounter(object):
+    calls: int = 0
+    failures: int = 0
+    seconds: float = 0.0
+
+
+_VALIDATION_LEVEL_OVERRIDES = {}  # type: Dict[str, str]
+_VALIDATION_LEVEL_CACHE = {}  # type: Dict[str, str]
+_VALIDATION_COUNTERS = {}  # type: Dict[Tuple[str, int], ValidationCounter]
+_VALIDATION_LOCK = threading.Lock()
+
+
+def _check_validation_level(level):
+    # type: (str) -> str
+    if level not in VALIDATION_LEVELS:
+        raise ValueError('validation level must be one of {}, got {!r}'.format(VALIDATION_LEVELS, level))
+    return level
+
+
+def set_validation_level(level, module=None):
+    # type: (Optional[str], Optional[str]) -> Optional[str]
+    '''
+    Description:
+        how hard isinstance_raise works, for the whole package or for a module (and its submodules).
+            off     dont check at all
+            fast    check, only look around for the variable name if the check fails
+            debug   check and dig the variable name out of the stack every time, log every check
+        the starting point can be set with the environment variable, a level and/or module=level pairs
+            CHRISCARL_VALIDATION=fast,chriscarl.core.lib.stdlib.ast=debug
+        level=None on a module removes its override.
+    Returns:
+        Optional[str]
+            what it was before, so it can be put back
+    '''
+    global VALIDATION_LEVEL_DEFAULT
+    with _VALIDATION_LOCK:
+        if module is None:
+            previous = VALIDATION_LEVEL_DEFAULT  # type: Optional[str]
+            VALIDATION_LEVEL_DEFAULT = _check_validation_level(level or 'fast')
+        else:
+            previous = _VALIDATION_LEVEL_OVERRIDES.get(module)
+            if level is None:
+                _VALIDATION_LEVEL_OVERRIDES.pop(module, None)
+            else:
+                _VALIDATION_LEVEL_OVERRIDES[module] = _check_validation_level(level)
+        _VALIDATION_LEVEL_CACHE.clear()
+    return previous
+
+
+def get_validation_level(module=''):
+    # type: (str) -> str
+    '''
+    Description:
+        the level for a module, from the most specific override, else the package default
+    '''
+    level = _VALIDATION_LEVEL_CACHE.get(module)
+    if level is None:
+        level = VALIDATION_LEVEL_DEFAULT
+        parts = module.split('.')
+        for i in range(len(parts), 0, -1):
+            prefix = '.'.join(parts[:i])
+            if prefix in _VALIDATION_LEVEL_OVERRIDES:
+                level = _VALIDATION_LEVEL_OVERRIDES[prefix]
+                break
+        _VALIDATION_LEVEL_CACHE[module] = level
+    return level
+
+
+def parse_validation_level(text):
+    # type: (str) -> Tuple[Optional[str], Dict[str, str]]
+    '''
+    Description:
+        'fast,chriscarl.core.lib.stdlib.ast=debug' -> ('fast', {'chriscarl.core.lib.stdlib.ast': 'debug'})
+    '''
+    level = None
+    overrides = {}
+    for token in text.split(','):
+        token = token.strip()
+        if not token:
+            continue
+        if '=' in token:
+            module, _, module_level = token.partition('=')
+            overrides[module.strip()] = _check_validation_level(module_level.strip().lower())
+        else:
+            level = _check_validation_level(token.lower())
+    return level, overrides
+
+
+def get_validation_counters():
+    # type: () -> Dict[Tuple[str, int], ValidationCounter]
+    '''
+    Description:
+        isinstance_raise calls, failures, and time spent per call site, keyed by (module, lineno)
+    '''
+    with _VALIDATION_LOCK:
+        return {site: dataclasses.replace(counter) for site, counter in _VALIDATION_COUNTERS.items()}
+
+
+def reset_validation_counters():
+    # type: () -> None
+    with _VALIDATION_LOCK:
+        _VALIDATION_COUNTERS.clear()
+
+
+def validation_hotspots(n=10):
+    # type: (int) -> List[Tuple[Tuple[str, int], ValidationCounter]]
+    '''
+    Description:
+        the n call sites that have spent the most time in isinstance_raise, n=-1 for all of them
+    '''
+    hotspots = sorted(get_validation_counters().items(), key=lambda tpl: tpl[1].seconds, reverse=True)
+    return hotspots if n == -1 else hotspots[:n]
+
+
+def _variable_name(obj, frame):
+    # type: (Any, Any) -> str
+    for k, v in frame.f_locals.items():
+        if v is obj:
+            return k
+    return '<anonymous>'
 
 
 def isinstance_raise(obj, *typings, msg=''):
     # type: (Any, T_TYPING, str) -> bool
+    '''
+    Description:
+        isof, but raise a TypeError naming the variable if it isnt. how much work that is depends on the validation level of the caller's module,
+        see set_validation_level. every check is counted by call site, see validation_hotspots.
+    '''
     # TODO: as_list(1, List[str]) needs to have nicer output message saying elements within the datastruct are no good, rather than the whole:
     #       TypeError: provided <class 'list'> for 'obj_or_list', requires: typing.List[str]
-    from chriscarl.core.lib.stdlib.inspect import get_variable_name_lineno
-    var_name = get_variable_name_lineno(obj)[0]
+    frame = sys._getframe(1)
+    module = frame.f_globals.get('__name__', '')
+    level = get_validation_level(module)
+    if level == 'off':
+        return True
 
+    start = time.perf_counter()
+    var_name = ''
+    if level == 'debug':
+        from chriscarl.core.lib.stdlib.inspect import get_variable_name_lineno
+        var_name = get_variable_name_lineno(obj)[0]
     res = isof(obj, *typings)
+    elapsed = time.perf_counter() - start
+
+    site = (module, frame.f_lineno)
+    with _VALIDATION_LOCK:
+        counter = _VALIDATION_COUNTERS.get(site)
+        if counter is None:
+            counter = _VALIDATION_COUNTERS[site] = ValidationCounter()
+        counter.calls += 1
+        counter.seconds += elapsed
+        if not res:
+            counter.failures += 1
+    if level == 'debug':
+        LOGGER.debug('%s:%d isinstance_raise(%s, %s) -> %s in %0.6fs', module, frame.f_lineno, var_name, typings, res, elapsed)
+
     if not res:
+        var_name = var_name or _variable_name(obj, frame)
         msg = msg or 'provided {} for {!r}, requires: {}'.format(type(obj), var_name, typings if len(typings) > 1 else typings[0])
         raise TypeError(msg)
     return res
+
+
+try:
+    _level, _overrides = parse_validation_level(os.environ.get(VALIDATION_LEVEL_ENV, ''))
+    if _level is not None:
+        set_validation_level(_level)
+    for _module, _module_level in _overrides.items():
+        set_validation_level(_module_level, module=_module)
+except ValueError as ve:
+    LOGGER.warning('ignoring %s=%r, %s', VALIDATION_LEVEL_ENV, os.environ.get(VALIDATION_LEVEL_ENV), ve)
@@ -10,6 +10,7 @@ core.lib.stdlib.unittest includes stuff I want all unit tests to have access to
 core.lib are modules that contain code that is about (but does not modify) the library. somewhat referential to core.functor and core.types.
 
 Updates:
+    2026-10-18 - core.lib.stdlib.unittest - added benchmark, timing tests only run when CHRISCARL_BENCHMARK is set
     2025-01-01 - core.lib.stdlib.unittest - FIX: stuff that yields generators now will have to answer for their exception crimes
     2024-12-09 - core.lib.stdlib.unittest - UnitTest now configures with my logging by default, so much nicer.
     2024-11-26 - core.lib.stdlib.unittest - added UnitTest as a class
@@ -47,6 +48,18 @@ THIS_MODULE = sys.modules[__name__]
 LOGGER = logging.getLogger(__name__)
 LOGGER.addHandler(logging.NullHandler())
 
+BENCHMARK_ENV = 'CHRISCARL_BENCHMARK'
+
+
+def benchmark(func):
+    # type: (Callable) -> Callable
+    '''
+    Description:
+        timing tests only log numbers and take seconds, so they are skipped unless CHRISCARL_BENCHMARK is set
+        >>> CHRISCARL_BENCHMARK=1 python -m pytest tests
+    '''
+    return unittest.skipUnless(os.environ.get(BENCHMARK_ENV), 'set {} to run benchmarks'.format(BENCHMARK_ENV))(func)
+
 
 class UnitTest(unittest.TestCase):
     tempdir = None
@@ -10,6 +10,23 @@ core.types.iterable is actually a lot of list and dict stuff combined, but since
 core.types are modules that pertain to data structures, algorithms, conversions. non-self-referential, low-import, etc.
 
 Updates:
+    2026-10-18 - core.types.iterable - FIX: flatten_iterable carries the joined prefix per stack frame and joins once per edge, iter_flatten skips the root concatenation without prepend
+    2026-10-18 - core.types.iterable - FIX: keys carries the joined prefix per stack frame instead of a path tuple and a join per key
+    2026-10-18 - core.types.iterable - FIX: diff_iterable skips == subtrees at C speed, a fingerprinter's digests carry across diffs until forget() or patch_iterable(fingerprinter=)
+    2026-10-18 - core.types.iterable - FIX: Fingerprinter says when cached digests stay valid, added cached and forget
+    2026-10-18 - core.types.iterable - FIX: diff_iterable defaults to path tuples and doesnt trust digests from earlier calls, patch_iterable resolves dotted keys against the object
+    2026-10-18 - core.types.iterable - FIX: Fingerprinter raises ValueError on self-referential containers instead of never returning
+    2026-10-18 - core.types.iterable - FIX: flatten_records(dtype=...) only makes numpy arrays out of int / float columns
+    2026-10-18 - core.types.iterable - contains uses hashed membership and only inspects the caller on failure, added contains_many
+    2026-10-18 - core.types.iterable - added Schema, infer_schema, merge_schemas
+    2026-10-18 - core.types.iterable - added query, compile_query, CompiledQuery, QueryIndex for wildcard/regex/slice lookups
+    2026-10-18 - core.types.iterable - added walk, keys and iter_flatten are built on it rather than nested generators
+    2026-10-18 - core.types.iterable - added diff_iterable and patch_iterable
+    2026-10-18 - core.types.iterable - added Fingerprinter and fingerprint
+    2026-10-18 - core.types.iterable - added flatten_records and unflatten_records for column stores
+    2026-10-18 - core.types.iterable - unflatten_iterable builds through a trie in linear time, added unflatten_stream
+    2026-10-18 - core.types.iterable - added iter_flatten and join_path, flatten_iterable no longer recurses
+    2026-10-18 - core.types.iterable - added compile_key, CompiledKey, get_many, get_column, get only inspects the caller on failure
     2025-01-14 - core.types.iterable - moved contains here and improved it
     2024-12-28 - core.types.iterable - FIX: keys doesnt throw TypeError for any reason anymore
     2024-12-11 - core.types.iterable - added keys
@@ -21,7 +38,13 @@ from __future__ import absolute_import, print_function, division, with_statement
 import os
 import sys
 import logging
-from typing import Optional, Union, Any, Iterable, List, Dict, Generator, Tuple, Callable
+import array
+import re
+import hashlib
+import functools
+import itertools
+from dataclasses import dataclass, field
+from typing import Optional, Union, Any, Iterable, List, Dict, Set, Generator, Tuple, Callable
 from collections import OrderedDict
 
 # third party imports
@@ -31,7 +54,6 @@ from chriscarl.core.constants import SENTINEL
 from chriscarl.core.lib.stdlib.inspect import get_variable_name_lineno
 from chriscarl.core.lib.stdlib.inspect import get_caller_file_lineno
 from chriscarl.core.lib.stdlib.typing import isinstance_raise
-from chriscarl.core.types.list import as_list
 
 SCRIPT_RELPATH = 'chriscarl/core/types/iterable.py'
 if not hasattr(sys, '_MEIPASS'):
@@ -45,38 +67,157 @@ LOGGER = logging.getLogger(__name__)
 LOGGER.addHandler(logging.NullHandler())
 
 Keyable = Union[Dict, List, Tuple]
+CONTAINER_TYPES = (list, dict, tuple, set)
+Token = Union[str, int]
+COMPILE_KEY_CACHE_SIZE = 4096
+DIFF_ADD, DIFF_REMOVE, DIFF_REPLACE = 'add', 'remove', 'replace'
+QUERY_KEY, QUERY_ANY, QUERY_DEEP, QUERY_SLICE, QUERY_REGEX = 'key', 'any', 'deep', 'slice', 'regex'
 
 
-def get(key, iterable, split='.', default=SENTINEL):
-    # type: (str, Keyable, str, Any) -> Any
-    iterable_name = get_variable_name_lineno(iterable)[0]
-    current_value = iterable
-    key_so_far = []
+def _type_token(token):
+    # type: (str) -> Token
     try:
-        if not isinstance(key, str):
-            return iterable[key]
+        return int(token, base=0)
+    except ValueError:
+        return token
 
-        for key in key.split(split):
-            key_so_far.append(key)
-            try:
-                int_key = int(key, base=0)
-                current_value = current_value[int_key]  # type: ignore
+
+@dataclass(frozen=True)
+class CompiledKey(object):
+    '''
+    Description:
+        a dotted key that has already been split and had its tokens typed, so repeated lookups dont re-parse anything
+        >>> ck = compile_key('a.b.0.c')
+        >>> ck.tokens
+        ... ('a', 'b', 0, 'c')
+        >>> ck.get({'a': {'b': [{'c': 1}]}})
+        ... 1
+    '''
+    key: str
+    split: str
+    tokens: Tuple[Token, ...]
+
+    def get(self, iterable, default=SENTINEL):
+        # type: (Keyable, Any) -> Any
+        current_value = iterable
+        t = 0
+        try:
+            for t, token in enumerate(self.tokens):
                 if isinstance(current_value, set):
                     current_value = list(current_value)  # to allow for indexing...
-                continue
-            except ValueError:
-                pass
+                current_value = current_value[token]  # type: ignore
+        except (IndexError, KeyError, TypeError) as ike:
+            if default != SENTINEL:
+                return default
+            # introspection is expensive, only pay for it when we're about to raise
+            iterable_name = get_variable_name_lineno(iterable)[0]
+            key_so_far = self.split.join(str(token) for token in self.tokens[:t + 1])
+            raise KeyError('key "{}" for provided object "{}" does not exist because of {!r}!'.format(key_so_far, iterable_name, ike)) from ike
+        return current_value
+
 
-            current_value = current_value[key]  # type: ignore
+@functools.lru_cache(maxsize=COMPILE_KEY_CACHE_SIZE)
+def compile_key(key, split='.'):
+    # type: (str, str) -> CompiledKey
+    '''
+    Description:
+        split and type a dotted key once, the result is cached so the same key string always costs a dict probe
+        >>> compile_key('servers.0.port')
+        ... CompiledKey(key='servers.0.port', split='.', tokens=('servers', 0, 'port'))
+    '''
+    return CompiledKey(key=key, split=split, tokens=tuple(_type_token(token) for token in key.split(split)))
+
+
+def get(key, iterable, split='.', default=SENTINEL):
+    # type: (Union[str, CompiledKey, Any], Keyable, str, Any) -> Any
+    if isinstance(key, CompiledKey):
+        return key.get(iterable, default=default)
+    if isinstance(key, str):
+        return compile_key(key, split=split).get(iterable, default=default)
+
+    try:
+        return iterable[key]  # type: ignore
     except (IndexError, KeyError, TypeError) as ike:
         if default != SENTINEL:
             return default
-        raise KeyError('key "{}" for provided object "{}" does not exist because of {!r}!'.format(split.join(key_so_far), iterable_name, ike)) from ike
-    return current_value
+        iterable_name = get_variable_name_lineno(iterable)[0]
+        raise KeyError('key "{}" for provided object "{}" does not exist because of {!r}!'.format(key, iterable_name, ike)) from ike
+
+
+def get_many(paths, iterable, split='.', default=SENTINEL):
+    # type: (Iterable[Union[str, CompiledKey]], Keyable, str, Any) -> List[Any]
+    '''
+    Description:
+        pull several keys out of the same object
+        >>> get_many(['a', 'b.0'], {'a': 0, 'b': [1, 2]})
+        ... [0, 1]
+    '''
+    compiled = [path if isinstance(path, CompiledKey) else compile_key(path, split=split) for path in paths]
+    return [ck.get(iterable, default=default) for ck in compiled]
+
+
+def get_column(path, records, split='.', default=SENTINEL):
+    # type: (Union[str, CompiledKey], Iterable[Keyable], str, Any) -> List[Any]
+    '''
+    Description:
+        pull the same key out of many objects
+        >>> get_column('a.b', [{'a': {'b': 0}}, {'a': {'b': 1}}])
+        ... [0, 1]
+    '''
+    ck = path if isinstance(path, CompiledKey) else compile_key(path, split=split)
+    return [ck.get(record, default=default) for record in records]
 
 
 def isleaf(value):
-    return not isinstance(value, (list, dict, tuple, set))
+    # type: (Any) -> bool
+    return not isinstance(value, CONTAINER_TYPES)
+
+
+def _iter_children(value):
+    # type: (Union[dict, list, tuple, set]) -> Iterable[Tuple[Any, Any]]
+    if isinstance(value, dict):
+        return iter(value.items())
+    return enumerate(value)
+
+
+def walk(value, prune=None, max_depth=-1):
+    # type: (Any, Optional[Callable[[Tuple[Any, ...], Any], bool]], int) -> Generator[Tuple[Tuple[Any, ...], Any, Any], None, None]
+    '''
+    Description:
+        depth first, parents before children, every node under value (but not value itself)
+        given a dictionary like this: {'a': 0, 'b': [1]}
+        yield a generator of: [(('a',), 0, {...}), (('b',), [1], {...}), (('b', 0), 1, [1])]
+
+        uses an explicit stack, so the cost per node doesnt grow with depth and depth isnt bound by the recursion limit.
+
+    Arguments:
+        value: Any
+            if its a leaf, nothing is yielded
+        prune: Optional[Callable[[Tuple[Any, ...], Any], bool]]
+            called as prune(path, value) on every container after its yielded, return True to skip everything beneath it
+            >>> walk({'a': {'b': 0}, 'c': 1}, prune=lambda path, value: path == ('a',))
+            >>> yields [(('a',), {'b': 0}, {...}), (('c',), 1, {...})]
+        max_depth: int
+            -1 means no limit, 1 means only the immediate children, etc.
+
+    Returns:
+        Generator[Tuple[Tuple[Any, ...], Any, Any], None, None]
+            (path, value, parent)
+    '''
+    if isleaf(value) or max_depth == 0:
+        return
+    stack = [(tuple(), value, _iter_children(value))]  # type: List[Tuple[Tuple[Any, ...], Any, Iterable[Tuple[Any, Any]]]]
+    while stack:
+        path, parent, children = stack[-1]
+        for k, v in children:
+            child_path = path + (k, )
+            yield child_path, v, parent
+            if isleaf(v) or len(child_path) == max_depth or (prune is not None and prune(child_path, v)):
+                continue
+            stack.append((child_path, v, _iter_children(v)))
+            break  # descend, this level's iterator picks up where it left off later
+        else:
+            stack.pop()
 
 
 def keys(value, prepend=None):
@@ -84,7 +225,7 @@ def keys(value, prepend=None):
     '''
     Description:
         given a dictionary like this: {'a': 0, 'b': [1, 2]}
-        yield a generator of: ['a', 'b.0', 'b.1']
+        yield a generator of: ['a', 'b', 'b.0', 'b.1']
 
     Arguments:
         value: Keyable
@@ -96,28 +237,79 @@ def keys(value, prepend=None):
     Returns:
         Generator[str, None, None]
     '''
-    if isinstance(value, dict):
-        for k, v in value.items():
-            if prepend is None:
-                key = str(k)
-            else:
-                key = '{}.{}'.format(prepend, k)
+    if isleaf(value):
+        return
+    # same walk as walk(), but each frame carries its already joined 'a.b.' prefix, so a key costs one concatenation
+    # rather than a path tuple copy and a join, both of which grow with depth
+    stack = [(None if prepend is None else '{}.'.format(prepend), _iter_children(value))]  # type: List[Tuple[Optional[str], Iterable[Tuple[Any, Any]]]]
+    while stack:
+        prefix, children = stack[-1]
+        for k, v in children:
+            key = str(k) if prefix is None else prefix + str(k)
             yield key
-            for key in keys(v, prepend=key):
-                yield key
-    elif isinstance(value, (list, tuple, set)):
-        for i, v in enumerate(value):
-            if prepend is None:
-                key = str(i)
-            else:
-                key = '{}.{}'.format(prepend, i)
-            yield key
-            for key in keys(v, prepend=key):
-                yield key
+            if not isleaf(v) and v:
+                stack.append((key + '.', _iter_children(v)))
+                break
+        else:
+            stack.pop()
+
+
+def join_path(path, split='.'):
+    # type: (Tuple[Any, ...], str) -> str
+    '''
+    Description:
+        turn a path tuple from iter_flatten into a dotted key
+        >>> join_path(('a', 1, 'b'))
+        ... 'a.1.b'
+    '''
+    return split.join(str(token) for token in path)
+
 
+def iter_flatten(value, prepend=None):
+    # type: (Any, Optional[Any]) -> Generator[Tuple[Tuple[Any, ...], Any], None, None]
+    '''
+    Description:
+        given a dictionary like this: {'a': 0, 'b': [1, 2]}
+        yield a generator of: [(('a',), 0), (('b', 0), 1), (('b', 1), 2)]
+        empty containers are treated as leaves, so {'d': []} yields (('d',), [])
 
-def flatten_iterable(value, prepend=None, _flattened=None):
-    # type: (Union[Iterable, Any], Optional[str], Optional[dict]) -> dict
+        uses an explicit stack rather than recursion, so depth is bounded by memory and not the recursion limit.
+        nothing is joined into a string, use join_path if you need the dotted key.
+
+    Arguments:
+        value: Any
+        prepend: Optional[Any]
+            if you want the paths to start with something
+            >>> iter_flatten({'a': 0}, prepend='whatever')
+            >>> yields [(('whatever', 'a'), 0)]
+
+    Returns:
+        Generator[Tuple[Tuple[Any, ...], Any], None, None]
+    '''
+    root = tuple() if prepend is None else (prepend, )  # type: Tuple[Any, ...]
+    if isleaf(value):
+        yield root, value
+        return
+    if len(value) == 0:
+        yield root, type(value)()
+        return
+
+    if not root:
+        for path, v, _ in walk(value):
+            if isleaf(v):
+                yield path, v
+            elif len(v) == 0:
+                yield path, type(v)()
+        return
+    for path, v, _ in walk(value):
+        if isleaf(v):
+            yield root + path, v
+        elif len(v) == 0:
+            yield root + path, type(v)()
+
+
+def flatten_iterable(value, prepend=None):
+    # type: (Union[Iterable, Any], Optional[str]) -> dict
     '''
     Description:
         given a dictionary like this: {'a': 0, 'b': [1, 2]}
@@ -130,40 +322,77 @@ def flatten_iterable(value, prepend=None, _flattened=None):
             if you want the keys to start with something
             >>> flatten_iterable({'a': 0, 'b.0': 1, 'b.1': 2}, prepend='whatever')
             >>> {'whatever.a': 0, 'whatever.b.0': 1, 'whatever.b.1': 2}
-        _flattened: Optional[dict]
-            do not provide this, its to facilitate the recursion
 
     Returns:
         dict
     '''
-    if _flattened is None:
-        if not isinstance(value, Iterable):
-            return value
-        _flattened = OrderedDict()
-
-    if isinstance(value, dict):
-        if len(value) == 0:
-            _flattened[prepend] = type(value)()
+    if not isinstance(value, Iterable):
+        return value
 
-        for k, v in value.items():
-            if prepend is None:
-                key = k
+    flattened = OrderedDict()  # type: Dict[Any, Any]
+    if isleaf(value):
+        flattened[prepend] = value
+        return flattened
+    container = value  # type: Any
+    if len(container) == 0:
+        flattened[prepend] = type(container)()
+        return flattened
+    raw_top_keys = isinstance(container, dict) and prepend is None  # top level dict keys keep their original type
+    # iter_flatten without the path tuples, each frame carries its already joined 'a.b.' prefix so a key is one concatenation
+    stack = [(None if prepend is None else '{}.'.format(prepend), _iter_children(container))]  # type: List[Tuple[Optional[str], Iterable[Tuple[Any, Any]]]]
+    while stack:
+        prefix, children = stack[-1]
+        for k, v in children:
+            if prefix is None:
+                key = k if raw_top_keys else str(k)
             else:
-                key = '{}.{}'.format(prepend, k)
-            flatten_iterable(v, prepend=key, _flattened=_flattened)
-    elif isinstance(value, (list, tuple, set)):
-        if len(value) == 0:
-            _flattened[prepend] = type(value)()  # type: ignore
-
-        for i, v in enumerate(value):
-            if prepend is None:
-                key = str(i)
+                key = prefix + str(k)
+            if isleaf(v):
+                flattened[key] = v
+            elif not v:
+                flattened[key] = type(v)()
             else:
-                key = '{}.{}'.format(prepend, i)
-            flatten_iterable(v, prepend=key, _flattened=_flattened)
-    else:
-        _flattened[prepend] = value
-    return _flattened
+                stack.append(('{}.'.format(key), _iter_children(v)))
+                break
+        else:
+            stack.pop()
+    return flattened
+
+
+def _tokenize(key, split='.'):
+    # type: (Any, str) -> List[Token]
+    if not isinstance(key, str):
+        return [key]
+    return [_type_token(token) for token in key.split(split)]
+
+
+def _unflatten_into(iterable, pairs, split='.'):
+    # type: (Union[dict, list], Iterable[Tuple[Any, Any]], str) -> Union[dict, list]
+    '''
+    Description:
+        each container that gets created is remembered in a trie keyed by token, so a key of d tokens costs O(d) no matter how many keys came before it
+    '''
+    trie = {}  # type: Dict[Any, Tuple[Union[dict, list], dict]]
+    for key, value in pairs:
+        tokens = _tokenize(key, split=split)
+        obj, children = iterable, trie
+        for t in range(len(tokens) - 1):
+            token = tokens[t]
+            node = children.get(token)
+            if node is None:
+                new = {} if isinstance(tokens[t + 1], str) else []  # type: Union[dict, list]
+                if isinstance(obj, dict):
+                    obj[token] = new
+                else:
+                    obj.append(new)
+                node = children[token] = (new, {})
+            obj, children = node
+
+        if isinstance(obj, dict):
+            obj[tokens[-1]] = value
+        else:
+            obj.append(value)
+    return iterable
 
 
 def unflatten_iterable(flat, split='.'):
@@ -181,60 +410,849 @@ def unflatten_iterable(flat, split='.'):
     Returns:
         Union[dict, list]
     '''
-    flat_keys = {}  # type: Dict[str, List[Union[str, int]]]
     if not isinstance(flat, dict):
         return flat
-    shortest = 9999999
-    for key in flat:
-        short = len(key.split(split))
-        if short < shortest:
-            shortest = short
-    for key in flat:
-        # TODO: to account for pre-prepended flattened_iterables splicing by [0 if shortest == 1 else 1:] doesnt work...
-        tokens = key.split(split)
-        new_tokens = []  # type: List[Union[str, int]]
-        for token in tokens:
-            try:
-                new_tokens.append(int(token, base=0))
-            except ValueError:
-                new_tokens.append(token)
-        flat_keys[key] = new_tokens
-
     iterable: Union[dict, list]
-    obj: Union[dict, list]
-    new: Union[dict, list]
-    if all(isinstance(tokens[0], int) for tokens in flat_keys.values()):
-        iterable = obj = []
+    if all(isinstance(_type_token(key.split(split, 1)[0]) if isinstance(key, str) else key, int) for key in flat):
+        iterable = []
     else:
-        iterable = obj = {}
+        iterable = {}
+    return _unflatten_into(iterable, flat.items(), split=split)
 
-    objs_so_far = {'': iterable}  # type: Dict[str, Union[dict, list]]
 
-    for flat_key, tokens in flat_keys.items():
-        obj = iterable
-        for t, token in enumerate(tokens):
-            if t < len(tokens) - 1:
-                flat_so_far = split.join(str(ele) for ele in tokens[:t + 1])
-                path_minus_the_end = split.join(str(ele) for ele in tokens[:t])
-                obj = objs_so_far[path_minus_the_end]
-                if isinstance(obj, dict):
-                    if flat_so_far not in objs_so_far:
-                        new = {} if isinstance(tokens[t + 1], str) else []
-                        obj[token] = objs_so_far[flat_so_far] = new
+def unflatten_stream(pairs, split='.'):
+    # type: (Iterable[Tuple[Any, Any]], str) -> Union[dict, list]
+    '''
+    Description:
+        unflatten_iterable, but for (key, value) pairs that come from somewhere lazy like a jsonl or csv reader, so the flat map is never held in memory
+        >>> unflatten_stream(iter([('a', 0), ('b.0', 1), ('b.1', 2)]))
+        ... {'a': 0, 'b': [1, 2]}
+
+    NOTE:
+        since the pairs can only be read once, whether the top level is a list or a dict is decided by the first key
+
+    Arguments:
+        pairs: Iterable[Tuple[Any, Any]]
+        split: str
+
+    Returns:
+        Union[dict, list]
+    '''
+    pairs = iter(pairs)
+    for first in pairs:
+        iterable = [] if isinstance(_tokenize(first[0], split=split)[0], int) else {}  # type: Union[dict, list]
+        return _unflatten_into(iterable, itertools.chain([first], pairs), split=split)
+    return {}
+
+
+def _as_array(column):
+    # type: (List[Any]) -> Union[List[Any], array.array]
+    '''
+    Description:
+        numeric columns become array.array, anything else (including bools and ints that dont fit in 64 bits) stays a list
+    '''
+    if all(type(ele) is int for ele in column):
+        typecode = 'q'
+    elif all(type(ele) is int or type(ele) is float for ele in column):
+        typecode = 'd'
+    else:
+        return column
+    try:
+        return array.array(typecode, column)
+    except OverflowError:
+        return column
+
+
+def _as_ndarray(column, dtype):
+    # type: (List[Any], Any) -> Any
+    '''
+    Description:
+        numeric columns become numpy arrays of dtype, anything else (including bools and numeric looking strings) stays a list
+    '''
+    try:
+        import numpy  # type: ignore[import-not-found]
+    except ImportError as ie:
+        raise ImportError('numpy package not installed but dtype={!r} was requested, please run "pip install numpy"'.format(dtype)) from ie
+    if not all(type(ele) is int or type(ele) is float for ele in column):
+        return column
+    try:
+        return numpy.asarray(column, dtype=dtype)
+    except (ValueError, TypeError):
+        return column
+
+
+def flatten_records(records, missing=SENTINEL, dtype=None, arrays=True):
+    # type: (Iterable[Any], Any, Any, bool) -> Dict[str, Any]
+    '''
+    Description:
+        flatten a batch of (usually homogeneous) nested records straight into columns
+        >>> flatten_records([{'a': 0, 'b': {'c': 'x'}}, {'a': 1}], missing=None)
+        ... {'a': array('q', [0, 1]), 'b.c': ['x', None]}
+
+    Arguments:
+        records: Iterable[Any]
+            read exactly once, so a generator is fine
+        missing: Any
+            filled in wherever a record doesnt have a path some other record has
+        dtype: Any
+            if provided, numeric columns become numpy arrays of this dtype instead of array.array
+        arrays: bool
+            set to False to get plain lists for every column
+
+    Returns:
+        Dict[str, Union[list, array.array, numpy.ndarray]]
+    '''
+    columns = OrderedDict()  # type: Dict[str, List[Any]]
+    joined = {}  # type: Dict[Tuple[Any, ...], str]
+    r = 0
+    for r, record in enumerate(records):
+        seen = 0
+        for path, leaf in iter_flatten(record):
+            key = joined.get(path)
+            if key is None:
+                key = joined[path] = join_path(path)
+            column = columns.get(key)
+            if column is None:
+                column = columns[key] = [missing] * r
+            column.append(leaf)
+            seen += 1
+        if seen != len(columns):
+            for column in columns.values():
+                if len(column) == r:
+                    column.append(missing)
+
+    if dtype is not None:
+        return OrderedDict((key, _as_ndarray(column, dtype)) for key, column in columns.items())
+    if arrays:
+        return OrderedDict((key, _as_array(column)) for key, column in columns.items())
+    return columns
+
+
+def unflatten_records(columns, missing=SENTINEL, split='.'):
+    # type: (Dict[str, Any], Any, str) -> Generator[Union[dict, list], None, None]
+    '''
+    Description:
+        (inverse of flatten_records)
+        given columns like this: {'a': [0, 1], 'b.c': ['x', None]}
+        yield rows like this: [{'a': 0, 'b': {'c': 'x'}}, {'a': 1}]
+
+    Arguments:
+        columns: Dict[str, Any]
+        missing: Any
+            cells that are this object are left out of the row entirely
+        split: str
+
+    Returns:
+        Generator[Union[dict, list], None, None]
+    '''
+    column_keys = list(columns)
+    for row in zip(*columns.values()):
+        yield unflatten_stream(((key, value) for key, value in zip(column_keys, row) if value is not missing and value != missing), split=split)
+
+
+class Fingerprinter(object):
+    '''
+    Description:
+        merkle-style hashing of nested containers, every subtree gets a blake2b digest built from its childrens digests.
+        dicts (and sets) hash the same regardless of order, lists and tuples do not.
+        >>> fp = Fingerprinter()
+        >>> fp.digest({'a': [1, 2], 'b': 3}) == fp.digest({'b': 3, 'a': [1, 2]})
+        ... True
+
+    NOTE:
+        subtree digests are cached by id() for as long as this object lives (it holds a reference so ids cant be recycled),
+        and a cached digest stays valid until that container, or anything under it, is mutated. after a mutation,
+        forget(root, path) the path that changed (patch_iterable(..., fingerprinter=) does this for you), or clear() everything.
+        leaves are hashed by type name and repr, so objects whose repr includes a memory address are only stable within a process.
+        a container that contains itself (a = []; a.append(a)) raises ValueError rather than hashing forever.
+    '''
+
+    def __init__(self, digest_size=16):
+        # type: (int) -> None
+        self.digest_size = digest_size
+        self._cache = {}  # type: Dict[int, Tuple[Any, bytes]]
+
+    def clear(self):
+        # type: () -> None
+        self._cache.clear()
+
+    def cached(self, value):
+        # type: (Any) -> Optional[bytes]
+        '''
+        Description:
+            the digest of a container that has already been fingerprinted (and not forgotten since), None rather than computing it
+        '''
+        entry = self._cache.get(id(value))
+        return entry[1] if entry is not None else None
+
+    def forget(self, value, path=tuple()):
+        # type: (Any, Tuple[Any, ...]) -> None
+        '''
+        Description:
+            drop the digests that go stale when whatever is at path under value changes, i.e. value and every container on the way down.
+            everything else stays cached, so the next digest only rehashes those len(path) containers.
+            >>> fp.forget(config, ('servers', 0, 'port'))  # about to change config['servers'][0]['port']
+        '''
+        node = value
+        self._cache.pop(id(node), None)
+        for token in path[:-1]:
+            try:
+                node = node[token]
+            except (KeyError, IndexError, TypeError):
+                return
+            self._cache.pop(id(node), None)
+
+    def leaf(self, value):
+        # type: (Any) -> bytes
+        return hashlib.blake2b('{}:{!r}'.format(type(value).__name__, value).encode('utf-8'), digest_size=self.digest_size).digest()
+
+    def _child(self, value):
+        # type: (Any) -> bytes
+        if isinstance(value, CONTAINER_TYPES):
+            return self._cache[id(value)][1]
+        return self.leaf(value)
+
+    def _combine(self, value):
+        # type: (Union[dict, list, tuple, set]) -> bytes
+        h = hashlib.blake2b(digest_size=self.digest_size)
+        if isinstance(value, dict):
+            h.update(b'dict')
+            parts = sorted(self.leaf(k) + self._child(v) for k, v in value.items())
+        elif isinstance(value, set):
+            h.update(b'set')
+            parts = sorted(self._child(v) for v in value)
+        else:
+            h.update(type(value).__name__.encode('utf-8'))
+            parts = [self._child(v) for v in value]
+        for part in parts:
+            h.update(part)
+        return h.digest()
+
+    def digest(self, value):
+        # type: (Any) -> bytes
+        if not isinstance(value, CONTAINER_TYPES):
+            return self.leaf(value)
+
+        stack = [value]
+        expanded = set()  # type: Set[int]  # ids waiting on their children, i.e. the ancestors of whatever is on top
+        while stack:
+            node = stack[-1]
+            if id(node) in self._cache:
+                stack.pop()
+                continue
+            children = node.values() if isinstance(node, dict) else node
+            pending = [child for child in children if isinstance(child, CONTAINER_TYPES) and id(child) not in self._cache]
+            if pending:
+                for child in pending:
+                    if id(child) in expanded or child is node:
+                        raise ValueError('cannot fingerprint a {} that contains itself'.format(type(child).__name__))
+                expanded.add(id(node))
+                stack.extend(pending)
+                continue
+            self._cache[id(node)] = (node, self._combine(node))
+            expanded.discard(id(node))
+            stack.pop()
+        return self._cache[id(value)][1]
+
+    def hexdigest(self, value):
+        # type: (Any) -> str
+        return self.digest(value).hex()
+
+
+def fingerprint(value, fingerprinter=None):
+    # type: (Any, Optional[Fingerprinter]) -> str
+    '''
+    Description:
+        stable structural hash of anything nested, handy as a cache key or for "did this change" checks
+        >>> fingerprint({'a': 0, 'b': [1, 2]}) == fingerprint({'b': [1, 2], 'a': 0})
+        ... True
+
+    Arguments:
+        value: Any
+        fingerprinter: Optional[Fingerprinter]
+            pass one in to reuse subtree digests across calls, see Fingerprinter for when they stay valid
+
+    Returns:
+        str
+    '''
+    fingerprinter = fingerprinter or Fingerprinter()
+    return fingerprinter.hexdigest(value)
+
+
+def diff_iterable(l, r, fingerprinter=None, split='.', join=False):
+    # type: (Any, Any, Optional[Fingerprinter], str, bool) -> List[Tuple[str, Any, Any]]
+    '''
+    Description:
+        diff l r, so if new stuff is in r, they'll be treated as added.
+        subtrees that are the same object or == are skipped without being walked, == runs at C speed so a diff of two
+        big trees that differ in a few leaves costs a few == passes over them rather than a python loop over every leaf.
+        that also means 1, 1.0, and True inside containers that are otherwise == are not a change, only a leaf-vs-leaf compare checks types.
+        with a fingerprinter, subtrees it already has digests for are compared in O(1) instead, see fingerprinter below.
+        >>> diff_iterable({'a': 0, 'b': [1, 2]}, {'a': 1, 'b': [1], 'c': 2})
+        ... [('add', ('c',), 2), ('replace', ('a',), 1), ('remove', ('b', 1), None)]
+
+    Arguments:
+        l: Any
+        r: Any
+        fingerprinter: Optional[Fingerprinter]
+            for diffing the same (slowly changing) trees over and over. the first diff fingerprints every subtree that isnt ==,
+            which costs more than the diff itself, and later diffs skip any subtree whose digests match in O(1).
+            the caller owns the digests: forget() what changed between diffs, or patch with patch_iterable(..., fingerprinter=).
+        split: str
+        join: bool
+            set to True to get dotted keys instead of path tuples, which is easier to read but loses the key types (ex: str '0' vs int 0),
+            patch_iterable resolves dotted keys against the object as best it can, path tuples are exact.
+
+    Returns:
+        List[Tuple[str, Any, Any]]
+            (DIFF_ADD | DIFF_REMOVE | DIFF_REPLACE, key, value), which can be handed straight to patch_iterable
+    '''
+    ops = _diff_iterable(l, r, fingerprinter)
+    if join:
+        return [(op, join_path(path, split=split), value) for op, path, value in ops]
+    return ops
+
+
+def _same(lv, rv, fingerprinter):
+    # type: (Any, Any, Optional[Fingerprinter]) -> bool
+    if fingerprinter is not None:
+        ld, rd = fingerprinter.cached(lv), fingerprinter.cached(rv)
+        if ld is not None and rd is not None:
+            return ld == rd
+    if lv == rv:
+        return True
+    if fingerprinter is not None:
+        # they differ, so this diff walks into them either way, but the next one can compare their children in O(1)
+        fingerprinter.digest(lv)
+        fingerprinter.digest(rv)
+    return False
+
+
+def _diff_iterable(l, r, fingerprinter):
+    # type: (Any, Any, Optional[Fingerprinter]) -> List[Tuple[str, Tuple[Any, ...], Any]]
+    ops = []  # type: List[Tuple[str, Tuple[Any, ...], Any]]
+    stack = [(tuple(), l, r)]  # type: List[Tuple[Tuple[Any, ...], Any, Any]]
+    while stack:
+        path, lv, rv = stack.pop()
+        if lv is rv:
+            continue
+        if isinstance(lv, dict) and isinstance(rv, dict):
+            if _same(lv, rv, fingerprinter):
+                continue
+            children = []
+            for k, v in lv.items():
+                if k in rv:
+                    children.append((path + (k, ), v, rv[k]))
                 else:
-                    if flat_so_far not in objs_so_far:
-                        new = {} if isinstance(tokens[t + 1], str) else []
-                        objs_so_far[flat_so_far] = new
-                        obj.append(objs_so_far[flat_so_far])
+                    ops.append((DIFF_REMOVE, path + (k, ), None))
+            stack.extend(reversed(children))
+            ops.extend((DIFF_ADD, path + (k, ), v) for k, v in rv.items() if k not in lv)
+        elif isinstance(lv, (list, tuple)) and type(lv) is type(rv):
+            if _same(lv, rv, fingerprinter):
+                continue
+            common = min(len(lv), len(rv))
+            stack.extend((path + (i, ), lv[i], rv[i]) for i in reversed(range(common)))
+            # removals from the back so the indexes stay valid as the patch is applied in order
+            ops.extend((DIFF_REMOVE, path + (i, ), None) for i in reversed(range(common, len(lv))))
+            ops.extend((DIFF_ADD, path + (i, ), rv[i]) for i in range(common, len(rv)))
+        elif type(lv) is not type(rv) or lv != rv:
+            ops.append((DIFF_REPLACE, path, rv))
+    return ops
+
+
+def _resolve_key(obj, key, split='.'):
+    # type: (Any, str, str) -> Tuple[Any, ...]
+    '''
+    Description:
+        turn a dotted key from diff_iterable(join=True) back into a path by looking at the containers it walks through,
+        so dict keys like '0' or 'a.b' come back as they are rather than as 0 or ('a', 'b').
+        within a dict the shortest run of segments that is an existing key wins, a key that doesnt exist yet (an add) is whatever is left.
+        that can still guess wrong when both {'a': {'b': ...}} and {'a.b': ...} exist, which is why diff_iterable returns path tuples by default.
+    '''
+    raws = key.split(split)
+    tokens = []  # type: List[Any]
+    parent = obj
+    i = 0
+    while i < len(raws):
+        if isinstance(parent, dict):
+            token = split.join(raws[i:])  # type: Any
+            j = len(raws)
+            for k in range(i + 1, len(raws) + 1):
+                candidate = split.join(raws[i:k])  # type: Any
+                if candidate not in parent:
+                    candidate = _type_token(candidate)
+                    if candidate not in parent:
+                        continue
+                token, j = candidate, k
+                break
+        else:
+            token, j = _type_token(raws[i]), i + 1
+        tokens.append(token)
+        i = j
+        if i < len(raws):
+            parent = parent[token]
+    return tuple(tokens)
+
+
+def patch_iterable(obj, ops, split='.', fingerprinter=None):
+    # type: (Any, Iterable[Tuple[str, Any, Any]], str, Optional[Fingerprinter]) -> Any
+    '''
+    Description:
+        (inverse of diff_iterable)
+        apply ops in place and in order, so patch_iterable(l, diff_iterable(l, r)) == r
+        >>> patch_iterable({'a': 0}, [('replace', 'a', 1), ('add', 'b', 2)])
+        ... {'a': 1, 'b': 2}
+
+    Arguments:
+        obj: Any
+            must be mutable all the way down to whatever the ops touch, so tuples need not apply
+        ops: Iterable[Tuple[str, Any, Any]]
+            keys can be dotted keys or path tuples, dotted keys are resolved against obj (see _resolve_key)
+        split: str
+        fingerprinter: Optional[Fingerprinter]
+            the one handed to diff_iterable, the digests of every container a patch touches are forgotten so it can be reused
+
+    Returns:
+        Any
+            obj, unless the root itself was replaced, in which case the replacement
+    Raises:
+        ValueError
+            if an op is unknown or tries to add/remove the root
+    '''
+    for op, key, value in ops:
+        if isinstance(key, tuple):
+            tokens = key  # type: Tuple[Any, ...]
+        else:
+            tokens = _resolve_key(obj, key, split=split) if key != '' else tuple()
+        if fingerprinter is not None:
+            fingerprinter.forget(obj, tokens)
+
+        if len(tokens) == 0:
+            if op != DIFF_REPLACE:
+                raise ValueError('cannot {!r} the root of the object, only replace it'.format(op))
+            obj = value
+            continue
+
+        parent = obj
+        for token in tokens[:-1]:
+            parent = parent[token]
+        last = tokens[-1]
+        if op == DIFF_ADD:
+            if isinstance(parent, list):
+                parent.insert(last, value)
             else:
-                path_minus_the_end = split.join(str(ele) for ele in tokens[:t])
-                obj = objs_so_far[path_minus_the_end]
-                if isinstance(obj, dict):
-                    obj[token] = flat[flat_key]
-                else:
-                    obj.append(flat[flat_key])
+                parent[last] = value
+        elif op == DIFF_REMOVE:
+            del parent[last]
+        elif op == DIFF_REPLACE:
+            parent[last] = value
+        else:
+            raise ValueError('unknown op {!r}, must be one of {}'.format(op, [DIFF_ADD, DIFF_REMOVE, DIFF_REPLACE]))
+    return obj
 
-    return iterable
+
+def _split_query(query, split='.'):
+    # type: (str, str) -> List[str]
+    raws = []
+    i = 0
+    while True:
+        if query.startswith('/', i):
+            # regex segments can contain the split character, so read until the closing slash
+            j = i + 1
+            while j < len(query) and query[j] != '/':
+                j += 2 if query[j] == '\\' else 1
+            if j >= len(query):
+                raise ValueError('query {!r} has an unterminated regex segment starting at {}'.format(query, i))
+            j += 1
+        else:
+            j = query.find(split, i)
+            j = len(query) if j == -1 else j
+        raws.append(query[i:j])
+        if j >= len(query):
+            break
+        if not query.startswith(split, j):
+            raise ValueError('query {!r} has a regex segment that isnt followed by {!r} at {}'.format(query, split, j))
+        i = j + len(split)
+    return raws
+
+
+def _parse_segment(raw):
+    # type: (str) -> Tuple[str, Any]
+    if raw == '*':
+        return QUERY_ANY, None
+    if raw == '**':
+        return QUERY_DEEP, None
+    if len(raw) > 1 and raw[0] == '/' and raw[-1] == '/':
+        return QUERY_REGEX, re.compile(raw[1:-1])
+    if len(raw) > 1 and raw[0] == '[' and raw[-1] == ']' and ':' in raw:
+        parts = raw[1:-1].split(':')
+        if len(parts) > 3:
+            raise ValueError('slice segment {!r} has too many colons'.format(raw))
+        try:
+            return QUERY_SLICE, tuple(int(part, base=0) if part else None for part in parts)
+        except ValueError as ve:
+            raise ValueError('slice segment {!r} must only contain ints'.format(raw)) from ve
+    return QUERY_KEY, _type_token(raw)
+
+
+def _query_children(value, kind, arg):
+    # type: (Any, str, Any) -> List[Tuple[Any, Any]]
+    if isleaf(value):
+        return []
+    if isinstance(value, set):
+        value = list(value)  # to allow for indexing...
+    if isinstance(value, dict):
+        if kind == QUERY_KEY:
+            if arg in value:
+                return [(arg, value[arg])]
+            if isinstance(arg, int) and str(arg) in value:
+                return [(str(arg), value[str(arg)])]
+            return []
+        elif kind == QUERY_REGEX:
+            return [(k, v) for k, v in value.items() if arg.fullmatch(str(k))]
+        elif kind == QUERY_SLICE:
+            return []
+        return list(value.items())
+
+    if kind == QUERY_KEY:
+        if isinstance(arg, int) and -len(value) <= arg < len(value):
+            return [(arg % len(value), value[arg])]
+        return []
+    elif kind == QUERY_REGEX:
+        return [(i, v) for i, v in enumerate(value) if arg.fullmatch(str(i))]
+    elif kind == QUERY_SLICE:
+        return [(i, value[i]) for i in range(*slice(*arg).indices(len(value)))]
+    return list(enumerate(value))
+
+
+@dataclass(frozen=True)
+class CompiledQuery(object):
+    '''
+    Description:
+        like a CompiledKey, but segments can also be:
+            *               any single child
+            **              zero or more levels of anything
+            [start:stop]    a slice of list indexes, [::2], [-3:], etc.
+            /regex/         keys (or indexes) that fully match the regex, may contain the split character
+        >>> cq = compile_query('servers.*.ports.0')
+        >>> list(cq.find({'servers': {'a': {'ports': [80]}, 'b': {'ports': [443, 8443]}}}))
+        ... [(('servers', 'a', 'ports', 0), 80), (('servers', 'b', 'ports', 0), 443)]
+    '''
+    query: str
+    split: str
+    segments: Tuple[Tuple[str, Any], ...]
+
+    @property
+    def literal(self):
+        # type: () -> bool
+        return all(kind == QUERY_KEY for kind, _ in self.segments)
+
+    def _closure(self, states):
+        # type: (set) -> set
+        '''
+        Description:
+            ** can match zero levels, so being at a ** also means being at whatever comes after it
+        '''
+        for s in list(states):
+            while s < len(self.segments) and self.segments[s][0] == QUERY_DEEP:
+                s += 1
+                states.add(s)
+        return states
+
+    def find(self, iterable):
+        # type: (Any) -> Generator[Tuple[Tuple[Any, ...], Any], None, None]
+        '''
+        Description:
+            lazily yield (path, value) for every match, in the same order walk would visit them
+        '''
+        segments = self.segments
+        stack = [(tuple(), iterable, self._closure({0}))]  # type: List[Tuple[Tuple[Any, ...], Any, set]]
+        while stack:
+            path, value, states = stack.pop()
+            if len(segments) in states:
+                yield path, value
+            if isleaf(value):
+                continue
+
+            # every state the node is in picks the children it cares about, children picked by more than one state carry all of them
+            children = OrderedDict()  # type: Dict[Any, Tuple[Any, set]]
+            for s in states:
+                if s == len(segments):
+                    continue
+                kind, arg = segments[s]
+                for k, v in _query_children(value, kind, arg):
+                    if k not in children:
+                        children[k] = (v, set())
+                    children[k][1].add(s if kind == QUERY_DEEP else s + 1)
+            if len(children) > 1 and len(states) > 1:
+                ordered = list(value) if isinstance(value, dict) else range(len(value))
+                children = OrderedDict((k, children[k]) for k in ordered if k in children)
+            stack.extend(reversed([(path + (k, ), v, self._closure(next_states)) for k, (v, next_states) in children.items()]))
+
+    def match(self, path, parents=None):
+        # type: (Tuple[Any, ...], Optional[List[Any]]) -> bool
+        '''
+        Description:
+            does a path from walk/iter_flatten satisfy this query?
+        Arguments:
+            path: Tuple[Any, ...]
+            parents: Optional[List[Any]]
+                the container each token of the path indexes into, needed to resolve negative indexes and slices
+        '''
+        segments = self.segments
+        states = self._closure({0})
+        for t, token in enumerate(path):
+            parent = parents[t] if parents is not None else None
+            advanced = set()
+            for s in states:
+                if s == len(segments):
+                    continue
+                kind, arg = segments[s]
+                if kind == QUERY_DEEP:
+                    advanced.add(s)
+                elif kind == QUERY_ANY:
+                    advanced.add(s + 1)
+                elif kind == QUERY_REGEX:
+                    if arg.fullmatch(str(token)):
+                        advanced.add(s + 1)
+                elif isinstance(parent, (list, tuple, set)) and isinstance(token, int):
+                    if kind == QUERY_SLICE and token in range(*slice(*arg).indices(len(parent))):
+                        advanced.add(s + 1)
+                    elif kind == QUERY_KEY and isinstance(arg, int) and -len(parent) <= arg < len(parent) and arg % len(parent) == token:
+                        advanced.add(s + 1)
+                elif kind == QUERY_KEY and (token == arg or (isinstance(arg, int) and token == str(arg))):
+                    advanced.add(s + 1)
+            states = self._closure(advanced)
+            if not states:
+                return False
+        return len(segments) in states
+
+
+@functools.lru_cache(maxsize=COMPILE_KEY_CACHE_SIZE)
+def compile_query(query, split='.'):
+    # type: (str, str) -> CompiledQuery
+    '''
+    Description:
+        parse a query once, the result is cached so the same query string always costs a dict probe
+        >>> compile_query('**.timeout').segments
+        ... (('deep', None), ('key', 'timeout'))
+    '''
+    return CompiledQuery(query=query, split=split, segments=tuple(_parse_segment(raw) for raw in _split_query(query, split=split)))
+
+
+class QueryIndex(object):
+    '''
+    Description:
+        every path in an object, precomputed, so that literal queries are a hash probe and
+        wildcard queries match against paths rather than re-traversing the object (and are memoized after the first time).
+
+    NOTE:
+        this is a snapshot, if the object is mutated afterward make a new index.
+    '''
+
+    def __init__(self, iterable):
+        # type: (Any) -> None
+        self.iterable = iterable
+        self.paths = OrderedDict([(tuple(), iterable)])  # type: Dict[Tuple[Any, ...], Any]
+        for path, value, _ in walk(iterable):
+            self.paths[path] = value
+        self._memo = {}  # type: Dict[CompiledQuery, List[Tuple[Tuple[Any, ...], Any]]]
+
+    def find(self, query, split='.'):
+        # type: (Union[str, CompiledQuery], str) -> Iterable[Tuple[Tuple[Any, ...], Any]]
+        cq = query if isinstance(query, CompiledQuery) else compile_query(query, split=split)
+        if cq.literal:
+            path = tuple(arg for _, arg in cq.segments)
+            if path in self.paths:
+                return [(path, self.paths[path])]
+        if cq not in self._memo:
+            self._memo[cq] = [
+                (path, value) for path, value in self.paths.items()
+                if cq.match(path, parents=[self.paths[path[:t]] for t in range(len(path))])
+            ]
+        return self._memo[cq]
+
+
+def query(query, iterable, split='.'):
+    # type: (Union[str, CompiledQuery], Union[Any, QueryIndex], str) -> Generator[Tuple[Tuple[Any, ...], Any], None, None]
+    '''
+    Description:
+        get, but with wildcards, slices, and regexes, and it yields every match
+        >>> list(query('**.timeout', {'a': {'timeout': 1}, 'b': [{'timeout': 2}]}))
+        ... [(('a', 'timeout'), 1), (('b', 0, 'timeout'), 2)]
+        >>> list(query('/web-\\d+/.port', {'web-1': {'port': 80}, 'db': {'port': 5432}}))
+        ... [(('web-1', 'port'), 80)]
+
+    Arguments:
+        query: Union[str, CompiledQuery]
+            see CompiledQuery for the syntax
+        iterable: Union[Any, QueryIndex]
+            give a QueryIndex if you're going to ask the same object a lot of questions
+        split: str
+
+    Returns:
+        Generator[Tuple[Tuple[Any, ...], Any], None, None]
+            (path, value), use join_path if you want the dotted key
+    '''
+    cq = query if isinstance(query, CompiledQuery) else compile_query(query, split=split)
+    if isinstance(iterable, QueryIndex):
+        yield from iterable.find(cq)
+    else:
+        yield from cq.find(iterable)
+
+
+@dataclass
+class Schema(object):
+    '''
+    Description:
+        what paths exist across a stream of records, what types they hold, and how often they're null or missing.
+        list indexes collapse into "*" by default so that memory is bound by the shape of the records rather than their length.
+        >>> schema = infer_schema([{'a': 1, 'b': [{'c': None}]}, {'a': 'x'}])
+        >>> schema.types
+        ... {'a': {'int': 1, 'str': 1}, 'b.*.c': {'NoneType': 1}}
+        >>> schema.conflicts()
+        ... {'a': ['int', 'str']}
+    '''
+    records: int = 0
+    types: Dict[str, Dict[str, int]] = field(default_factory=OrderedDict)
+    present: Dict[str, int] = field(default_factory=OrderedDict)
+    collapse_lists: bool = True
+    split: str = '.'
+
+    def update(self, record):
+        # type: (Any) -> None
+        self.records += 1
+        if isleaf(record) or len(record) == 0:
+            leaves = [('', record)]  # type: Iterable[Tuple[str, Any]]
+        else:
+            leaves = self._leaves(record)
+        seen = set()
+        for key, value in leaves:
+            histogram = self.types.get(key)
+            if histogram is None:
+                histogram = self.types[key] = OrderedDict()
+            type_name = type(value).__name__
+            histogram[type_name] = histogram.get(type_name, 0) + 1
+            if key not in seen:
+                seen.add(key)
+                self.present[key] = self.present.get(key, 0) + 1
+
+    def _leaves(self, record):
+        # type: (Any) -> Generator[Tuple[str, Any], None, None]
+        keys_so_far = {tuple(): ''}  # type: Dict[Tuple[Any, ...], str]
+        for path, value, parent in walk(record):
+            token = '*' if self.collapse_lists and not isinstance(parent, dict) else str(path[-1])
+            prefix = keys_so_far[path[:-1]]
+            key = token if not prefix else '{}{}{}'.format(prefix, self.split, token)
+            if isleaf(value) or len(value) == 0:
+                yield key, value
+            else:
+                keys_so_far[path] = key
+
+    def merge(self, other):
+        # type: (Schema) -> Schema
+        '''
+        Description:
+            fold another schema (ex: from a worker process) into this one
+        '''
+        self.records += other.records
+        for key, histogram in other.types.items():
+            mine = self.types.get(key)
+            if mine is None:
+                mine = self.types[key] = OrderedDict()
+            for type_name, count in histogram.items():
+                mine[type_name] = mine.get(type_name, 0) + count
+        for key, count in other.present.items():
+            self.present[key] = self.present.get(key, 0) + count
+        return self
+
+    def missing(self, key):
+        # type: (str) -> int
+        return self.records - self.present.get(key, 0)
+
+    def nulls(self, key):
+        # type: (str) -> int
+        return self.types.get(key, {}).get('NoneType', 0)
+
+    def conflicts(self):
+        # type: () -> Dict[str, List[str]]
+        '''
+        Description:
+            paths that have held more than one non-null type
+        '''
+        conflicts = OrderedDict()  # type: Dict[str, List[str]]
+        for key, histogram in self.types.items():
+            type_names = sorted(type_name for type_name in histogram if type_name != 'NoneType')
+            if len(type_names) > 1:
+                conflicts[key] = type_names
+        return conflicts
+
+    def to_dict(self):
+        # type: () -> Dict[str, Dict[str, Any]]
+        return OrderedDict(
+            (key, dict(types=dict(histogram), present=self.present.get(key, 0), missing=self.missing(key), nulls=self.nulls(key)))
+            for key, histogram in self.types.items()
+        )
+
+
+def infer_schema(records, sample=None, collapse_lists=True, split='.'):
+    # type: (Iterable[Any], Optional[int], bool, str) -> Schema
+    '''
+    Description:
+        one streaming pass over records (straight from a jsonl reader is fine), nothing but the Schema is held onto
+        >>> infer_schema(json.loads(line) for line in r)
+
+    Arguments:
+        records: Iterable[Any]
+        sample: Optional[int]
+            stop after this many records
+        collapse_lists: bool
+            'a.*.b' rather than 'a.0.b', 'a.1.b', ...
+        split: str
+
+    Returns:
+        Schema
+            use merge_schemas to combine the results of several workers
+    '''
+    schema = Schema(collapse_lists=collapse_lists, split=split)
+    if sample is not None:
+        records = itertools.islice(records, sample)
+    for record in records:
+        schema.update(record)
+    return schema
+
+
+def merge_schemas(schemas):
+    # type: (Iterable[Schema]) -> Schema
+    merged = None  # type: Optional[Schema]
+    for schema in schemas:
+        if merged is None:
+            merged = Schema(collapse_lists=schema.collapse_lists, split=schema.split)
+        merged.merge(schema)
+    return merged or Schema()
+
+
+def _membership(subject, tokens):
+    # type: (Iterable, List[Any]) -> Any
+    '''
+    Description:
+        whatever makes "token in subject" cheapest without changing its answer, sets and dicts as-is,
+        a single token against a list or tuple as-is, everything else hashed (if it can be) so each token is O(1)
+    '''
+    try:
+        for token in tokens:
+            hash(token)
+    except TypeError:
+        return subject if isinstance(subject, (list, tuple)) else list(subject)
+    if isinstance(subject, (dict, set, frozenset, range)):
+        return subject
+    if isinstance(subject, (list, tuple)) and len(tokens) == 1:
+        return subject
+    subject_list = list(subject)  # helps to flatten iterators and sets and other things
+    try:
+        return set(subject_list)
+    except TypeError:
+        return subject_list
 
 
 def contains(subject, token_or_tokens, exc=False, func=all):
@@ -257,21 +1275,54 @@ def contains(subject, token_or_tokens, exc=False, func=all):
         ValueError
             if exc=True
     '''
-    relpath, lineno = get_caller_file_lineno()
-    tokens = as_list(token_or_tokens)
-    subject_list = subject
-    if not isinstance(subject, str):
-        subject_list = list(subject)  # helps to flatten iterators and sets and other things
-    else:
+    tokens = token_or_tokens if isinstance(token_or_tokens, list) else [token_or_tokens]
+    if isinstance(subject, str):
         tokens = [str(ele) for ele in tokens]
-    if not func(token in subject_list for token in tokens):
+        membership = subject  # type: Any
+    else:
+        membership = _membership(subject, tokens)
+    if not func(token in membership for token in tokens):
         if not exc:
             return False
+        # introspection is expensive, only pay for it when we're about to raise
+        relpath, lineno = get_caller_file_lineno()
         msg = '"{}", line {} - subject {!r} does not contain {} tokens {}'.format(relpath, lineno, subject, func.__name__, tokens)
         raise ValueError(msg)
     return True
 
 
+def contains_many(subjects, token_or_tokens, exc=False, func=all):
+    # type: (Iterable[Iterable], Union[Any, Iterable], bool, Callable[[Iterable], bool]) -> List[bool]
+    '''
+    Description:
+        contains, but for a batch of subjects checked against the same tokens
+        >>> contains_many([['a', 'b'], ['b'], 'abc'], 'a')
+        ... [True, False, True]
+    Returns:
+        List[bool]
+    Raises:
+        ValueError
+            if exc=True, on the first subject that doesnt contain the tokens
+    '''
+    tokens = token_or_tokens if isinstance(token_or_tokens, list) else [token_or_tokens]
+    str_tokens = None  # type: Optional[List[str]]
+    results = []
+    for subject in subjects:
+        if isinstance(subject, str):
+            if str_tokens is None:
+                str_tokens = [str(ele) for ele in tokens]
+            subject_tokens, membership = str_tokens, subject  # type: List[Any], Any
+        else:
+            subject_tokens, membership = tokens, _membership(subject, tokens)
+        found = func(token in membership for token in subject_tokens)
+        if not found and exc:
+            relpath, lineno = get_caller_file_lineno()
+            msg = '"{}", line {} - subject {!r} does not contain {} tokens {}'.format(relpath, lineno, subject, func.__name__, subject_tokens)
+            raise ValueError(msg)
+        results.append(found)
+    return results
+
+
 def contains_all(subject, token_or_tokens, exc=False):
     # type: (Iterable, Union[Any, Iterable], bool) -> bool
     return contains(subject, token_or_tokens, exc=exc, func=all)
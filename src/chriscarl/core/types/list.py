@@ -10,6 +10,11 @@ core.types.list is all about these array-lists.
 core.types are modules that pertain to data structures, algorithms, conversions. non-self-referential, low-import, etc.
 
 Updates:
+    2026-10-18 - core.types.list - FIX: n_chunks splits with divmod into n chunks that differ by at most 1, n_sized_chunks and n_chunks reject dicts
+    2026-10-18 - core.types.list - FIX: top_k falls back to MisraGries past max_distinct, generate_list_by_frequency copies the sketch it's given, added copy to the sketches
+    2026-10-18 - core.types.list - n_sized_chunks and n_chunks take iterators and zero_copy buffers, added chunked_map
+    2026-10-18 - core.types.list - added top_k, CountMinSketch, MisraGries, sorted_list_by_frequency takes a sketch
+    2026-10-18 - core.types.list - added iter_dedupe and BloomFilter, dedupe handles unhashable elements
     2025-01-14 - core.types.list - removed contains
     2025-01-01 - core.types.list - added n_sized_chunks and n_chunks
     2024-12-09 - core.types.list - added as_list
@@ -20,13 +25,20 @@ Updates:
 from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
 import os
 import sys
+import math
+import array
+import heapq
+import itertools
+import concurrent.futures
+import hashlib
 import logging
-from typing import List, Union, Callable, Any, Generator, Iterable
+from typing import List, Union, Callable, Any, Generator, Iterable, Optional, Tuple, Dict, Sequence, cast
 
 # third party imports
 
 # project imports
 from chriscarl.core.lib.stdlib.typing import T_TYPING, isinstance_raise
+from chriscarl.core.types.iterable import Fingerprinter
 
 SCRIPT_RELPATH = 'chriscarl/core/types/list.py'
 if not hasattr(sys, '_MEIPASS'):
@@ -40,10 +52,142 @@ LOGGER = logging.getLogger(__name__)
 LOGGER.addHandler(logging.NullHandler())
 
 
+def _digest(item, fingerprinter):
+    # type: (Any, Fingerprinter) -> bytes
+    '''
+    Description:
+        structural digest of anything, fingerprinter is cleared afterward so a stream of records doesnt pile up in its cache
+    '''
+    if isinstance(item, str):
+        return hashlib.blake2b(b's' + item.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    if isinstance(item, bytes):
+        return hashlib.blake2b(b'b' + item, digest_size=16).digest()
+    digest = fingerprinter.digest(item)
+    fingerprinter.clear()
+    return digest
+
+
+class BloomFilter(object):
+    '''
+    Description:
+        fixed memory set membership that can say "probably seen" when it hasnt, but never "not seen" when it has.
+        sized so that once capacity items have been added, the false positive rate is about error_rate.
+            bits   = -capacity * ln(error_rate) / ln(2)^2    ~9.6 bits per item at 1%, ~14.4 at 0.1%
+            hashes = bits / capacity * ln(2)
+        >>> bf = BloomFilter(1000, error_rate=0.01)
+        >>> bf.add('a')
+        ... False
+        >>> 'a' in bf
+        ... True
+    '''
+
+    def __init__(self, capacity, error_rate=0.01):
+        # type: (int, float) -> None
+        if capacity < 1:
+            raise ValueError('capacity must be at least 1, got {}'.format(capacity))
+        if not 0 < error_rate < 1:
+            raise ValueError('error_rate must be between 0 and 1 exclusive, got {}'.format(error_rate))
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2)**2)))
+        self.hashes = max(1, int(round(self.bits / capacity * math.log(2))))
+        self.array = bytearray((self.bits + 7) // 8)
+        self.count = 0
+        self._fingerprinter = Fingerprinter(digest_size=16)
+
+    @classmethod
+    def from_memory(cls, max_bytes, error_rate=0.01):
+        # type: (int, float) -> BloomFilter
+        '''
+        Description:
+            the biggest filter that fits in max_bytes at error_rate
+        '''
+        capacity = max(1, int(max_bytes * 8 * math.log(2)**2 / -math.log(error_rate)))
+        return cls(capacity, error_rate=error_rate)
+
+    def __len__(self):
+        # type: () -> int
+        return self.count
+
+    def _indexes(self, item):
+        # type: (Any) -> List[int]
+        digest = _digest(item, self._fingerprinter)
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def __contains__(self, item):
+        # type: (Any) -> bool
+        return all(self.array[index >> 3] & (1 << (index & 7)) for index in self._indexes(item))
+
+    def add(self, item):
+        # type: (Any) -> bool
+        '''
+        Returns:
+            bool
+                True if the item was (probably) already there
+        '''
+        present = True
+        for index in self._indexes(item):
+            byte, bit = index >> 3, 1 << (index & 7)
+            if not self.array[byte] & bit:
+                present = False
+                self.array[byte] |= bit
+        if not present:
+            self.count += 1
+        return present
+
+
+def iter_dedupe(iterable, key=None, approximate=False, capacity=1_000_000, error_rate=0.001, max_bytes=None):
+    # type: (Iterable[Any], Optional[Callable[[Any], Any]], bool, int, float, Optional[int]) -> Generator[Any, None, None]
+    '''
+    Description:
+        yield the first occurrence of everything, lazily.
+        unhashable elements (dicts, lists) are deduped by their structural fingerprint rather than blowing up.
+        >>> list(iter_dedupe([1, 2, 1, {'a': 1}, {'a': 1}]))
+        ... [1, 2, {'a': 1}]
+
+    Arguments:
+        iterable: Iterable[Any]
+        key: Optional[Callable[[Any], Any]]
+            dedupe on key(item) rather than the item itself
+        approximate: bool
+            use a BloomFilter rather than a set, memory is fixed up front but about error_rate of the unique items
+            that show up after the filter is full may be wrongly dropped as duplicates
+        capacity: int
+            how many unique items the BloomFilter should expect
+        error_rate: float
+            false positive rate of the BloomFilter at capacity
+        max_bytes: Optional[int]
+            size the BloomFilter by memory instead of capacity
+
+    Returns:
+        Generator[Any, None, None]
+    '''
+    if approximate:
+        bloom = BloomFilter.from_memory(max_bytes, error_rate=error_rate) if max_bytes is not None else BloomFilter(capacity, error_rate=error_rate)
+        for item in iterable:
+            if not bloom.add(item if key is None else key(item)):
+                yield item
+        return
+
+    seen = set()
+    fingerprinter = Fingerprinter(digest_size=16)
+    for item in iterable:
+        identity = item if key is None else key(item)
+        try:
+            hash(identity)
+        except TypeError:
+            identity = (Fingerprinter, _digest(identity, fingerprinter))  # cant collide with a real hashable item
+        if identity in seen:
+            continue
+        seen.add(identity)
+        yield item
+
+
 def dedupe(lst):
     # type: (list) -> list
-    vals = {line: 1 for line in lst}
-    return list(vals.keys())
+    return list(iter_dedupe(lst))
 
 
 def find_index(filter, lst):
@@ -67,16 +211,251 @@ def frequency_table(lst):
     return frequency
 
 
-def generate_list_by_frequency(lst, ascending=True):
-    # type: (list, bool) -> Generator[Any, None, None]
-    frequency = frequency_table(lst)
+class CountMinSketch(object):
+    '''
+    Description:
+        fixed memory frequency estimates, never under-counts, over-counts by at most epsilon * total with probability 1 - delta.
+            width = e / epsilon
+            depth = ln(1 / delta)
+        since a sketch cant list what it has seen, the k heaviest candidates are tracked alongside it.
+        hashing is blake2b rather than hash() so sketches built in different processes line up and can be merged.
+        >>> cms = CountMinSketch(width=1024, depth=4, k=2)
+        >>> cms.update('abracadabra')
+        >>> cms.most_common()
+        ... [('a', 5), ('b', 2)]
+    '''
+
+    def __init__(self, width=2048, depth=5, k=100):
+        # type: (int, int, int) -> None
+        if width < 1 or depth < 1 or k < 1:
+            raise ValueError('width, depth, and k must be at least 1, got {}, {}, {}'.format(width, depth, k))
+        self.width = width
+        self.depth = depth
+        self.k = k
+        self.rows = [array.array('q', [0]) * width for _ in range(depth)]
+        self.total = 0
+        self.candidates = {}  # type: Dict[Any, int]
+        self._floor = 0
+        self._fingerprinter = Fingerprinter(digest_size=16)
+
+    @classmethod
+    def from_error(cls, epsilon=0.001, delta=0.01, k=100):
+        # type: (float, float, int) -> CountMinSketch
+        return cls(width=int(math.ceil(math.e / epsilon)), depth=int(math.ceil(math.log(1 / delta))), k=k)
+
+    def _indexes(self, item):
+        # type: (Any) -> List[int]
+        digest = _digest(item, self._fingerprinter)
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def _estimate(self, indexes):
+        # type: (List[int]) -> int
+        return min(row[index] for row, index in zip(self.rows, indexes))
+
+    def _track(self, item, estimate):
+        # type: (Any, int) -> None
+        # candidate counts only ever grow, so a stale floor is still a lower bound and most items skip the O(k) scan
+        if item in self.candidates or len(self.candidates) < self.k:
+            self.candidates[item] = estimate
+        elif estimate > self._floor:
+            lowest = min(self.candidates, key=self.candidates.__getitem__)
+            if estimate > self.candidates[lowest]:
+                del self.candidates[lowest]
+                self.candidates[item] = estimate
+            self._floor = min(self.candidates.values())
+
+    def add(self, item, count=1):
+        # type: (Any, int) -> int
+        indexes = self._indexes(item)
+        for row, index in zip(self.rows, indexes):
+            row[index] += count
+        self.total += count
+        estimate = self._estimate(indexes)
+        self._track(item, estimate)
+        return estimate
+
+    def update(self, iterable):
+        # type: (Iterable[Any]) -> None
+        for item in iterable:
+            self.add(item)
+
+    def count(self, item):
+        # type: (Any) -> int
+        return self._estimate(self._indexes(item))
+
+    __getitem__ = count
+
+    def merge(self, other):
+        # type: (CountMinSketch) -> CountMinSketch
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError('cannot merge a {}x{} sketch into a {}x{} sketch'.format(other.width, other.depth, self.width, self.depth))
+        for row, other_row in zip(self.rows, other.rows):
+            for index, value in enumerate(other_row):
+                if value:
+                    row[index] += value
+        self.total += other.total
+        candidates = set(self.candidates) | set(other.candidates)
+        self.candidates = {}
+        self._floor = 0
+        for item in candidates:
+            self._track(item, self.count(item))
+        return self
+
+    def copy(self):
+        # type: () -> CountMinSketch
+        other = CountMinSketch(width=self.width, depth=self.depth, k=self.k)
+        other.rows = [array.array('q', row) for row in self.rows]
+        other.total = self.total
+        other.candidates = dict(self.candidates)
+        other._floor = self._floor
+        return other
+
+    def items(self):
+        # type: () -> List[Tuple[Any, int]]
+        return list(self.candidates.items())
+
+    def most_common(self, k=None):
+        # type: (Optional[int]) -> List[Tuple[Any, int]]
+        return heapq.nlargest(k or self.k, self.candidates.items(), key=lambda tpl: tpl[1])
+
+
+class MisraGries(object):
+    '''
+    Description:
+        deterministic heavy hitters in k - 1 counters, anything occurring more than total / k times is guaranteed to be kept,
+        and every count is under by at most total / k.
+        merging adds the counters then subtracts the k-th largest, which keeps the same guarantee over the combined stream.
+        >>> mg = MisraGries(3)
+        >>> mg.update('abracadabra')
+        >>> mg.most_common()
+        ... [('a', 2)]
+    '''
+
+    def __init__(self, k=100):
+        # type: (int) -> None
+        if k < 2:
+            raise ValueError('k must be at least 2, got {}'.format(k))
+        self.k = k
+        self.counters = {}  # type: Dict[Any, int]
+        self.total = 0
+
+    def add(self, item, count=1):
+        # type: (Any, int) -> None
+        self.total += count
+        counters = self.counters
+        if item in counters:
+            counters[item] += count
+        elif len(counters) < self.k - 1:
+            counters[item] = count
+        else:
+            counters[item] = count
+            self._shrink()
+
+    def _shrink(self):
+        # type: () -> None
+        if len(self.counters) < self.k:
+            return
+        kth = heapq.nlargest(self.k, self.counters.values())[-1]
+        self.counters = {item: value - kth for item, value in self.counters.items() if value > kth}
+
+    def update(self, iterable):
+        # type: (Iterable[Any]) -> None
+        for item in iterable:
+            self.add(item)
+
+    def count(self, item):
+        # type: (Any) -> int
+        return self.counters.get(item, 0)
+
+    __getitem__ = count
+
+    def merge(self, other):
+        # type: (MisraGries) -> MisraGries
+        if self.k != other.k:
+            raise ValueError('cannot merge a k={} summary into a k={} summary'.format(other.k, self.k))
+        for item, value in other.counters.items():
+            self.counters[item] = self.counters.get(item, 0) + value
+        self.total += other.total
+        self._shrink()
+        return self
+
+    def copy(self):
+        # type: () -> MisraGries
+        other = MisraGries(k=self.k)
+        other.counters = dict(self.counters)
+        other.total = self.total
+        return other
+
+    def items(self):
+        # type: () -> List[Tuple[Any, int]]
+        return list(self.counters.items())
+
+    def most_common(self, k=None):
+        # type: (Optional[int]) -> List[Tuple[Any, int]]
+        return heapq.nlargest(k or self.k, self.counters.items(), key=lambda tpl: tpl[1])
+
+
+Sketch = Union[CountMinSketch, MisraGries]
+TOP_K_MAX_DISTINCT = 1_000_000
+
+
+def top_k(iterable, k, max_distinct=TOP_K_MAX_DISTINCT):
+    # type: (Union[Iterable[Any], Sketch], int, int) -> List[Tuple[Any, int]]
+    '''
+    Description:
+        the k most frequent (element, count), most frequent first, ties in order of first appearance.
+        counting is exact until more than max_distinct different elements have been seen, from then on it carries on
+        as a MisraGries(max_distinct) so memory stays bounded, and counts can be under by at most total / max_distinct.
+        selection is a k-sized heap rather than a full sort.
+        >>> top_k('abracadabra', 2)
+        ... [('a', 5), ('b', 2)]
+    '''
+    if isinstance(iterable, (CountMinSketch, MisraGries)):
+        return iterable.most_common(k)
+    frequency = {}  # type: Dict[Any, int]
+    iterator = iter(iterable)
+    total = 0
+    for ele in iterator:
+        total += 1
+        if ele in frequency:
+            frequency[ele] += 1
+        elif len(frequency) < max_distinct:
+            frequency[ele] = 1
+        else:
+            summary = MisraGries(k=max(max_distinct, k + 1))
+            summary.counters = frequency
+            summary.total = total - 1
+            summary.add(ele)
+            summary.update(iterator)
+            return summary.most_common(k)
+    return heapq.nlargest(k, frequency.items(), key=lambda tpl: tpl[1])
+
+
+def generate_list_by_frequency(lst, ascending=True, sketch=None):
+    # type: (list, bool, Optional[Sketch]) -> Generator[Any, None, None]
+    '''
+    Description:
+        with a sketch, lst is added to a copy of it, the sketch passed in isnt changed
+    '''
+    if sketch is None:
+        frequency = frequency_table(lst)
+    else:
+        sketch = sketch.copy()
+        sketch.update(lst)
+        frequency = dict(sketch.items())
     for k, v in sorted(frequency.items(), key=lambda tpl: tpl[1], reverse=not ascending):
         yield k
 
 
-def sorted_list_by_frequency(lst, ascending=True):
-    # type: (list, bool) -> List[Any]
-    return list(generate_list_by_frequency(lst, ascending=ascending))
+def sorted_list_by_frequency(lst, ascending=True, sketch=None):
+    # type: (list, bool, Optional[Sketch]) -> List[Any]
+    '''
+    Description:
+        with a sketch, only the elements the sketch kept as heavy hitters come back, in memory bounded by the sketch
+    '''
+    return list(generate_list_by_frequency(lst, ascending=ascending, sketch=sketch))
 
 
 def as_list(obj_or_list, typing=List[Any]):
@@ -87,30 +466,115 @@ def as_list(obj_or_list, typing=List[Any]):
     return obj_or_list
 
 
-def n_sized_chunks(lst, n):
-    # type: (list, int) -> Generator[list, None, None]
+def _sliceable(lst, zero_copy=False):
+    # type: (Iterable[Any], bool) -> Sequence[Any]
+    '''
+    Description:
+        something that can be len()-ed and sliced. buffers become a memoryview if zero_copy so slices share memory,
+        anything that can only be iterated is read into a list
+    '''
+    if isinstance(lst, dict):
+        raise TypeError('a dict cant be sliced by index, pass list(d.items()) or list(d) instead')
+    if zero_copy and not isinstance(lst, memoryview):
+        try:
+            return memoryview(lst)  # type: ignore[arg-type]  # not a buffer is exactly what the TypeError is for
+        except TypeError:
+            pass
+    if isinstance(lst, Sequence):
+        return lst
+    if hasattr(lst, '__getitem__') and hasattr(lst, '__len__'):  # sequence-like but not registered as one, ex: numpy arrays
+        return cast(Sequence[Any], lst)
+    return list(lst)
+
+
+def n_sized_chunks(lst, n, zero_copy=False):
+    # type: (Union[list, Iterable[Any]], int, bool) -> Generator[Sequence[Any], None, None]
     '''
     https://stackoverflow.com/a/312464
+    iterators are consumed lazily n at a time, and buffers (bytes, bytearray, array) are sliced as memoryviews if zero_copy
+    dicts raise a TypeError, chunk list(d.items()) instead
     '''
     if n < 1:
         raise ValueError('how can you divide a list into {} sized chunks... idiot'.format(n))
-    for i in range(0, len(lst), n):
-        yield lst[i:i + n]
+    if not zero_copy and not isinstance(lst, Sequence) and not (hasattr(lst, '__getitem__') and hasattr(lst, '__len__')):
+        iterator = iter(lst)
+        chunk = list(itertools.islice(iterator, n))
+        while chunk:
+            yield chunk
+            chunk = list(itertools.islice(iterator, n))
+        return
+    sequence = _sliceable(lst, zero_copy=zero_copy)
+    for i in range(0, len(sequence), n):
+        yield sequence[i:i + n]
 
 
-def n_chunks(lst, n):
-    # type: (list, int) -> Generator[list, None, None]
+def n_chunks(lst, n, zero_copy=False):
+    # type: (Union[list, Iterable[Any]], int, bool) -> Generator[Sequence[Any], None, None]
     '''
-    if I want to divide 0, 1, 2, 3, 4 into 3 chunks, i'd expect 01, 23, 4 or 0, 12, 34
+    if I want to divide 0, 1, 2, 3, 4 into 3 chunks, i'd expect 01, 23, 4
+    exactly n chunks whose sizes differ by at most 1, bigger ones first, or one per element if there are fewer than n.
+    iterators have to be read into a list first since the length decides the chunk sizes, buffers are sliced as memoryviews if zero_copy
     '''
     if n < 1:
         raise ValueError('how can you divide a list into {} chunks... idiot'.format(n))
-    i = 0
-    even = len(lst) % n == 0
-    size = len(lst) // n if even else len(lst) // n + 1
-    while i < len(lst):
-        yield lst[i:i + size]
-        i += size
-        if not even and size - 1 > 0 and (len(lst) - i) % (size - 1) == 0:  # if remaining list is divisible by dropping down chunk lenght, do it
-            size -= 1
-            even = True
+    sequence = _sliceable(lst, zero_copy=zero_copy)
+    size, extra = divmod(len(sequence), n)
+    start = 0
+    for c in range(min(n, len(sequence))):
+        end = start + size + (1 if c < extra else 0)
+        yield sequence[start:end]
+        start = end
+
+
+EXECUTORS = {
+    'process': concurrent.futures.ProcessPoolExecutor,
+    'thread': concurrent.futures.ThreadPoolExecutor,
+}
+
+
+def _map_chunk(func, chunk):
+    # type: (Callable[[Any], Any], Any) -> List[Any]
+    return [func(ele) for ele in chunk]
+
+
+def chunked_map(func, data, chunks=None, executor='process', max_workers=None):
+    # type: (Callable[[Any], Any], Iterable[Any], Optional[int], Union[str, concurrent.futures.Executor], Optional[int]) -> List[Any]
+    '''
+    Description:
+        [func(ele) for ele in data], but split into n_chunks and spread over a pool, results in the original order.
+        one task per chunk rather than per element, so the pickling/scheduling cost is paid chunks times not len(data) times.
+        >>> chunked_map(abs, [-1, -2, 3], chunks=2, executor='thread')
+        ... [1, 2, 3]
+
+    Arguments:
+        func: Callable[[Any], Any]
+            must be picklable (module level, not a lambda) for the 'process' executor
+        data: Iterable[Any]
+        chunks: Optional[int]
+            default os.cpu_count()
+        executor: Union[str, concurrent.futures.Executor]
+            'process', 'thread', or an existing executor which is left open
+        max_workers: Optional[int]
+            default chunks
+
+    Returns:
+        List[Any]
+    '''
+    chunks = chunks or os.cpu_count() or 1
+    if isinstance(executor, concurrent.futures.Executor):
+        pool, owned = executor, False
+    elif executor in EXECUTORS:
+        # threads share memory so buffers can be handed out as views, processes have to pickle a copy regardless
+        pool, owned = EXECUTORS[executor](max_workers=max_workers or chunks), True
+    else:
+        raise ValueError('executor must be one of {} or an Executor, got {!r}'.format(list(EXECUTORS), executor))
+    zero_copy = isinstance(pool, concurrent.futures.ThreadPoolExecutor)
+    try:
+        parts = list(n_chunks(data, chunks, zero_copy=zero_copy))
+        results = []
+        for part in pool.map(_map_chunk, itertools.repeat(func, len(parts)), parts):
+            results.extend(part)
+        return results
+    finally:
+        if owned:
+            pool.shutdown()
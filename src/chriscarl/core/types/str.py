@@ -10,6 +10,17 @@ core.types.str is probably badly named and should be "string" but either sucks,
 core.types are modules that pertain to data structures, algorithms, conversions. non-self-referential, low-import, etc.
 
 Updates:
+    2026-10-18 - core.types.str - FIX: CaseInsensitiveIndex scans until build_after distinct tokens before building n-grams, contains_insensitive goes through contains_all / contains_any
+    2026-10-18 - core.types.str - FIX: _Fuzzy is an abc.ABC with an abstract query
+    2026-10-18 - core.types.str - FIX: CaseInsensitiveIndex confirms long tokens at the positions of their rarest n-gram instead of scanning the text
+    2026-10-18 - core.types.str - FIX: size_to_bytes takes signed sizes like '-1k' and plural units like 'kbs' again, sizes_to_bytes type checks
+    2026-10-18 - core.types.str - FIX: LineIndex.text and LineIndex.line are typed str or bytes instead of an unbound AnyStr
+    2026-10-18 - core.types.str - FIX: MultiPatternMatcher offsets map back to the original text when lower() changes its length
+    2026-10-18 - core.types.str - added edit_distance, FuzzyIndex, and BKTree for "did you mean" lookups
+    2026-10-18 - core.types.str - added CaseInsensitiveIndex, contains_insensitive folds the text too and takes an index
+    2026-10-18 - core.types.str - size_to_bytes is a strict precompiled regex parser with IEC/SI units, added sizes_to_bytes and bytes_to_sizes
+    2026-10-18 - core.types.str - added LineIndex
+    2026-10-18 - core.types.str - added MultiPatternMatcher, find_index scans with str.find
     2025-01-14 - core.types.list - added contains_insensitive and its variants
     2024-12-13 - core.types.str - added strip_unicode
     2024-11-26 - core.types.str - initial commit
@@ -19,9 +30,15 @@ Updates:
 from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
 import os
 import sys
+import re
+import abc
+import array
+import bisect
+import heapq
+import itertools
 import logging
-from collections import OrderedDict
-from typing import Generator, Union, Callable, Iterable
+from collections import OrderedDict, deque
+from typing import Generator, Union, Callable, Iterable, List, Tuple, Set, AnyStr, Any, Dict, Optional, cast
 
 # third party imports
 
@@ -47,55 +64,322 @@ for k in list(FILE_SIZE_UNITS.keys()):
         v = FILE_SIZE_UNITS[k]
         FILE_SIZE_UNITS['{}b'.format(k)] = v
 BYTES_TO_SIZE_UNITS = ['b', 'k', 'm', 'g', 't', 'p']
+# 1.5G, 512 MiB, 10kb, 1e3 bytes, -1k. k/kb/K are 1024 unless si=True, kib is always 1024, plurals like kbs or ks are fine
+SIZE_UNIT_PATTERN = r'(?:([kmgtp])(i)?)?(bs?|bytes?|(?<=[kmgtpi])s)?'
+SIZE_PATTERN = r'([+-]?(?:\d+(?:\.\d*)?(?:e[+-]?\d+)?|\.\d+(?:e[+-]?\d+)?))[ \t]*' + SIZE_UNIT_PATTERN
+SIZE_REGEX = re.compile(r'^\s*{}\s*$'.format(SIZE_PATTERN), flags=re.IGNORECASE)
+SIZE_LINES_REGEX = re.compile(r'^[ \t]*{}[ \t]*$'.format(SIZE_PATTERN), flags=re.IGNORECASE | re.MULTILINE)
+SIZE_UNIT_REGEX = re.compile(r'^{}$'.format(SIZE_UNIT_PATTERN), flags=re.IGNORECASE)
+SIZE_BYTES_THRESHOLDS = [1024**exponent for exponent in range(1, len(BYTES_TO_SIZE_UNITS))]
+SIZE_SI_THRESHOLDS = [1000**exponent for exponent in range(1, len(BYTES_TO_SIZE_UNITS))]
 
 
 def find_index(search, text):
     # type: (str, str) -> Generator[int, None, None]
-    len_search = len(search)
-    for c, char in enumerate(text):
-        if c + len_search > len(text):
-            break
-        if char == search[0] and text[c:c + len_search] == search:
-            yield c
+    if not search:
+        return
+    c = text.find(search)
+    while c != -1:
+        yield c
+        c = text.find(search, c + 1)
 
 
-def size_to_bytes(size, into='b'):
-    # type: (str, str) -> float
+class MultiPatternMatcher(object):
+    '''
+    Description:
+        Aho-Corasick, the automaton is built once and then every occurrence of every pattern is found in one pass over the text,
+        rather than one pass per pattern. works on str or bytes, the text just has to be the same kind as the patterns.
+        matches come out ordered by where they end, longest first when several end at the same spot, overlaps included.
+        >>> mpm = MultiPatternMatcher(['he', 'she', 'his', 'hers'])
+        >>> list(mpm.finditer('ushers'))
+        ... [(1, 1), (2, 0), (2, 3)]  # (offset, pattern id) -> she, he, hers
+
+    Arguments:
+        patterns: Iterable[AnyStr]
+            pattern id is the position in this iterable
+        case_insensitive: bool
+            str patterns and text are lower()-ed, bytes only fold ascii.
+            offsets always point into the original text, even where lower() changes the length (e.g. 'İ' -> 'i̇')
+    '''
+
+    def __init__(self, patterns, case_insensitive=False):
+        # type: (Iterable[AnyStr], bool) -> None
+        self.patterns = list(patterns)  # type: List[Any]
+        self.case_insensitive = case_insensitive
+        kinds = {type(pattern) for pattern in self.patterns}
+        if not kinds <= {str, bytes} or len(kinds) > 1:
+            raise TypeError('patterns must be all str or all bytes, got {}'.format(sorted(kind.__name__ for kind in kinds)))
+        if any(not pattern for pattern in self.patterns):
+            raise ValueError('patterns cannot be empty, got {!r}'.format(self.patterns))
+        self.kind = kinds.pop() if kinds else str  # type: type
+
+        # goto[state] = {char: state}, fail[state] = longest proper suffix state, out[state] = pattern ids ending here (suffixes included)
+        self._goto = [{}]  # type: List[dict]
+        self._fail = [0]
+        self._out = [()]  # type: List[Tuple[int, ...]]
+        self._lengths = [len(self._fold(pattern)) for pattern in self.patterns]
+        for pid, pattern in enumerate(self.patterns):
+            state = 0
+            for char in self._fold(pattern):
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (pid, )
+
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(char, 0)
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def _fold(self, text):
+        # type: (AnyStr) -> AnyStr
+        return text.lower() if self.case_insensitive else text
+
+    def finditer(self, text):
+        # type: (AnyStr) -> Generator[Tuple[int, int], None, None]
+        '''
+        Returns:
+            Generator[Tuple[int, int], None, None]
+                (offset, pattern id)
+        '''
+        if not isinstance(text, self.kind):
+            raise TypeError('patterns are {}, text is {}'.format(self.kind.__name__, type(text).__name__))
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        folded = self._fold(text)
+        if isinstance(text, str) and len(folded) != len(text):
+            # lower() grew some characters, fold one at a time and remember where each folded char came from
+            for offset, pid in self._finditer_shifted(text):
+                yield offset, pid
+            return
+        state = 0
+        for i, char in enumerate(folded):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                for pid in out[state]:
+                    yield i - lengths[pid] + 1, pid
+
+    def _finditer_shifted(self, text):
+        # type: (str) -> Generator[Tuple[int, int], None, None]
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self._lengths
+        origins = deque(maxlen=max(lengths, default=1))  # type: deque
+        state = 0
+        for i, original in enumerate(text):
+            for char in original.lower():
+                origins.append(i)
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+                if out[state]:
+                    for pid in out[state]:
+                        yield origins[-lengths[pid]], pid
+
+    def findall(self, text):
+        # type: (AnyStr) -> List[Tuple[int, int]]
+        return list(self.finditer(text))
+
+    def found(self, text):
+        # type: (AnyStr) -> Set[int]
+        '''
+        Description:
+            pattern ids that occur at least once, stops reading as soon as every pattern has shown up
+        '''
+        found = set()  # type: Set[int]
+        for _, pid in self.finditer(text):
+            found.add(pid)
+            if len(found) == len(self.patterns):
+                break
+        return found
+
+    def search(self, text):
+        # type: (AnyStr) -> bool
+        for _ in self.finditer(text):
+            return True
+        return False
+
+
+# the same boundaries str.splitlines / bytes.splitlines use
+LINE_BREAK_REGEX = re.compile(r'\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+LINE_BREAK_BYTES_REGEX = re.compile(rb'\r\n|[\n\r]')
+
+
+class LineIndex(object):
+    '''
+    Description:
+        offset <-> (lineno, colno) in O(log n), built once per text from the offset every line starts at.
+        lines break wherever splitlines() would break them, lineno and colno are 1-indexed.
+        >>> li = LineIndex('hello\nworld')
+        >>> li.lineno_colno(7)
+        ... (2, 2)
+        >>> li.offset(2, 2)
+        ... 7
+    '''
+
+    def __init__(self, text):
+        # type: (AnyStr) -> None
+        self.text = text  # type: Union[str, bytes]
+        regex = LINE_BREAK_BYTES_REGEX if isinstance(text, bytes) else LINE_BREAK_REGEX
+        self.starts = array.array('q', [0])
+        self.starts.extend(mo.end() for mo in regex.finditer(text))
+
+    def __len__(self):
+        # type: () -> int
+        return len(self.starts)
+
+    def lineno_colno(self, offset):
+        # type: (int) -> Tuple[int, int]
+        if not 0 <= offset <= len(self.text):
+            raise IndexError('offset {} is outside of the text [0, {}]'.format(offset, len(self.text)))
+        lineno = bisect.bisect_right(self.starts, offset)
+        return lineno, offset - self.starts[lineno - 1] + 1
+
+    def offset(self, lineno, colno=1):
+        # type: (int, int) -> int
+        if not 1 <= lineno <= len(self.starts):
+            raise IndexError('lineno {} is outside of the text [1, {}]'.format(lineno, len(self.starts)))
+        return self.starts[lineno - 1] + colno - 1
+
+    def line(self, lineno):
+        # type: (int) -> Union[str, bytes]
+        '''
+        Description:
+            the line without its line break, same as text.splitlines()[lineno - 1], str or bytes like the text
+        '''
+        start = self.offset(lineno)
+        end = self.starts[lineno] if lineno < len(self.starts) else len(self.text)
+        if isinstance(self.text, str):
+            return self.text[start:end].rstrip('\r\n\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029')
+        return self.text[start:end].rstrip(b'\r\n')
+
+
+def _size_multiplier(prefix, iec, si=False):
+    # type: (str, str, bool) -> int
+    if not prefix:
+        return 1
+    return (1000 if si and not iec else 1024)**FILE_SIZE_UNITS[prefix.lower()]
+
+
+def _into_multiplier(into, si=False):
+    # type: (str, bool) -> int
+    mo = SIZE_UNIT_REGEX.match(into.strip())
+    if not mo or not into.strip():
+        raise ValueError('into must be a size unit like b, k, mb, or gib, got {!r}'.format(into))
+    return _size_multiplier(mo.group(1), mo.group(2), si=si)
+
+
+def size_to_bytes(size, into='b', si=False):
+    # type: (Union[str, int, float], str, bool) -> Union[int, float]
     '''
     Description:
         >>> size_to_bytes('512mb') -> 536870912.0
         >>> size_to_bytes('512mb', into='g') -> 0.5
+        >>> size_to_bytes('1.5 GiB') -> 1610612736.0
+        >>> size_to_bytes('1kb', si=True) -> 1000.0
+        >>> size_to_bytes('0x400') -> 1024
+        anything that isnt a number followed by a unit is a ValueError rather than a best guess
     '''
-    into = into.lower()
-    if into[-1] == 's':
-        into = into[0:-1]
-    contains(FILE_SIZE_UNITS, into)
+    divisor = _into_multiplier(into, si=si)
+    if isinstance(size, (int, float)):
+        return size if divisor == 1 else size / divisor
+    mo = SIZE_REGEX.match(size)
+    if not mo:
+        try:
+            num_bytes = int(size.strip(), base=0)
+        except ValueError:
+            raise ValueError('{!r} is not a size like 1024, 1.5g, 512 MiB, or 10kb'.format(size)) from None
+        return num_bytes if divisor == 1 else num_bytes / divisor
+    number, prefix, iec, suffix = mo.groups()
+    if not prefix and not suffix and number.lstrip('+-').isdigit() and divisor == 1:
+        return int(number)
+    return float(number) * _size_multiplier(prefix, iec, si=si) / divisor
+
+
+def _is_ndarray(obj):
+    # type: (Any) -> bool
+    return type(obj).__module__ == 'numpy' and type(obj).__name__ == 'ndarray'
 
-    size = str(size).lower().replace(' ', '')
-    for unit in FILE_SIZE_UNITS:
-        if unit in size:
-            numeric = size.split(unit)[0]
-            num = float(numeric)
-            exponent = FILE_SIZE_UNITS[unit]
-            num_bytes = num * 1024**exponent
-            into_magnitude = (1024**FILE_SIZE_UNITS[into])
-            return num_bytes / into_magnitude
 
-    return int(size, base=0)
+def sizes_to_bytes(sizes, into='b', si=False):
+    # type: (Iterable[Union[str, int, float]], str, bool) -> Any
+    '''
+    Description:
+        size_to_bytes for millions of values, one regex pass over all of them joined rather than one call each.
+        returns array('d') or, given a numpy array, a float64 numpy array.
+        >>> sizes_to_bytes(['1k', '2 MiB', '3']) -> array('d', [1024.0, 2097152.0, 3.0])
+    '''
+    divisor = _into_multiplier(into, si=si)
+    ndarray = _is_ndarray(sizes)
+    if ndarray:
+        numeric = cast(Any, sizes)
+        if numeric.dtype.kind in 'iuf':
+            return numeric.astype('float64') / divisor
+    texts = [str(size) for size in sizes]
+    joined = '\n'.join(texts)
+    matches = SIZE_LINES_REGEX.findall(joined) if joined.count('\n') == len(texts) - 1 else []
+    if len(matches) != len(texts):
+        # something didnt parse (or a value had a newline in it), find out which one the slow way
+        values = array.array('d', [size_to_bytes(size, into=into, si=si) for size in texts])
+    else:
+        multipliers = {}  # type: dict
+        values = array.array('d', bytes(8 * len(matches)))
+        for i, (number, prefix, iec, _) in enumerate(matches):
+            unit = (prefix, iec)
+            multiplier = multipliers.get(unit)
+            if multiplier is None:
+                multiplier = multipliers[unit] = _size_multiplier(prefix, iec, si=si) / divisor
+            values[i] = float(number) * multiplier
+    if ndarray:
+        import numpy  # type: ignore[import-not-found]
+        return numpy.frombuffer(values, dtype='float64').copy()
+    return values
 
 
-def bytes_to_size(size, upper=False):
-    # type: (Union[int, float], bool) -> str
+def bytes_to_size(size, upper=False, si=False):
+    # type: (Union[int, float], bool, bool) -> str
     '''
     # https://github.com/x4nth055/pythoncode-tutorials/blob/master/general/process-monitor/process_monitor.py
     Returns size of bytes in a nice format
     '''
-    units = BYTES_TO_SIZE_UNITS if not upper else [e.upper() for e in BYTES_TO_SIZE_UNITS]
-    for unit in units:
-        if size < 1024:
-            return '{:.2f}{}'.format(size, unit)
-        size /= 1024
-    return ''  # this will never hit
+    exponent = bisect.bisect_right(SIZE_SI_THRESHOLDS if si else SIZE_BYTES_THRESHOLDS, size)
+    unit = BYTES_TO_SIZE_UNITS[exponent]
+    return '{:.2f}{}'.format(size / (1000 if si else 1024)**exponent, unit.upper() if upper else unit)
+
+
+def bytes_to_sizes(sizes, upper=False, si=False):
+    # type: (Iterable[Union[int, float]], bool, bool) -> List[str]
+    '''
+    Description:
+        bytes_to_size for millions of values, the unit of every value is found at once (numpy) or by bisect,
+        and the formatting is one str.format per value.
+        >>> bytes_to_sizes([1, 2048]) -> ['1.00b', '2.00k']
+    '''
+    base = 1000 if si else 1024
+    units = [unit.upper() if upper else unit for unit in BYTES_TO_SIZE_UNITS]
+    if _is_ndarray(sizes):
+        import numpy  # type: ignore[import-not-found]
+        thresholds = numpy.asarray(SIZE_SI_THRESHOLDS if si else SIZE_BYTES_THRESHOLDS, dtype='float64')
+        exponents = numpy.searchsorted(thresholds, sizes, side='right')
+        scaled = sizes / numpy.power(float(base), exponents)
+        return ['{:.2f}{}'.format(value, units[exponent]) for value, exponent in zip(scaled.tolist(), exponents.tolist())]
+    thresholds = SIZE_SI_THRESHOLDS if si else SIZE_BYTES_THRESHOLDS
+    divisors = [base**exponent for exponent in range(len(units))]
+    formatted = []
+    for size in sizes:
+        exponent = bisect.bisect_right(thresholds, size)
+        formatted.append('{:.2f}{}'.format(size / divisors[exponent], units[exponent]))
+    return formatted
 
 
 def strip_unicode(text, encoding='utf-8'):
@@ -108,18 +392,326 @@ def strip_unicode(text, encoding='utf-8'):
     return text.encode(encoding).decode(encoding)
 
 
+def edit_distance(left, right, max_distance=-1):
+    # type: (str, str, int) -> int
+    '''
+    Description:
+        levenshtein distance, if max_distance is given it gives up as soon as the answer is sure to be bigger
+        and returns max_distance + 1 rather than finishing the table.
+        >>> edit_distance('kitten', 'sitting')
+        ... 3
+        >>> edit_distance('kitten', 'sitting', max_distance=1)
+        ... 2
+    '''
+    if left == right:
+        return 0
+    if len(left) < len(right):
+        left, right = right, left
+    if max_distance >= 0 and len(left) - len(right) > max_distance:
+        return max_distance + 1
+    if max_distance < 0:
+        previous = list(range(len(right) + 1))
+        for i, lchar in enumerate(left, 1):
+            current = [i]
+            for j, rchar in enumerate(right, 1):
+                current.append(min(previous[j - 1] + (lchar != rchar), current[j - 1] + 1, previous[j] + 1))
+            previous = current
+        return previous[-1]
+
+    # ukkonen: any cell more than max_distance off the diagonal is already over budget, so only fill the band
+    over = max_distance + 1
+    previous = [j if j <= max_distance else over for j in range(len(right) + 1)]
+    for i, lchar in enumerate(left, 1):
+        current = [over] * (len(right) + 1)
+        if i <= max_distance:
+            current[0] = i
+        best = current[0]
+        for j in range(max(1, i - max_distance), min(len(right), i + max_distance) + 1):
+            value = min(previous[j - 1] + (lchar != right[j - 1]), current[j - 1] + 1, previous[j] + 1, over)
+            current[j] = value
+            if value < best:
+                best = value
+        if best > max_distance:
+            return over
+        previous = current
+    return previous[-1]
+
+
+class _Fuzzy(abc.ABC):
+    '''
+    Description:
+        the query side shared by FuzzyIndex and BKTree, subclasses only have to implement query
+    '''
+    names = []  # type: List[str]
+    case_insensitive = True
+
+    def _fold(self, name):
+        # type: (str) -> str
+        return name.casefold() if self.case_insensitive else name
+
+    @abc.abstractmethod
+    def query(self, name, max_distance=2):
+        # type: (str, int) -> List[Tuple[str, int]]
+        '''
+        Returns:
+            List[Tuple[str, int]]
+                (name, distance) closest first
+        '''
+
+    def did_you_mean(self, name, max_distance=2):
+        # type: (str, int) -> Optional[str]
+        '''
+        Description:
+            the closest known name, None if nothing is within max_distance
+        '''
+        matches = self.query(name, max_distance=max_distance)
+        return matches[0][0] if matches else None
+
+    def top_k(self, name, k=5, max_distance=-1):
+        # type: (str, int, int) -> List[Tuple[str, int]]
+        '''
+        Description:
+            the k closest (name, distance), widening the search one edit at a time until there are enough of them
+        '''
+        limit = max_distance if max_distance >= 0 else max(len(name), max((len(known) for known in self.names), default=0))
+        matches = []  # type: List[Tuple[str, int]]
+        for distance in range(limit + 1):
+            matches = self.query(name, max_distance=distance)
+            if len(matches) >= k:
+                break
+        return matches[:k]
+
+
+class FuzzyIndex(_Fuzzy):
+    '''
+    Description:
+        "did you mean" over lots of names. the query's n-grams pull candidates out of an inverted index,
+        anything within d edits is missing at most n * d of them, so it has to have one of the n * d + 1 rarest,
+        only those candidates (within d in length, containing one of d + 1 pieces of the query) get an actual edit_distance.
+        >>> fi = FuzzyIndex(['run_functions_by_dot_path', 'create_modules_and_tests', 'audit_banned'])
+        >>> fi.did_you_mean('run_function_by_dot_path')
+        ... 'run_functions_by_dot_path'
+    '''
+
+    def __init__(self, names, n=3, case_insensitive=True):
+        # type: (Iterable[str], int, bool) -> None
+        if n < 1:
+            raise ValueError('n must be at least 1, got {}'.format(n))
+        self.names = list(names)
+        self.n = n
+        self.case_insensitive = case_insensitive
+        self.folded = [self._fold(name) for name in self.names]
+        self.postings = {}  # type: Dict[str, List[int]]
+        self.lengths = {}  # type: Dict[int, List[int]]
+        for nid, folded in enumerate(self.folded):
+            self.lengths.setdefault(len(folded), []).append(nid)
+            for gram in set(self._grams(folded)):
+                self.postings.setdefault(gram, []).append(nid)
+
+    def _grams(self, folded):
+        # type: (str) -> List[str]
+        padded = '\x00' * (self.n - 1) + folded + '\x00' * (self.n - 1)
+        return [padded[i:i + self.n] for i in range(len(padded) - self.n + 1)]
+
+    def query(self, name, max_distance=2):
+        # type: (str, int) -> List[Tuple[str, int]]
+        '''
+        Returns:
+            List[Tuple[str, int]]
+                (name, distance) closest first, ties in the order the names were given
+        '''
+        folded = self._fold(name)
+        grams = set(self._grams(folded))
+        need = len(grams) - self.n * max_distance  # each edit can knock out at most n grams
+        if need > 0:
+            # a match is missing at most n * d of the grams, so it has to have at least one of the n * d + 1 rarest,
+            # only those (short) postings are read to find candidates rather than every posting of every gram
+            postings = sorted((self.postings.get(gram, ()) for gram in grams), key=len)
+            candidates = set(itertools.chain.from_iterable(postings[:self.n * max_distance + 1]))  # type: Iterable[int]
+        else:
+            # too many edits allowed for grams to rule anything out, fall back to just the length filter
+            candidates = [nid for length in range(len(folded) - max_distance, len(folded) + max_distance + 1) for nid in self.lengths.get(length, ())]
+        # cut the query into d + 1 pieces, d edits can only touch d of them so a match contains at least one verbatim
+        size = len(folded) // (max_distance + 1)
+        pieces = [folded[i * size:(i + 1) * size] for i in range(max_distance + 1)] if size else ['']
+        matches = []
+        for nid in candidates:
+            known = self.folded[nid]
+            if abs(len(known) - len(folded)) > max_distance or not any(piece in known for piece in pieces):
+                continue
+            distance = edit_distance(folded, known, max_distance=max_distance)
+            if distance <= max_distance:
+                matches.append((distance, nid))
+        return [(self.names[nid], distance) for distance, nid in sorted(matches)]
+
+
+class BKTree(_Fuzzy):
+    '''
+    Description:
+        burkhard-keller tree, every child sits at its edit distance from the parent, so by the triangle inequality
+        a query only has to visit children whose distance is within max_distance of its own distance to the parent.
+        no n-gram tuning and less memory than FuzzyIndex, but visits more nodes as max_distance grows.
+        >>> bk = BKTree(['book', 'books', 'cake', 'boo'])
+        >>> bk.query('bo', max_distance=1)
+        ... [('boo', 1)]
+    '''
+
+    def __init__(self, names, case_insensitive=True):
+        # type: (Iterable[str], bool) -> None
+        self.names = []  # type: List[str]
+        self.case_insensitive = case_insensitive
+        self.root = None  # type: Optional[Tuple[int, str, Dict[int, Any]]]
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        # type: (str) -> None
+        nid = len(self.names)
+        self.names.append(name)
+        folded = self._fold(name)
+        node = (nid, folded, {})  # type: Tuple[int, str, Dict[int, Any]]
+        if self.root is None:
+            self.root = node
+            return
+        parent = self.root
+        while True:
+            distance = edit_distance(folded, parent[1])
+            child = parent[2].get(distance)
+            if child is None:
+                parent[2][distance] = node
+                return
+            parent = child
+
+    def query(self, name, max_distance=2):
+        # type: (str, int) -> List[Tuple[str, int]]
+        folded = self._fold(name)
+        matches = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            nid, known, children = stack.pop()
+            distance = edit_distance(folded, known)
+            if distance <= max_distance:
+                matches.append((distance, nid))
+            for edge in range(max(0, distance - max_distance), distance + max_distance + 1):
+                child = children.get(edge)
+                if child is not None:
+                    stack.append(child)
+        return [(self.names[nid], distance) for distance, nid in sorted(matches)]
+
+
+class CaseInsensitiveIndex(object):
+    '''
+    Description:
+        case-fold a document once, then check it against as many token sets as you like, every answer is remembered.
+        the first build_after distinct tokens are each a plain substring scan of the folded text.
+        past that, the n-gram offsets of the text are built once, and longer tokens are ruled out by their n-grams
+        and only checked where the rarest one occurs, never against the whole text.
+
+        building the n-grams costs about a thousand scans (~2s on 3MB of text, where one scan is ~2ms),
+        so the default only builds it once the index has been asked about a thousand different tokens.
+        for a handful of tokens against a text you see once, contains_insensitive on the str is cheaper.
+        >>> cii = CaseInsensitiveIndex('Hello World, hello Python')
+        >>> cii.contains_all(['HELLO', 'python'])
+        ... True
+        >>> cii.contains_any(['java', 'rust'])
+        ... False
+    '''
+
+    def __init__(self, text, n=3, build_after=1000):
+        # type: (str, int, int) -> None
+        if n < 1:
+            raise ValueError('n must be at least 1, got {}'.format(n))
+        self.n = n
+        self.text = text.casefold()
+        self.build_after = build_after
+        self._positions = None  # type: Optional[Dict[str, array.array]]
+        self._verified = {}  # type: Dict[str, bool]
+
+    @property
+    def positions(self):
+        # type: () -> Dict[str, array.array]
+        '''
+        Description:
+            n-gram -> every offset it starts at, built the first time its asked for
+        '''
+        if self._positions is None:
+            n, text = self.n, self.text
+            positions = {}  # type: Dict[str, array.array]
+            for i in range(len(text) - n + 1):
+                gram = text[i:i + n]
+                offsets = positions.get(gram)
+                if offsets is None:
+                    offsets = positions[gram] = array.array('q')
+                offsets.append(i)
+            self._positions = positions
+        return self._positions
+
+    def __contains__(self, token):
+        # type: (Any) -> bool
+        token = str(token).casefold()
+        if not token:
+            return True
+        verified = self._verified.get(token)
+        if verified is None:
+            if len(token) > self.n and (self._positions is not None or len(self._verified) >= self.build_after):
+                verified = self._verify(token)
+            else:
+                verified = token in self.text
+            self._verified[token] = verified
+        return verified
+
+    def _verify(self, token):
+        # type: (str) -> bool
+        n, positions, text = self.n, self.positions, self.text
+        rarest, skip = None, 0
+        for i in range(len(token) - n + 1):
+            offsets = positions.get(token[i:i + n])
+            if offsets is None:
+                return False
+            if rarest is None or len(offsets) < len(rarest):
+                rarest, skip = offsets, i
+        return any(text.startswith(token, offset - skip) for offset in (rarest or ()) if offset >= skip)
+
+    def _contains(self, token_or_tokens, exc, func):
+        # type: (Union[Any, List[Any]], bool, Callable[[Iterable], bool]) -> bool
+        tokens = token_or_tokens if isinstance(token_or_tokens, list) else [token_or_tokens]
+        if not func(token in self for token in tokens):
+            if not exc:
+                return False
+            raise ValueError('text does not contain {} tokens {}'.format(func.__name__, tokens))
+        return True
+
+    def contains_all(self, token_or_tokens, exc=False):
+        # type: (Union[Any, List[Any]], bool) -> bool
+        return self._contains(token_or_tokens, exc, all)
+
+    def contains_any(self, token_or_tokens, exc=False):
+        # type: (Union[Any, List[Any]], bool) -> bool
+        return self._contains(token_or_tokens, exc, any)
+
+
 def contains_insensitive(text, token_or_tokens, exc=False, func=any):
-    # type: (str, str | list, bool, Callable[[Iterable], bool]) -> bool
+    # type: (str | CaseInsensitiveIndex, str | list, bool, Callable[[Iterable], bool]) -> bool
+    '''
+    Description:
+        checking the same text over and over with many tokens? build a CaseInsensitiveIndex once and pass that instead
+    '''
+    if isinstance(text, CaseInsensitiveIndex):
+        if func is all:
+            return text.contains_all(token_or_tokens, exc=exc)
+        if func is any:
+            return text.contains_any(token_or_tokens, exc=exc)
+        text = text.text  # already folded, folding it again below is a no-op
     raw_tokens = as_list(token_or_tokens)
-    tokens = [str(ele).lower() for ele in raw_tokens]
-    return contains(text, tokens, func=func, exc=exc)
+    tokens = [str(ele).casefold() for ele in raw_tokens]
+    return contains(text.casefold(), tokens, func=func, exc=exc)
 
 
 def contains_all_insensitive(text, token_or_tokens, exc=False):
-    # type: (str, str | list, bool) -> bool
+    # type: (str | CaseInsensitiveIndex, str | list, bool) -> bool
     return contains_insensitive(text, token_or_tokens, exc=exc, func=all)
 
 
 def contains_any_insensitive(text, token_or_tokens, exc=False):
-    # type: (str, str | list, bool) -> bool
+    # type: (str | CaseInsensitiveIndex, str | list, bool) -> bool
     return contains_insensitive(text, token_or_tokens, exc=exc, func=any)
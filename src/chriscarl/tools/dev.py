@@ -9,6 +9,9 @@ Description:
 Tool that is used to do lots of "dev" related things like git pushing, versioning, publishing, templating, conforming, etc.
 
 Updates:
+    2026-10-18 - tools.dev - FIX: audit subcommands hand lazy_usage to usage_factory
+    2026-10-18 - tools.dev - FIX: audit subcommands pass their usage through lazy_usage so add_parser type checks
+    2026-10-18 - tools.dev - audit subcommands render their pydoc usage only when it is shown
     2024-12-28 - tools.dev - adopted logging.configure_ez
     2024-11-29 - tools.dev - added stubs, clean, and test
     2024-11-26 - tools.dev - moved code away from here and into tools.lib.dev
@@ -30,7 +33,6 @@ from __future__ import absolute_import, print_function, division, with_statement
 import os
 import sys
 import re
-import pydoc
 import logging
 from importlib import metadata
 from dataclasses import dataclass, field
@@ -43,7 +45,7 @@ from argparse import _SubParsersAction, ArgumentParser, ArgumentError, Namespace
 import chriscarl
 from chriscarl.core.constants import REPO_DIRPATH, TESTS_DIRPATH, TEMP_DIRPATH
 from chriscarl.core.lib.stdlib.logging import NAME_TO_LEVEL, configure_ez
-from chriscarl.core.lib.stdlib.argparse import ArgparseNiceFormat
+from chriscarl.core.lib.stdlib.argparse import ArgparseNiceFormat, LazyUsageArgumentParser, lazy_usage
 from chriscarl.core.lib.stdlib.os import abspath, chdir
 from chriscarl.core.lib.stdlib.json import read_json
 from chriscarl.core.lib.stdlib.io import read_text_file
@@ -273,34 +275,35 @@ class Audit(Mode):
 
         example_audit_func = 'tdd'
         funcs = mode.add_subparsers(
+            parser_class=LazyUsageArgumentParser,
             help='which func do you want? run "{} {} {} -h" to get help on the {!r} func'.format(SCRIPT_NAME, cls.__name__.lower(), example_audit_func, example_audit_func)
         )
 
-        manifest = funcs.add_parser('manifest', usage=pydoc.render_doc(dev.audit_manifest))
+        manifest = funcs.add_parser('manifest', usage_factory=lazy_usage(dev.audit_manifest))
         manifest.set_defaults(func=dev.audit_manifest)
         Audit.add_common_arguments(manifest)
 
-        relpath = funcs.add_parser('relpath', usage=pydoc.render_doc(dev.audit_relpath))
+        relpath = funcs.add_parser('relpath', usage_factory=lazy_usage(dev.audit_relpath))
         relpath.set_defaults(func=dev.audit_relpath)
         Audit.add_common_arguments(relpath)
 
-        tdd = funcs.add_parser('tdd', usage=pydoc.render_doc(dev.audit_tdd))
+        tdd = funcs.add_parser('tdd', usage_factory=lazy_usage(dev.audit_tdd))
         tdd.set_defaults(func=dev.audit_tdd)
         Audit.add_common_arguments(tdd)
 
-        banned = funcs.add_parser('banned', usage=pydoc.render_doc(dev.audit_banned))
+        banned = funcs.add_parser('banned', usage_factory=lazy_usage(dev.audit_banned))
         banned.set_defaults(func=dev.audit_banned)
         Audit.add_common_arguments(banned)
 
-        stubs = funcs.add_parser('stubs', usage=pydoc.render_doc(dev.audit_stubs))
+        stubs = funcs.add_parser('stubs', usage_factory=lazy_usage(dev.audit_stubs))
         stubs.set_defaults(func=dev.audit_stubs)
         Audit.add_common_arguments(stubs)
 
-        clean = funcs.add_parser('clean', usage=pydoc.render_doc(dev.audit_clean))
+        clean = funcs.add_parser('clean', usage_factory=lazy_usage(dev.audit_clean))
         clean.set_defaults(func=dev.audit_clean)
         Audit.add_common_arguments(clean)
 
-        cov = funcs.add_parser('cov', usage=pydoc.render_doc(dev.audit_cov))
+        cov = funcs.add_parser('cov', usage_factory=lazy_usage(dev.audit_cov))
         cov.set_defaults(func=dev.audit_cov)
         Audit.add_common_arguments(cov)
 
@@ -10,6 +10,11 @@ tools.shed.dev is the "shed" in which all of the "tools" go to pick one up.
 tool are modules that define usually cli tools or mini applets that I or other people may find interesting or useful.
 
 Updates:
+    2026-10-18 - tools.shed.dev - FIX: run_functions_by_dot_path only suggests a name when the AttributeError says which object it came from
+    2026-10-18 - tools.shed.dev - FIX: audit_banned matches filenames case-sensitively again, like before the MultiPatternMatcher pass
+    2026-10-18 - tools.shed.dev - run_functions_by_dot_path suggests the closest function name when one is mispelled
+    2026-10-18 - tools.shed.dev - audit_relpath and audit_banned map offsets to line numbers with LineIndex
+    2026-10-18 - tools.shed.dev - audit_banned matches all words in one MultiPatternMatcher pass per file
     2024-12-20 - tools.shed.dev - audit_banned now includes the filename, lol
     2024-12-11 - tools.shed.dev - audit_stubgen modified to make use of ast analysis and merging
                  tools.shed.dev - added pytest actual results to audit cov
@@ -51,7 +56,7 @@ from chriscarl.core.lib.stdlib.io import read_text_file, write_text_file
 from chriscarl.core.lib.stdlib.json import read_json
 from chriscarl.core.lib.stdlib.os import make_dirpath, abspath, chdir, walk
 from chriscarl.core.lib.stdlib.importlib import walk_dirpath_for_module_files
-from chriscarl.core.lib.stdlib.re import find_lineno_colno
+from chriscarl.core.types.str import MultiPatternMatcher, LineIndex, FuzzyIndex
 from chriscarl.core.lib.stdlib.subprocess import run, launch_editor
 from chriscarl.files import manifest
 
@@ -271,7 +276,10 @@ def run_functions_by_dot_path(root_module, func_names, print_help=False, log_lev
         LOGGER.debug('exception', exc_info=True)
         return 1
     except AttributeError as ae:
-        LOGGER.error('%s, perhaps a mispelled or stale function name %r?', ' '.join(ae.args), ae.name)
+        suggestion = None
+        if hasattr(ae, 'obj'):  # 3.10+, before that the error doesnt say which object it was looked up on
+            suggestion = FuzzyIndex(name for name in dir(ae.obj) if not name.startswith('_')).did_you_mean(ae.name or '')
+        LOGGER.error('%s, perhaps a mispelled or stale function name %r? did you mean %r?', ' '.join(ae.args), ae.name, suggestion)
         LOGGER.debug('exception', exc_info=True)
         return 2
 
@@ -388,9 +396,7 @@ def audit_relpath(dirpath=os.getcwd(), extensions=DEFAULT_EXTENSIONS, included_d
 
                 if replacement != original_preview:
                     LOGGER.debug('replacing %s %r %r', relpath, replacement, original_preview)
-                    lines = contents[:search.end()].splitlines()
-                    lineno = len(lines) + 1
-                    charno = len(lines[-1])  # just a best effort
+                    lineno, charno = LineIndex(contents).lineno_colno(search.start())
                     changes += 1
                     if not dry:
                         LOGGER.info('replacing %s %r -> %r', '{} [line:{}; char:{}]: '.format(basename, lineno, charno), original_preview, replacement_preview)
@@ -504,36 +510,32 @@ def audit_banned(root_dirpath, words, word_case_insensitive=True, extensions=Non
     # type: (str, List[str], bool, Optional[List[str]], Optional[List[str]], Optional[List[str]], bool) -> Dict[str, Dict[str, List[Tuple[int, int]]]]
     findings: Dict[str, Dict[str, List[Tuple[int, int]]]] = {}
     words = sorted(set(words))
+    matcher = MultiPatternMatcher(words, case_insensitive=word_case_insensitive)
     longest = 0
     hit = set()
     for relpath in walk(root_dirpath, extensions=extensions, ignore=ignore, include=include, case_insensitive=file_case_insensitive, relpath=True):
         if len(relpath) > longest:
             longest = len(relpath)
+        file_findings = findings[relpath] = {}
+        for word in words:
+            if word not in relpath:
+                continue
+            hit.add(word)
+            file_findings.setdefault(word, []).append((0, 0))
+            LOGGER.warning('File "%s" itself - %r matched!', relpath, word)
         try:
             contents = read_text_file(abspath(root_dirpath, relpath))
         except UnicodeDecodeError:
             LOGGER.warning('couldnt read file "%s" due to unicode decode error, likely not a real file', relpath)
             LOGGER.debug('exception', exc_info=True)
-        file_findings = findings[relpath] = {}
-        for word in words:
-            if word in relpath:
-                hit.add(word)
-                if word not in file_findings:
-                    file_findings[word] = []
-                file_findings[word].append((0, 0))
-                LOGGER.warning('File "%s" itself - %r matched!', relpath, lineno, colno, word)
-            lineno_colno = list(find_lineno_colno(word, contents, case_insensitive=word_case_insensitive))
-            if lineno_colno:
-                hit.add(word)
-
-            lineno_colno = list(find_lineno_colno(word, contents, case_insensitive=word_case_insensitive))
-            if lineno_colno:
-                hit.add(word)
-                if word not in file_findings:
-                    file_findings[word] = []
-                file_findings[word].extend(lineno_colno)
-                for lineno, colno in lineno_colno:
-                    LOGGER.warning('File "%s", line %d, col %d - %r matched!', relpath, lineno, colno, word)
+            contents = ''
+        line_index = LineIndex(contents)
+        for offset, pid in sorted(matcher.finditer(contents)):
+            word = words[pid]
+            hit.add(word)
+            lineno, colno = line_index.lineno_colno(offset)
+            file_findings.setdefault(word, []).append((lineno, colno))
+            LOGGER.warning('File "%s", line %d, col %d - %r matched!', relpath, lineno, colno, word)
         if not file_findings:
             del findings[relpath]
     hits = sum(len(v) for v in findings.values())
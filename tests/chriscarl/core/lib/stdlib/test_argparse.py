@@ -9,6 +9,9 @@ Description:
 chriscarl.core.lib.stdlib.argparse unit test.
 
 Updates:
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.argparse - usage_factory, giving both usage and usage_factory, a plain parser refuses usage_factory
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.argparse - usage is only rendered for -h or an error, lazy_usage
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.argparse - added LazyUsageArgumentParser test
     2024-11-26 - tests.chriscarl.core.lib.stdlib.argparse - initial commit
 '''
 
@@ -16,8 +19,11 @@ Updates:
 from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
 import os
 import sys
+import io
 import logging
+import argparse
 import unittest
+import contextlib
 
 # third party imports
 
@@ -59,11 +65,83 @@ class TestCase(UnitTest):
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_1_lazy_usage(self):
+        calls = []
+
+        def render():
+            calls.append(1)
+            return 'rendered usage'
+
+        parser = argparse.ArgumentParser(prog='prog')
+        subparsers = parser.add_subparsers(parser_class=lib.LazyUsageArgumentParser)
+        lazy = subparsers.add_parser('lazy', usage_factory=render)
+        plain = subparsers.add_parser('plain', usage='plain usage')
+        variables = [
+            lambda: len(calls),  # nothing rendered just by building the parser
+            lazy.format_usage,
+            lazy.format_usage,
+            lambda: len(calls),  # rendered once
+            plain.format_usage,
+            lambda: subparsers.add_parser('both', usage='plain usage', usage_factory=render),
+            lambda: argparse.ArgumentParser(prog='prog', usage_factory=render),  # a plain parser wont take it
+            lambda: isinstance(lib.lazy_usage(lib.lazy_usage)(), str),
+        ]
+        controls = [
+            0,
+            'usage: rendered usage\n',
+            'usage: rendered usage\n',
+            1,
+            'usage: plain usage\n',
+            ValueError,
+            TypeError,
+            True,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_2_lazy_usage_only_when_shown(self):
+        calls = []
+
+        def render():
+            calls.append(1)
+            return 'rendered usage'
+
+        def parse(argv):
+            parser = argparse.ArgumentParser(prog='prog')
+            subparsers = parser.add_subparsers(parser_class=lib.LazyUsageArgumentParser)
+            lazy = subparsers.add_parser('lazy', usage_factory=render)
+            lazy.add_argument('--count', type=int)
+            documented = subparsers.add_parser('documented', usage_factory=lib.lazy_usage(lib.lazy_usage))
+            del calls[:]
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                try:
+                    parser.parse_args(argv)
+                except SystemExit:
+                    pass
+            return len(calls), documented._usage_factory is not None
+
+        variables = [
+            (parse, (['lazy', '--count', '1'], )),
+            (parse, (['lazy', '-h'], )),
+            (parse, (['lazy', '--count', 'one'], )),  # the subparser errors, so it shows its usage
+            (parse, (['lazy', '--bogus'], )),  # unrecognized arguments are the root parser's error
+            (parse, (['documented', '-h'], )),
+        ]
+        controls = [
+            (0, True),
+            (1, True),
+            (1, True),
+            (0, True),
+            (0, False),
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
 
 if __name__ == '__main__':
     tc = TestCase()
     tc.setUp()
 
     tc.test_case_0()
+    tc.test_case_1_lazy_usage()
+    tc.test_case_2_lazy_usage_only_when_shown()
 
     tc.tearDown()
@@ -9,6 +9,10 @@ Description:
 chriscarl.core.lib.stdlib.inspect unit test.
 
 Updates:
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.inspect - FIX: inspect.stack reference helpers live below TestCase so they dont shift the asserted linenos, frames benchmark only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.inspect - FunctionSpecification hashing, index_module_signatures has no pool, FunctionSpecification benchmark only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.inspect - added FunctionSpecification caching and index_module_signatures tests and benchmark
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.inspect - checked the sys._getframe walk against inspect.stack and benchmarked them
     2024-11-26 - tests.chriscarl.core.lib.stdlib.inspect - initial commit
 '''
 
@@ -16,13 +20,18 @@ Updates:
 from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
 import os
 import sys
+import inspect
 import logging
+import timeit
+import operator
+import dataclasses
 import unittest
+from typing import Any, Optional, List, Tuple
 
 # third party imports
 
 # project imports (expected to work)
-from chriscarl.core.lib.stdlib.unittest import UnitTest
+from chriscarl.core.lib.stdlib.unittest import UnitTest, benchmark
 
 # test imports
 import chriscarl.core.lib.stdlib.inspect as lib
@@ -55,8 +64,8 @@ class TestCase(UnitTest):
             (lib.get_variable_name_lineno, 1089),
         ]
         controls = [
-            ('a', 61),  # since the call occurs on 61
-            ('plz_for_the_love_of_god', 61),  # since the call occurs on 61
+            ('a', 70),  # since the call occurs on 70
+            ('plz_for_the_love_of_god', 70),  # since the call occurs on 70
         ]
         self.assert_null_hypothesis(variables, controls)
 
@@ -121,8 +130,174 @@ class TestCase(UnitTest):
         def run():
             return lib.get_caller_file_lineno()[1]
 
-        self.assertEqual(lib.get_this_file_lineno()[1], 124)
-        self.assertEqual(run(), 125)
+        self.assertEqual(lib.get_this_file_lineno()[1], 133)
+        self.assertEqual(run(), 134)
+
+    def test_case_3_frames_match_inspect_stack(self):
+        marker = object()
+
+        def recurse(depth, func):
+            if depth == 0:
+                return func()
+            return recurse(depth - 1, func)
+
+        for depth in [0, 10, 100]:
+            # both are called from the same line so the linenos they see are the same
+            for stack_frames in [-1, 1, 5]:
+                frames, stack = recurse(
+                    depth, lambda: (
+                        lib.get_variable_names_linenos(marker, stack_frames=stack_frames, ignore_frames=[0, 1]),
+                        stack_variable_names_linenos(marker, stack_frames=stack_frames, ignore_frames=[0, 1]),
+                    )
+                )
+                self.assertEqual(frames, stack)
+            for stack_frames in [1, 3, 10_000]:
+                frames, stack = recurse(depth, lambda: (lib.get_this_file_lineno(stack_frames=stack_frames), stack_this_file_lineno(stack_frames=stack_frames)))
+                self.assertEqual(frames, stack)
+
+    @benchmark
+    def test_case_4_frames_benchmark(self):
+        marker = object()
+
+        def recurse(depth, func):
+            if depth == 0:
+                return timeit.timeit(func, number=number) / number
+            return recurse(depth - 1, func)
+
+        for depth in [10, 50, 100, 500]:
+            number = 100 if depth < 500 else 10
+            seconds = {
+                'get_variable_name_lineno': recurse(depth, lambda: lib.get_variable_name_lineno(marker)),
+                'inspect.stack get_variable_name_lineno': recurse(depth, lambda: stack_variable_names_linenos(marker, ignore_frames=[0, 1])[-1]),
+                'get_caller_file_lineno': recurse(depth, lib.get_caller_file_lineno),
+                'inspect.stack get_caller_file_lineno': recurse(depth, lambda: stack_this_file_lineno(stack_frames=3)),
+            }
+            for label, secs in seconds.items():
+                LOGGER.info('depth %d, %s: %0.6fs', depth, label, secs)
+
+    def test_case_5_FunctionSpecification_cached(self):
+
+        def kwonly(a, b=1, *, c=2):
+            pass
+
+        def make(default):
+
+            def closure(a=default):
+                pass
+
+            return closure
+
+        class Class(object):
+
+            def method(self, a, b=1):
+                pass
+
+        first, second = lib.FunctionSpecification.get(kwonly), lib.FunctionSpecification.get(kwonly)
+        one, two = make(1), make(2)
+        instance = Class()
+        variables = [
+            lambda: first == second,
+            lambda: first.optional is second.optional,  # cached, not rebuilt
+            lambda: dict(first.optional),
+            lambda: kwonly.__kwdefaults__,  # not mutated by get
+            lambda: first.positional,
+            (operator.setitem, (first.optional, 'c', 3)),
+            (setattr, (first, 'name', 'renamed')),
+            lambda: dict(lib.FunctionSpecification.get(one).optional),
+            lambda: dict(lib.FunctionSpecification.get(two).optional),  # same code object, different defaults
+            lambda: lib.FunctionSpecification.get(instance.method).to_invocation_string(),
+            lambda: lib.FunctionSpecification.get(instance.method).func == instance.method,
+            lambda: kwonly.__code__ in lib._SPECIFICATION_CACHE,
+            lambda: hash(first) == hash(second) and len({first, second}) == 1,
+            lambda: lib.FunctionSpecification.get(one) == lib.FunctionSpecification.get(two),  # same code and name, different defaults
+        ]
+        controls = [
+            True,
+            True,
+            {'c': 2, 'b': 1},
+            {'c': 2},
+            ('a', ),
+            TypeError,
+            dataclasses.FrozenInstanceError,
+            {'a': 1},
+            {'a': 2},
+            'method(self, a, b=1)',
+            True,
+            True,
+            True,
+            False,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_6_index_module_signatures(self):
+        import chriscarl.core.lib.stdlib.argparse as argparse_lib
+        package = lib.index_module_signatures('chriscarl.core.lib.stdlib')
+        module = lib.index_module_signatures(lib)
+        variables = [
+            lambda: package['chriscarl.core.lib.stdlib.inspect.get_this_file_lineno'].to_invocation_string(),
+            lambda: package['chriscarl.core.lib.stdlib.inspect.FunctionSpecification.get'].positional,
+            lambda: 'chriscarl.core.lib.stdlib.inspect.invocation_string' in package,  # imported, not defined there
+            lambda: set(module) <= set(package),
+            lambda: all(name.startswith('chriscarl.core.lib.stdlib.inspect.') for name in module),
+            lambda: 'chriscarl.core.lib.stdlib.argparse.LazyUsageArgumentParser.usage' in package,  # properties arent functions
+            lambda: sorted(lib.index_module_signatures(argparse_lib)),
+        ]
+        controls = [
+            'get_this_file_lineno(stack_frames=1)',
+            ('func', ),
+            False,
+            True,
+            True,
+            False,
+            ['chriscarl.core.lib.stdlib.argparse.LazyUsageArgumentParser.__init__', 'chriscarl.core.lib.stdlib.argparse.lazy_usage'],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_7_FunctionSpecification_benchmark(self):
+
+        def func(a, b, *args, c=True, d=False, **kwargs):
+            pass
+
+        def cold():
+            lib._SPECIFICATION_CACHE.clear()
+            return lib.FunctionSpecification.get(func)
+
+        LOGGER.info('FunctionSpecification.get cold: %0.9fs', timeit.timeit(cold, number=10_000) / 10_000)
+        LOGGER.info('FunctionSpecification.get cached: %0.9fs', timeit.timeit(lambda: lib.FunctionSpecification.get(func), number=10_000) / 10_000)
+        seconds = timeit.timeit(lambda: lib.index_module_signatures('chriscarl'), number=5) / 5
+        LOGGER.info('index_module_signatures chriscarl: %0.6fs', seconds)
+
+
+def stack_variable_names_linenos(var, stack_frames=-1, ignore_frames=None):
+    # type: (Any, int, Optional[List[int]]) -> List[Tuple[str, int]]
+    '''
+    the inspect.stack implementation get_variable_names_linenos replaced, kept to check against and benchmark
+    '''
+    name_lineno: List[Tuple[str, int]] = []
+    ignore_frames = ignore_frames or []
+    for i, frame_tuple in enumerate(inspect.stack()):
+        if i in ignore_frames:
+            continue
+        frame = frame_tuple[0]
+        lineno = frame_tuple[2]
+        name_lineno += [(k, lineno) for k, v in frame.f_locals.items() if v is var]
+        if i == stack_frames:
+            break
+    if len(name_lineno) == 0:
+        name_lineno.append(('<anonymous>', -1))
+    return name_lineno
+
+
+def stack_this_file_lineno(stack_frames=1):
+    # type: (int) -> Tuple[str, int]
+    '''
+    the inspect.stack implementation get_this_file_lineno replaced
+    '''
+    for i, frame_tuple in enumerate(inspect.stack()):
+        if i == stack_frames:
+            return os.path.relpath(frame_tuple[1], os.getcwd()), frame_tuple[2]
+    return '', -1
 
 
 if __name__ == '__main__':
@@ -132,5 +307,10 @@ if __name__ == '__main__':
     tc.test_case_0_get_variable_names_linenos()
     tc.test_case_1_FunctionSpecification()
     tc.test_case_2_linenos()
+    tc.test_case_3_frames_match_inspect_stack()
+    tc.test_case_4_frames_benchmark()
+    tc.test_case_5_FunctionSpecification_cached()
+    tc.test_case_6_index_module_signatures()
+    tc.test_case_7_FunctionSpecification_benchmark()
 
     tc.tearDown()
@@ -9,6 +9,8 @@ Description:
 chriscarl.core.lib.stdlib.io unit test.
 
 Updates:
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.io - transcode benchmark only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.io - added transcoding tests and benchmark
     2024-11-26 - tests.chriscarl.core.lib.stdlib.io - initial commit
 '''
 
@@ -17,6 +19,9 @@ from __future__ import absolute_import, print_function, division, with_statement
 import os
 import sys
 import logging
+import timeit
+import tracemalloc
+import unicodedata
 import unittest
 
 # third party imports
@@ -24,7 +29,7 @@ import unittest
 # project imports (expected to work)
 from chriscarl.core.constants import TEST_COLLATERAL_DIRPATH
 from chriscarl.core.lib.stdlib.os import abspath
-from chriscarl.core.lib.stdlib.unittest import UnitTest
+from chriscarl.core.lib.stdlib.unittest import UnitTest, benchmark
 
 # test imports
 import chriscarl.core.lib.stdlib.io as lib
@@ -63,11 +68,56 @@ class TestCase(UnitTest):
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_1_transcode(self):
+        text = 'café ｶﾞ e\u0301 한국어 \u1100\u1161\u11a8\n' * 50
+        src = abspath(self.tempdir, 'src.txt')
+        dst = abspath(self.tempdir, 'dst.txt')
+        lib.write_bytes_file(src, text.encode('utf-16'))
+        chunks = lambda data, n: [data[i:i + n] for i in range(0, len(data), n)]
+        encoded = text.encode('utf-8')
+        variables = [
+            lambda: [''.join(lib.iter_transcode(chunks(encoded, n), normalize=form)) == unicodedata.normalize(form, text) for n in [1, 2, 3, 7] for form in lib.NORMALIZATION_FORMS],
+            lambda: ''.join(lib.iter_transcode([b'\xffab', b'c\xe2\x82', b'\xac'], errors='replace')),
+            lambda: ''.join(lib.iter_transcode([b'ab'], transform=str.upper)),
+            lambda: lib.transcode_file(src, dst, src_encoding='utf-16', normalize='NFKC', chunk_size=5)[0] == len(text.encode('utf-16')),
+            lambda: lib.read_text_file(dst) == unicodedata.normalize('NFKC', text),
+            lambda: list(lib.iter_transcode([b'\xff'])),
+            lambda: list(lib.iter_transcode([b'a'], normalize='NFX')),
+        ]
+        controls = [
+            [True] * 16,
+            '\ufffdabc\u20ac',
+            'AB',
+            True,
+            True,
+            UnicodeDecodeError,
+            ValueError,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_2_transcode_benchmark(self):
+        src = abspath(self.tempdir, 'src.txt')
+        dst = abspath(self.tempdir, 'dst.txt')
+        line = 'the quick brown fox ｶﾞ café e\u0301 한국어\n'
+        lines = 200_000
+        lib.write_text_file(src, line * lines)
+        size = os.path.getsize(src)
+        for normalize in [None, 'NFC', 'NFKC']:
+            tracemalloc.start()
+            elapsed = timeit.timeit(lambda: lib.transcode_file(src, dst, normalize=normalize, chunk_size=1 << 16), number=1)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            LOGGER.info('transcode %0.1f MB normalize=%s: %0.1f MB/s, peak %0.1f KB', size / 2**20, normalize, size / 2**20 / elapsed, peak / 2**10)
+            self.assertLess(peak, size / 4)
+
 
 if __name__ == '__main__':
     tc = TestCase()
     tc.setUp()
 
     tc.test_case_0_unicode_throw()
+    tc.test_case_1_transcode()
+    tc.test_case_2_transcode_benchmark()
 
     tc.tearDown()
@@ -9,6 +9,9 @@ Description:
 chriscarl.core.lib.stdlib.json unit test.
 
 Updates:
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.json - LazyJSON on empty input, non-ascii compatible encodings, and truncated documents
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.json - LazyJSON lookups only remember what they touched
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.json - added LazyJSON and read_json_lazy tests
     2024-11-26 - tests.chriscarl.core.lib.stdlib.json - initial commit
 '''
 
@@ -87,6 +90,108 @@ class TestCase(UnitTest):
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_2_lazy_json(self):
+        tricky = {'a': {'b': [1, {'c': 'x]}{\\"'}, None], 'd': 1.5e3}, 'e': [], '0': True}
+        lib.write_json(self.tempfile, tricky)
+        lazy = lib.read_json_lazy(self.tempfile)
+        compact = lib.LazyJSON(lib.dict_to_string(tricky, indent=None).encode('utf-8'))
+        variables = [
+            (lazy.get, 'a.b.1.c'),
+            (lazy.get, 'a.b.-1'),
+            (lazy.get, 'a.d'),
+            (lazy.get, 'e'),
+            (lazy.get, '0'),
+            (lazy.get, ''),
+            (lazy.keys, 'a'),
+            (lazy.keys, 'a.b'),
+            (lazy.get, 'a.b.9'),
+            (lazy.get, 'a.d.x'),
+            (lazy.get, 'nope', dict(default=None)),
+            (compact.get, 'a.b.1'),
+            (lib.LazyJSON(b'{"a": [1, 2}').get, 'a'),
+        ]
+        controls = [
+            tricky['a']['b'][1]['c'],
+            None,
+            1500.0,
+            [],
+            True,
+            tricky,
+            ['b', 'd'],
+            [0, 1, 2],
+            KeyError,
+            KeyError,
+            None,
+            tricky['a']['b'][1],
+            ValueError,
+        ]
+        try:
+            self.assert_null_hypothesis(variables, controls)
+        finally:
+            lazy.close()
+
+    def test_case_3_lazy_json_bounded(self):
+        records = [{'i': i, 'tags': ['x', 'y']} for i in range(100_000)]
+        lazy = lib.LazyJSON(lib.dict_to_string({'records': records, 'after': 1}, indent=None).encode('utf-8'))
+        near = lazy.get('records.5')
+        remembered = (len(lazy._members), sum(len(ck) for ck in lazy._checkpoints.values()), len(lazy._lengths))
+        variables = [
+            lambda: near,
+            lambda: remembered,  # the root object, one checkpoint, and the length was never needed
+            (lazy.get, 'records.1000'),
+            (lazy.get, 'records.300.i'),
+            (lazy.get, 'records.-1.i'),
+            lambda: len(lazy.keys('records')),
+            lambda: sum(len(ck) for ck in lazy._checkpoints.values()),  # every ARRAY_CHECKPOINT-th member once the whole array was scanned
+            (lazy.get, 'records.99999.i'),
+            (lazy.get, 'records.100000'),
+            (lazy.get, 'records.-100001'),
+            (lazy.get, 'records.x'),
+            (lazy.get, 'after'),
+        ]
+        controls = [
+            records[5],
+            (1, 1, 0),
+            records[1000],
+            300,
+            99_999,
+            100_000,
+            -(-100_000 // lib.ARRAY_CHECKPOINT),
+            99_999,
+            KeyError,
+            KeyError,
+            KeyError,
+            1,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_4_lazy_json_empty_and_encodings(self):
+        with open(self.tempfile, 'wb'):
+            pass  # an empty file
+        variables = [
+            (lib.LazyJSON, (b'', )),
+            (lib.LazyJSON, (b' \r\n\t', )),
+            (lib.read_json_lazy, (self.tempfile, )),
+            (lib.LazyJSON, ('{"a": 1}'.encode('utf-16'), 'utf-16')),
+            (lib.LazyJSON, ('{"a": 1}'.encode('utf-32-le'), 'utf-32-le')),
+            lambda: lib.LazyJSON('{"a": "\u00e9"}'.encode('latin-1'), encoding='latin-1').get('a'),
+            lambda: lib.LazyJSON(b'{"a": 1, ').get('b'),
+            lambda: lib.LazyJSON(b'{"a": [1, 2').get('a.5'),
+            lambda: lib.LazyJSON(b'{"a": ').get('a'),
+        ]
+        controls = [
+            ValueError,
+            ValueError,
+            ValueError,
+            ValueError,
+            ValueError,
+            '\u00e9',
+            ValueError,  # truncated, not a missing key
+            ValueError,
+            ValueError,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
 
 if __name__ == '__main__':
     tc = TestCase()
@@ -94,5 +199,8 @@ if __name__ == '__main__':
 
     tc.test_case_0_write_read()
     tc.test_case_1_dict_to_string()
+    tc.test_case_2_lazy_json()
+    tc.test_case_3_lazy_json_bounded()
+    tc.test_case_4_lazy_json_empty_and_encodings()
 
     tc.tearDown()
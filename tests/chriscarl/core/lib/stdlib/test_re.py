@@ -9,6 +9,9 @@ Description:
 chriscarl.core.lib.stdlib.re unit test.
 
 Updates:
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.re - $, ^, trailing breaks, and matches that would cross a line agree for LF and CRLF
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.re - CRLF and other breaks keep the line by line $ semantics
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.re - added whole text find_lineno_colno tests
     2024-11-27 - tests.chriscarl.core.lib.stdlib.re - initial commit
 '''
 
@@ -24,6 +27,7 @@ import logging
 from chriscarl.core.lib.stdlib.unittest import UnitTest
 
 # test imports
+from chriscarl.core.types.str import LineIndex
 import chriscarl.core.lib.stdlib.re as lib
 
 SCRIPT_RELPATH = 'tests/chriscarl/core/lib/stdlib/test_re.py'
@@ -90,6 +94,58 @@ HELLO WORLD'''
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_2_find_lineno_colno_whole_text(self):
+        doc = 'alpha\r\nbeta\n\ngamma beta'
+        line_index = LineIndex(doc)
+        variables = [
+            (lib.find_lineno_colno, ('beta', doc), dict(line_index=line_index)),
+            (lib.find_lineno_colno, ('^g', doc)),
+            (lib.find_lineno_colno, ('a$', doc)),
+            (lib.find_lineno_colno, ('zeta', doc)),
+            (lib.find_lineno_colno, ('a$', doc.replace('\r\n', '\n'))),
+            (lib.find_lineno_colno, ('a\nb', doc.replace('\r\n', '\n'))),
+            (lib.find_lineno_colno, ('a$', 'alpha\rbeta\x0bgamma')),
+        ]
+        controls = [
+            [(2, 1), (4, 7)],
+            [(4, 1)],
+            [(1, 5), (2, 4), (4, 10)],  # \r\n still ends a line for $, same as the old line by line search
+            [],
+            [(1, 5), (2, 4), (4, 10)],
+            [],  # nothing matches across a line break
+            [(1, 5), (2, 4), (3, 5)],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_3_find_lineno_colno_line_edges(self):
+        variables = [
+            (lib.find_lineno_colno, ('$', 'a\nb\n')),
+            (lib.find_lineno_colno, ('$', 'a\r\nb\r\n')),
+            (lib.find_lineno_colno, ('^', 'a\nb\n')),
+            (lib.find_lineno_colno, ('^', 'a\r\nb\r\n')),
+            (lib.find_lineno_colno, ('$', 'a\nb')),
+            (lib.find_lineno_colno, ('^', '')),
+            (lib.find_lineno_colno, ('^$', 'a\n\nb\n')),
+            (lib.find_lineno_colno, ('a\\s+b', 'a \nb a  b')),
+            (lib.find_lineno_colno, ('a\\s+b', 'a \r\nb a  b')),
+            (lib.find_lineno_colno, ('a\\s*', 'xa\nya')),  # the greedy \s* cant take the break with it
+            (lib.find_lineno_colno, ('a\\s*', 'xa\r\nya')),
+        ]
+        controls = [
+            [(1, 2), (2, 2)],
+            [(1, 2), (2, 2)],
+            [(1, 1), (2, 1)],
+            [(1, 1), (2, 1)],
+            [(1, 2), (2, 2)],
+            [],
+            [(2, 1)],
+            [(2, 3)],
+            [(2, 3)],
+            [(1, 2), (2, 2)],
+            [(1, 2), (2, 2)],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
 
 if __name__ == '__main__':
     tc = TestCase()
@@ -97,5 +153,7 @@ if __name__ == '__main__':
 
     tc.test_case_0_find_index()
     tc.test_case_1_find_lineno_colno()
+    tc.test_case_2_find_lineno_colno_whole_text()
+    tc.test_case_3_find_lineno_colno_line_edges()
 
     tc.tearDown()
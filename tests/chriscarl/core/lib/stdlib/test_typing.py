@@ -9,6 +9,13 @@ Description:
 chriscarl.core.lib.stdlib.typing unit test.
 
 Updates:
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.typing - validation level benchmark only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.typing - validation policy timings only run with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.typing - compile_validator benchmark only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.typing - sample(n) only touches n + 2 elements of a big dict, set, or list
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.typing - added validation level and counter tests and benchmark
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.typing - added validation policy tests and benchmark
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.typing - added compile_validator tests and benchmark
     2024-11-23 - tests.chriscarl.core.lib.stdlib.typing - initial commit
 '''
 
@@ -18,13 +25,14 @@ import os
 import sys
 import typing
 import logging
+import timeit
 import unittest
 from types import ModuleType
 
 # third party imports
 
 # project imports (expected to work)
-from chriscarl.core.lib.stdlib.unittest import UnitTest
+from chriscarl.core.lib.stdlib.unittest import UnitTest, benchmark
 
 # test imports
 import chriscarl.core.lib.stdlib.typing as lib
@@ -200,6 +208,276 @@ class TestCase(UnitTest):
         with mod.Mod():
             pass
 
+    def test_case_7_compile_validator(self):
+        records = typing.List[typing.Dict[str, typing.Union[int, float]]]
+        variables = [
+            lambda: lib.compile_validator(records) is lib.compile_validator(records),
+            lambda: lib.compile_validator(records)([{'a': 1}, {'b': 2.0}]),
+            lambda: lib.compile_validator(records)([{'a': 1}, {'b': '2'}]),
+            lambda: lib.compile_validator([int, str])('a'),
+            lambda: lib.compile_validator(typing.List[typing.Optional[int]])([1, None]),
+            lambda: lib.compile_validator(typing.Set[typing.Any])({1, 'a'}),
+            (lib.isof, (1, typing.Literal[1, 2])),
+            (lib.isof, (3, typing.Literal[1, 2])),
+            (lib.isof, ([self.list], typing.List[typing.Tuple[int, int]])),
+            (lib.isof, (self.generate_vargs_vkwargs, typing.Generator)),
+            (lib.isof, ([1], typing.Iterable[int])),
+        ]
+        controls = [
+            True,
+            True,
+            False,
+            True,
+            True,
+            True,
+            True,
+            False,
+            False,
+            RuntimeError,
+            NotImplementedError,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_8_compile_validator_benchmark(self):
+        records = typing.List[typing.Dict[str, typing.Union[int, float]]]
+        data = [{'k{}'.format(j): j if j % 2 else float(j) for j in range(10)} for _ in range(10_000)]
+        ints = list(range(1_000_000))
+        by_hand = lambda: isinstance(data, list) and all(isinstance(d, dict) and all(isinstance(k, str) and isinstance(v, (int, float)) for k, v in d.items()) for d in data)
+        for label, obj, typ, number in [('records', data, records, 10), ('ints', ints, typing.List[int], 10), ('tuple', (1, 'a'), typing.Tuple[int, str], 10_000)]:
+            compiled = timeit.timeit(lambda: lib.isof(obj, typ), number=number) / number
+            cold = timeit.timeit(lambda: lib._compile_cached.cache_clear() or lib.isof(obj, typ), number=number) / number
+            LOGGER.info('%s %s: isof %0.6fs, isof with a cold cache %0.6fs', label, typ, compiled, cold)
+        LOGGER.info('records written by hand: %0.6fs', timeit.timeit(by_hand, number=10) / 10)
+
+    def test_case_9_validation_policy(self):
+        bad_middle = [1] * 1000
+        bad_middle[500] = 'a'
+        bad_end = [1] * 1000 + ['a']
+        nested = [[1, 2], ['a']]
+        variables = [
+            (lib.isof, (bad_middle, typing.List[int]), dict(policy=lib.FULL)),
+            (lib.isof, (bad_middle, typing.List[int]), dict(policy=lib.SHALLOW)),
+            (lib.isof, (bad_end, typing.List[int]), dict(policy=lib.sample(0))),
+            (lib.isof, ([1, 2, 'a'], typing.List[int]), dict(policy=lib.sample(5))),
+            (lib.isof, ({'a': 1, 'b': 'c'}, typing.Dict[str, int]), dict(policy=lib.sample(5))),
+            (lib.isof, ({'a': 1, 'b': 'c'}, typing.Dict[str, int]), dict(policy=lib.SHALLOW)),
+            (lib.isof, ((1, 'a'), typing.Tuple[int, int]), dict(policy=lib.SHALLOW)),
+            (lib.isof, ((1, 2, 3), typing.Tuple[int, int]), dict(policy=lib.SHALLOW)),
+            (lib.isof, (nested, typing.List[typing.List[int]]), dict(policy=lib.sample(5))),
+            (lib.isof, ((1, 2), typing.List[int]), dict(policy=lib.SHALLOW)),
+            (lib.ValidationPolicy, ('partial', )),
+            (lib.sample, (-1, )),
+        ]
+        controls = [
+            False,
+            True,
+            False,
+            False,
+            False,
+            True,
+            True,
+            False,
+            False,
+            False,
+            ValueError,
+            ValueError,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_10_validation_policy_scopes(self):
+        bad_middle = [1] * 1000
+        bad_middle[500] = 'a'
+        small_bad = [1, 'a']
+
+        def within(obj, **kwargs):
+            with lib.validation_policy(**kwargs):
+                return lib.isof(obj, typing.List[int])
+
+        def globally(obj, **kwargs):
+            previous = lib.set_validation_policy(**kwargs)
+            try:
+                return lib.isof(obj, typing.List[int])
+            finally:
+                lib.set_validation_policy(previous.policy, previous.large, previous.threshold)
+
+        variables = [
+            (within, (bad_middle, ), dict(policy=lib.SHALLOW)),
+            (within, (bad_middle, ), dict(large=lib.SHALLOW, threshold=100)),
+            (within, (small_bad, ), dict(large=lib.SHALLOW, threshold=100)),
+            (within, (bad_middle, ), dict(large=lib.SHALLOW, threshold=1000)),
+            (globally, (bad_middle, ), dict(policy=lib.SHALLOW)),
+            (globally, (bad_middle, ), dict(large=lib.SHALLOW, threshold=10)),
+            (lambda: lib.isof(bad_middle, typing.List[int]), ()),  # everything was put back
+            (lambda: lib.get_validation_settings() == lib.ValidationSettings(), ()),
+        ]
+        controls = [
+            True,
+            True,
+            False,
+            False,
+            True,
+            True,
+            False,
+            True,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_11_validation_policy_benchmark(self):
+        ints = list(range(1_000_000))
+        records = [{'k{}'.format(j): j for j in range(10)} for _ in range(100_000)]
+        for label, obj, typ in [('ints', ints, typing.List[int]), ('records', records, typing.List[typing.Dict[str, int]])]:
+            for policy in [lib.FULL, lib.sample(100), lib.SHALLOW]:
+                seconds = timeit.timeit(lambda: lib.isof(obj, typ, policy=policy), number=10) / 10
+                LOGGER.info('%s %s with %s: %0.6fs', label, typ, policy, seconds)
+
+    def test_case_12_validation_level(self):
+        this_module = __name__
+
+        def check(obj, level=None, module=this_module):
+            previous = lib.set_validation_level(level, module=module)
+            try:
+                return lib.isinstance_raise(obj, int)
+            finally:
+                lib.set_validation_level(previous, module=module)
+
+        def message(obj, level):
+            previous = lib.set_validation_level(level, module=this_module)
+            try:
+                lib.isinstance_raise(obj, int)
+            except TypeError as te:
+                return str(te)
+            finally:
+                lib.set_validation_level(previous, module=this_module)
+
+        bad_value = 'a'
+        variables = [
+            (check, (1, 'fast')),
+            (check, (bad_value, 'fast')),
+            (check, (bad_value, 'debug')),
+            (check, (bad_value, 'off')),
+            (check, (bad_value, 'off', this_module.rpartition('.')[0])),  # a parent package counts
+            (check, (bad_value, 'off', this_module + '_not')),  # but not a sibling with a similar name
+            (message, (bad_value, 'fast')),
+            (message, (bad_value, 'debug')),
+            (lib.set_validation_level, ('loud', )),
+            (lib.parse_validation_level, ('fast, chriscarl.core=debug , chriscarl.core.lib.stdlib.ast=OFF', )),
+            (lib.parse_validation_level, ('', )),
+            (lib.parse_validation_level, ('chriscarl=loud', )),
+            (lib.get_validation_level, (this_module, )),
+        ]
+        controls = [
+            True,
+            TypeError,
+            TypeError,
+            True,
+            True,
+            TypeError,
+            "provided <class 'str'> for 'obj', requires: <class 'int'>",
+            "provided <class 'str'> for 'bad_value', requires: <class 'int'>",
+            ValueError,
+            ('fast', {'chriscarl.core': 'debug', 'chriscarl.core.lib.stdlib.ast': 'off'}),
+            (None, {}),
+            ValueError,
+            'fast',
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_13_validation_counters(self):
+        lib.reset_validation_counters()
+        for i in range(10):
+            lib.isinstance_raise(i, int)
+        for i in range(3):
+            try:
+                lib.isinstance_raise(str(i), int)
+            except TypeError:
+                pass
+        previous = lib.set_validation_level('off', module=__name__)
+        try:
+            lib.isinstance_raise('off', int)
+        finally:
+            lib.set_validation_level(previous, module=__name__)
+        counters = lib.get_validation_counters()
+        hotspots = lib.validation_hotspots(n=-1)
+        variables = [
+            lambda: len(counters),
+            lambda: sorted((counter.calls, counter.failures) for counter in counters.values()),
+            lambda: all(module == __name__ for module, _ in counters),
+            lambda: hotspots[0][1].seconds >= hotspots[1][1].seconds,
+            lambda: len(lib.validation_hotspots(n=1)),
+            lambda: lib.reset_validation_counters() or lib.get_validation_counters(),
+        ]
+        controls = [
+            2,
+            [(3, 3), (10, 0)],
+            True,
+            True,
+            1,
+            {},
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_14_validation_level_benchmark(self):
+        this_module = __name__
+        records = [{'a': 1}] * 10
+        for level, number in zip(lib.VALIDATION_LEVELS, [10_000, 10_000, 100]):
+            previous = lib.set_validation_level(level, module=this_module)
+            try:
+                seconds = timeit.timeit(lambda: lib.isinstance_raise(records, typing.List[typing.Dict[str, int]]), number=number) / number
+            finally:
+                lib.set_validation_level(previous, module=this_module)
+            LOGGER.info('isinstance_raise at %s: %0.9fs', level, seconds)
+        lib.reset_validation_counters()
+
+    def test_case_15_validation_policy_sample_bounded(self):
+        touched = []
+
+        class Touch(object):
+
+            def __eq__(self, other):
+                touched.append(self)
+                return other == 1
+
+            __hash__ = object.__hash__
+
+        size = 20_000
+        as_dict = {str(i): Touch() for i in range(size)}
+        as_set = set(as_dict.values())
+        as_list = list(as_dict.values())
+        one = typing.Literal[1]
+
+        def count(obj, typ, policy):
+            touched.clear()
+            valid = lib.isof(obj, typ, policy=policy)
+            return valid, len(touched)
+
+        variables = [
+            (count, (as_dict, typing.Dict[str, one], lib.sample(10))),
+            (count, (as_set, typing.Set[one], lib.sample(10))),
+            (count, (as_list, typing.List[one], lib.sample(10))),
+            (count, ({'a': Touch(), 'b': Touch()}, typing.Dict[str, one], lib.sample(10))),
+            (count, (as_set, typing.Set[one], lib.FULL)),
+            (lambda: lib.isof({'a': 1, 'b': 'x'}, typing.Dict[str, int], policy=lib.sample(0)), ()),  # the last is always looked at
+        ]
+        controls = [
+            (True, 12),
+            (True, 12),
+            (True, 12),
+            (True, 2),
+            (True, size),
+            False,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_16_validation_policy_sample_benchmark(self):
+        big = {i: i for i in range(2_000_000)}
+        for policy in [lib.FULL, lib.sample(100)]:
+            seconds = timeit.timeit(lambda: lib.isof(big, typing.Dict[int, int], policy=policy), number=5) / 5
+            LOGGER.info('%d item dict with %s: %0.6fs', len(big), policy, seconds)
+
 
 if __name__ == '__main__':
     tc = TestCase()
@@ -212,5 +490,15 @@ if __name__ == '__main__':
     tc.test_case_4_hard_true()
     tc.test_case_5_hard_false()
     tc.test_case_6_mod()
+    tc.test_case_7_compile_validator()
+    tc.test_case_8_compile_validator_benchmark()
+    tc.test_case_9_validation_policy()
+    tc.test_case_10_validation_policy_scopes()
+    tc.test_case_11_validation_policy_benchmark()
+    tc.test_case_12_validation_level()
+    tc.test_case_13_validation_counters()
+    tc.test_case_14_validation_level_benchmark()
+    tc.test_case_15_validation_policy_sample_bounded()
+    tc.test_case_16_validation_policy_sample_benchmark()
 
     tc.tearDown()
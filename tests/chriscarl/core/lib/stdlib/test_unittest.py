@@ -9,6 +9,7 @@ Description:
 chriscarl.core.lib.stdlib.unittest unit test.
 
 Updates:
+    2026-10-18 - tests.chriscarl.core.lib.stdlib.unittest - benchmark skips unless CHRISCARL_BENCHMARK is set
     2024-11-23 - tests.chriscarl.core.lib.stdlib.unittest - initial commit
 '''
 
@@ -106,6 +107,30 @@ class TestCase(UnitTest):
         ]
         self.assertRaises(AssertionError, lib.UnitTest.assert_null_hypothesis, good_assertion_variables, good_assertion_controls)
 
+    def test_case_3_benchmark(self):
+
+        def timed():
+            return 1
+
+        previous = os.environ.pop(lib.BENCHMARK_ENV, None)
+        try:
+            skipped = lib.benchmark(timed)
+            os.environ[lib.BENCHMARK_ENV] = '1'
+            ran = lib.benchmark(timed)
+        finally:
+            os.environ.pop(lib.BENCHMARK_ENV, None)
+            if previous is not None:
+                os.environ[lib.BENCHMARK_ENV] = previous
+        variables = [
+            skipped,
+            ran,
+        ]
+        controls = [
+            unittest.SkipTest,
+            1,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
 
 if __name__ == '__main__':
     tc = TestCase()
@@ -114,5 +139,6 @@ if __name__ == '__main__':
     tc.test_case_0_assert_null_hypothesis()
     tc.test_case_1_assert_subset()
     tc.test_case_2_infrastructure()
+    tc.test_case_3_benchmark()
 
     tc.tearDown()
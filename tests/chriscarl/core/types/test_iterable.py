@@ -9,6 +9,22 @@ Description:
 chriscarl.core.types.iterable unit test.
 
 Updates:
+    2026-10-18 - tests.chriscarl.core.types.iterable - contains benchmark only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.types.iterable - walk benchmark only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.types.iterable - diff_iterable reuses a fingerprinter across diffs and keeps up with a naive diff
+    2026-10-18 - tests.chriscarl.core.types.iterable - Fingerprinter.cached and forget
+    2026-10-18 - tests.chriscarl.core.types.iterable - Fingerprinter rejects self-referential containers, diff / patch round-trips
+    2026-10-18 - tests.chriscarl.core.types.iterable - added flatten_records dtype test
+    2026-10-18 - tests.chriscarl.core.types.iterable - added contains_many tests and benchmark
+    2026-10-18 - tests.chriscarl.core.types.iterable - added infer_schema and merge_schemas tests
+    2026-10-18 - tests.chriscarl.core.types.iterable - added query and QueryIndex tests
+    2026-10-18 - tests.chriscarl.core.types.iterable - added walk tests and benchmark
+    2026-10-18 - tests.chriscarl.core.types.iterable - added diff_iterable and patch_iterable tests
+    2026-10-18 - tests.chriscarl.core.types.iterable - added fingerprint tests
+    2026-10-18 - tests.chriscarl.core.types.iterable - added flatten_records and unflatten_records tests
+    2026-10-18 - tests.chriscarl.core.types.iterable - added unflatten_stream tests
+    2026-10-18 - tests.chriscarl.core.types.iterable - added iter_flatten tests
+    2026-10-18 - tests.chriscarl.core.types.iterable - added compile_key, get_many, get_column tests
     2024-12-09 - tests.chriscarl.core.types.iterable - initial commit
 '''
 
@@ -16,15 +32,21 @@ Updates:
 from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
 import os
 import sys
+import copy
+import timeit
 import logging
 import unittest
 
 # third party imports
+try:
+    import numpy  # type: ignore[import-not-found]
+except ImportError:
+    numpy = None
 
 # project imports (expected to work)
 from chriscarl.core.constants import TEST_COLLATERAL_DIRPATH
 from chriscarl.core.lib.stdlib.os import abspath
-from chriscarl.core.lib.stdlib.unittest import UnitTest
+from chriscarl.core.lib.stdlib.unittest import UnitTest, benchmark
 
 # test imports
 import chriscarl.core.types.iterable as lib
@@ -214,6 +236,489 @@ class TestCase(UnitTest):
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_4_compile_key(self):
+        records = [NESTED_NESTED_DICT, {'f': {'g': {'h': 'j'}}}, {'f': {}}]
+        variables = [
+            (lambda: lib.compile_key('f.g.h').tokens),
+            (lambda: lib.compile_key('1.0x10.-1').tokens),
+            (lambda: lib.compile_key('f.g.h') is lib.compile_key('f.g.h')),
+            (lib.get, (lib.compile_key('f.g.h'), NESTED_NESTED_DICT)),
+            (lib.get, ('6.0', NESTED_DICT)),
+            (lib.get_many, (['a', 'c.d', 'f.g.h'], NESTED_NESTED_DICT)),
+            (lib.get_many, (['a', 'c.z'], NESTED_NESTED_DICT)),
+            (lib.get_many, (['a', 'c.z'], NESTED_NESTED_DICT), dict(default=None)),
+            (lib.get_column, ('f.g.h', records), dict(default=None)),
+            (lib.get_column, ('f.g.h', records)),
+        ]
+        controls = [
+            ('f', 'g', 'h'),
+            (1, 16, -1),
+            True,
+            'i',
+            list(NESTED_DICT[6])[0],
+            ['b', 'e', 'i'],
+            KeyError,
+            ['b', None],
+            ['i', 'j', None],
+            KeyError,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_5_iter_flatten(self):
+        deep = leaf = {}  # type: dict
+        for _ in range(sys.getrecursionlimit() * 2):
+            leaf['k'] = {}
+            leaf = leaf['k']
+        leaf['k'] = 'bottom'
+
+        variables = [
+            (lib.iter_flatten, 1),
+            (lib.iter_flatten, {'a': 0, 'b': [1, {'c': []}]}),
+            (lib.iter_flatten, [{}, (2, )], dict(prepend='p')),
+            (lib.join_path, (('a', 1, 'b'), )),
+            (lambda: list(lib.flatten_iterable(deep).values())),
+        ]
+        controls = [
+            [((), 1)],
+            [(('a', ), 0), (('b', 0), 1), (('b', 1, 'c'), [])],
+            [(('p', 0), {}), (('p', 1, 0), 2)],
+            'a.1.b',
+            ['bottom'],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_6_unflatten_stream(self):
+        flat = {'a': 0, 'b.0': 1, 'b.1': {}, 'c.x.0': 2, 'c.x.1': 3, 'c.y': 4}
+        unflat = {'a': 0, 'b': [1, {}], 'c': {'x': [2, 3], 'y': 4}}
+        variables = [
+            (lib.unflatten_iterable, flat),
+            (lib.unflatten_stream, (iter(flat.items()), )),
+            (lib.unflatten_stream, (iter([('0.a', 0), ('1', 1)]), )),
+            (lib.unflatten_stream, (iter([('a/b', 0)]), ), dict(split='/')),
+            (lib.unflatten_stream, (iter([]), )),
+            (lambda: lib.unflatten_stream(lib.flatten_iterable(unflat).items())),
+        ]
+        controls = [
+            unflat,
+            unflat,
+            [{'a': 0}, 1],
+            {'a': {'b': 0}},
+            {},
+            unflat,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_7_flatten_records(self):
+        records = [
+            {'a': 0, 'b': {'c': 'x'}, 'f': 0.5},
+            {'a': 1, 'd': [True], 'f': 1},
+            {'a': 2**64, 'f': 2},
+        ]
+        columns = lib.flatten_records(records, missing=None)
+        variables = [
+            (lambda: list(columns)),
+            (lambda: [type(col).__name__ for col in columns.values()]),
+            (lambda: columns['b.c']),
+            (lambda: columns['f'].typecode),
+            (lambda: [type(col).__name__ for col in lib.flatten_records(records[:2], arrays=False).values()]),
+            (lambda: dict(lib.flatten_records(iter(records[:2])))['d.0']),
+            (lib.unflatten_records, (columns, ), dict(missing=None)),
+            (lib.unflatten_records, (lib.flatten_records(records), )),
+            (lib.flatten_records, ([], )),
+        ]
+        controls = [
+            ['a', 'b.c', 'f', 'd.0'],
+            ['list', 'list', 'array', 'list'],
+            ['x', None, None],
+            'd',
+            ['list', 'list', 'list', 'list'],
+            [lib.SENTINEL, True],
+            records,
+            records,
+            {},
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_8_fingerprint(self):
+        fp = lib.Fingerprinter()
+        shared = {'x': [1, 2, {'y': None}]}
+        itself = []  # type: list
+        itself.append(itself)
+        deep = {'a': [{'b': None}]}
+        deep['a'][0]['b'] = deep
+        twice = [1]
+
+        def cached_then_forgotten():
+            config = {'servers': [{'port': 80}], 'other': {'x': 1}}
+            before = fp.digest(config)
+            fp.forget(config, ('servers', 0, 'port'))  # config, servers, servers[0] go stale, other doesnt
+            config['servers'][0]['port'] = 8080
+            return (
+                fp.cached(config['other']) is not None,
+                fp.cached(config['servers'][0]) is not None,
+                fp.cached(config) is None,
+                fp.digest(config) == lib.Fingerprinter().digest(config),
+                fp.digest(config) == before,
+            )
+
+        variables = [
+            (lambda: lib.fingerprint({'a': 0, 'b': [1, 2]}) == lib.fingerprint({'b': [1, 2], 'a': 0})),
+            (lambda: lib.fingerprint([1, 2]) == lib.fingerprint([2, 1])),
+            (lambda: lib.fingerprint([1, 2]) == lib.fingerprint((1, 2))),
+            (lambda: lib.fingerprint({1, 2, 3}) == lib.fingerprint({3, 2, 1})),
+            (lambda: lib.fingerprint(1) == lib.fingerprint(1.0)),
+            (lambda: lib.fingerprint({'a': {'b': 1}}) == lib.fingerprint({'a': {'b': 2}})),
+            (lambda: fp.digest(shared) == fp.digest({'x': [1, 2, {'y': None}]})),
+            (lambda: len(lib.fingerprint(NESTED_DICT))),
+            (lib.fingerprint, (itself, )),
+            (lib.fingerprint, (deep, )),
+            (lambda: lib.fingerprint([twice, [twice], twice]) == lib.fingerprint([[1], [[1]], [1]])),  # shared, but not circular
+            (cached_then_forgotten, ()),
+        ]
+        controls = [
+            True,
+            False,
+            False,
+            True,
+            False,
+            False,
+            True,
+            32,
+            ValueError,
+            ValueError,
+            True,
+            (True, False, True, True, False),
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_9_diff_patch_iterable(self):
+        l = {'a': 0, 'b': [1, 2], 'd': {'e': [1, {'f': 1}]}, 's': {'0': 'str key'}}
+        r = {'a': 1, 'b': [1], 'c': 2, 'd': {'e': [1, {'f': 2}, 3]}, 's': {'0': 'changed'}}
+        variables = [
+            (lib.diff_iterable, (l, l)),
+            (lib.diff_iterable, (l, copy.deepcopy(l))),
+            (lib.diff_iterable, ({'a': 0, 'b': [1, 2]}, {'a': 1, 'b': [1], 'c': 2})),
+            (lib.diff_iterable, ([1], (1, ))),
+            (lib.diff_iterable, (1, 1.0)),
+            (lambda: lib.patch_iterable(copy.deepcopy(l), lib.diff_iterable(l, r, join=False))),
+            (lambda: lib.patch_iterable([0, 1], lib.diff_iterable([0, 1], [0, 1, 2, 3]))),
+            (lambda: lib.patch_iterable(1, lib.diff_iterable(1, {'a': 1}))),
+            (lib.patch_iterable, ({}, [('remove', '', None)])),
+            (lib.patch_iterable, ({}, [('upsert', 'a', None)])),
+            (lib.diff_iterable, ({'a': 0, 'b': [1, 2]}, {'a': 1, 'b': [1], 'c': 2}), dict(join=True)),
+            (lib.diff_iterable, ([1], (1, )), dict(join=True)),
+        ]
+        controls = [
+            [],
+            [],
+            [('add', ('c', ), 2), ('replace', ('a', ), 1), ('remove', ('b', 1), None)],
+            [('replace', tuple(), (1, ))],
+            [('replace', tuple(), 1.0)],
+            r,
+            [0, 1, 2, 3],
+            {'a': 1},
+            ValueError,
+            ValueError,
+            [('add', 'c', 2), ('replace', 'a', 1), ('remove', 'b.1', None)],
+            [('replace', '', (1, ))],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+        # round trips, with keys that look like indexes or contain the split
+        pairs = [
+            ({'s': {'0': 'a'}}, {'s': {'0': 'b'}}),
+            ({'s': {'0': 'a'}}, {'s': {'0': 'a', '1': 'b'}}),
+            ({'s': {0: 'a'}}, {'s': {0: 'b'}}),
+            ({'a.b': {'c': 1}}, {'a.b': {'c': 2, 'd.e': [1]}}),
+            ({'a.b': [1, {'x.y': 0}]}, {'a.b': [1, {'x.y': 1}, 2]}),
+        ]
+        variables = []
+        controls = []
+        for l, r in pairs:
+            for join in [False, True]:
+                variables.append((lambda l, r, join: lib.patch_iterable(copy.deepcopy(l), lib.diff_iterable(l, r, join=join)), (l, r, join)))
+                controls.append(r)
+        # 'a.b' is genuinely ambiguous as a dotted key here, only the path tuple can say which one changed
+        l, r = {'a': {'b': 0}, 'a.b': 1}, {'a': {'b': 0}, 'a.b': 2}
+        variables.append((lambda: lib.patch_iterable(copy.deepcopy(l), lib.diff_iterable(l, r))))
+        controls.append(r)
+        self.assert_null_hypothesis(variables, controls)
+
+        # diff, mutate, diff again with the same fingerprinter
+        fp = lib.Fingerprinter()
+        a = {'x': [1, 2]}
+        b = {'x': [1, 2]}
+        before = lib.diff_iterable(a, b, fingerprinter=fp)
+        a['x'].append(3)
+        after = lib.diff_iterable(a, b, fingerprinter=fp)
+        patched = lib.patch_iterable(a, after, fingerprinter=fp)
+        again = lib.diff_iterable(a, b, fingerprinter=fp)
+        variables = [
+            lambda: before,
+            lambda: after,
+            lambda: patched,
+            lambda: again,
+        ]
+        controls = [
+            [],
+            [('remove', ('x', 2), None)],
+            b,
+            [],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_10_walk(self):
+        data = {'a': {'b': 0}, 'c': [1, {'d': 2}]}
+        variables = [
+            (lambda: [path for path, _, _ in lib.walk(data)]),
+            (lambda: [path for path, _, _ in lib.walk(data, max_depth=1)]),
+            (lambda: [path for path, _, _ in lib.walk(data, prune=lambda path, value: path == ('c', ))]),
+            (lambda: [parent is data['c'] for path, _, parent in lib.walk(data) if path[0] == 'c' and len(path) == 2]),
+            (lambda: list(lib.walk(1))),
+            (lambda: list(lib.walk(data, max_depth=0))),
+            (lambda: list(lib.keys(data, prepend='p'))),
+        ]
+        controls = [
+            [('a', ), ('a', 'b'), ('c', ), ('c', 0), ('c', 1), ('c', 1, 'd')],
+            [('a', ), ('c', )],
+            [('a', ), ('a', 'b'), ('c', )],
+            [True, True],
+            [],
+            [],
+            ['p.a', 'p.a.b', 'p.c', 'p.c.0', 'p.c.1', 'p.c.1.d'],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_11_walk_benchmark(self):
+        for depth in [10, 100, 1000]:
+            data = leaf = {}  # type: dict
+            for d in range(depth):
+                leaf['k{}'.format(d)] = list(range(10))
+                leaf['n'] = {}
+                leaf = leaf['n']
+            number = 3
+            walk_s = timeit.timeit(lambda: list(lib.walk(data)), number=number) / number
+            keys_s = timeit.timeit(lambda: list(lib.keys(data)), number=number) / number
+            flatten_s = timeit.timeit(lambda: lib.flatten_iterable(data), number=number) / number
+            LOGGER.info('depth %4d - walk %.6fs, keys %.6fs, flatten_iterable %.6fs', depth, walk_s, keys_s, flatten_s)
+            self.assertEqual(len(list(lib.keys(data))), depth * 12)
+
+    def test_case_12_query(self):
+        data = {
+            'servers': {
+                'web-1': {'ports': [80, 8080], 'timeout': 1},
+                'db': {'ports': [5432], 'timeout': 2},
+            },
+            'timeout': 3,
+            'tags': {'0': 'zero'},
+        }
+        index = lib.QueryIndex(data)
+        queries = [
+            'servers.*.ports.0',
+            '**.timeout',
+            'servers./web-\\d+/.ports',
+            'servers.web-1.ports.[1:]',
+            'servers.db.ports.-1',
+            'tags.0',
+            'nope.**',
+        ]
+        controls = [
+            [(('servers', 'web-1', 'ports', 0), 80), (('servers', 'db', 'ports', 0), 5432)],
+            [(('servers', 'web-1', 'timeout'), 1), (('servers', 'db', 'timeout'), 2), (('timeout', ), 3)],
+            [(('servers', 'web-1', 'ports'), [80, 8080])],
+            [(('servers', 'web-1', 'ports', 1), 8080)],
+            [(('servers', 'db', 'ports', 0), 5432)],
+            [(('tags', '0'), 'zero')],
+            [],
+        ]
+        variables = [(lib.query, (q, data)) for q in queries]
+        self.assert_null_hypothesis(variables, controls)
+        variables = [(lib.query, (q, index)) for q in queries]
+        self.assert_null_hypothesis(variables, controls)
+
+        variables = [
+            (lib.compile_query, '/unterminated'),
+            (lib.compile_query, '/a/b'),
+            (lib.compile_query, '[1:x]'),
+            (lambda: lib.compile_query('**.timeout').segments),
+            (lambda: lib.compile_query('a.*').match(('a', 'b'))),
+            (lambda: lib.compile_query('a.*').match(('a', 'b', 'c'))),
+        ]
+        controls = [
+            ValueError,
+            ValueError,
+            ValueError,
+            ((lib.QUERY_DEEP, None), (lib.QUERY_KEY, 'timeout')),
+            True,
+            False,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_13_infer_schema(self):
+        records = [
+            {'a': 1, 'b': [{'c': None}, {'c': 2}]},
+            {'a': 'x', 'e': {}},
+            {'a': None},
+        ]
+        schema = lib.infer_schema(iter(records))
+        halves = lib.merge_schemas([lib.infer_schema(records[:1]), lib.infer_schema(records[1:])])
+        variables = [
+            (lambda: schema.records),
+            (lambda: {k: dict(v) for k, v in schema.types.items()}),
+            (schema.conflicts),
+            (schema.missing, 'b.*.c'),
+            (schema.nulls, 'a'),
+            (lambda: list(lib.infer_schema(records, collapse_lists=False).types)),
+            (lambda: lib.infer_schema(records, sample=1).records),
+            (lambda: halves.to_dict() == schema.to_dict()),
+            (lambda: lib.merge_schemas([]).records),
+        ]
+        controls = [
+            3,
+            {'a': {'int': 1, 'str': 1, 'NoneType': 1}, 'b.*.c': {'NoneType': 1, 'int': 1}, 'e': {'dict': 1}},
+            {'a': ['int', 'str']},
+            2,
+            1,
+            ['a', 'b.0.c', 'b.1.c', 'e'],
+            1,
+            True,
+            0,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_14_contains_many(self):
+        variables = [
+            (lib.contains_many, ([self.num_list, self.num_dict, 'abc123', {1: 0}], 1)),
+            (lib.contains_many, ([self.num_list, self.num_dict, 'abc123'], [1, 3])),
+            (lib.contains_many, ([self.num_list, [4]], [1, 4]), dict(func=any)),
+            (lib.contains_many, ([self.num_list, [4]], [1]), dict(exc=True)),
+            (lib.contains, (iter(self.num_list), [1, 3])),
+            (lib.contains, ([[1], 2], [[1]])),
+            (lib.contains, ({'a': 1}, [[1]])),
+            (lib.contains_many, ([], 1)),
+        ]
+        controls = [
+            [True, True, True, True],
+            [True, True, True],
+            [True, True],
+            ValueError,
+            True,
+            True,
+            False,
+            [],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_15_contains_benchmark(self):
+        levels = {name: level for level, name in enumerate(['NOTSET', 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'])}
+        lst = list(range(1000))
+        number = 10000
+        for name, func in [
+            ('contains(dict, hit)', lambda: lib.contains(levels, 'INFO', exc=True)),
+            ('contains(list, hit)', lambda: lib.contains(lst, 999)),
+            ('contains(list, miss)', lambda: lib.contains(lst, -1)),
+            ('contains(list, 10 tokens)', lambda: lib.contains(lst, list(range(990, 1000)))),
+            ('contains(str, hit)', lambda: lib.contains('abc123', 'c1')),
+            ('contains_many(10 dicts)', lambda: lib.contains_many([levels] * 10, 'INFO')),
+        ]:
+            per_call = timeit.timeit(func, number=number) / number
+            LOGGER.info('%-28s %.3fus per call', name, per_call * 1e6)
+            self.assertLess(per_call, 0.01, '{} should never need to walk the stack'.format(name))
+
+    @unittest.skipUnless(numpy, 'numpy is not installed')
+    def test_case_16_flatten_records_dtype(self):
+        records = [
+            {'i': 0, 'f': 0.5, 's': '1', 'b': True},
+            {'i': 1, 'f': 1, 's': '2', 'b': False},
+        ]
+        columns = lib.flatten_records(records, dtype='float32')
+        variables = [
+            (lambda: [type(col).__name__ for col in columns.values()]),
+            (lambda: str(columns['i'].dtype)),
+            (lambda: columns['f'].tolist()),
+            (lambda: columns['s']),
+            (lambda: columns['b']),
+        ]
+        controls = [
+            ['ndarray', 'ndarray', 'list', 'list'],
+            'float32',
+            [0.5, 1.0],
+            ['1', '2'],
+            [True, False],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_17_diff_fingerprinter_reuse(self):
+        combined = []
+
+        class Counting(lib.Fingerprinter):
+
+            def _combine(self, value):
+                combined.append(value)
+                return super()._combine(value)
+
+        def tree():
+            return {'g{}'.format(g): {'r{}'.format(r): [r, {'v': r}] for r in range(200)} for g in range(50)}
+
+        l, r = tree(), tree()
+        r['g7']['r3'][1]['v'] = 'changed'
+        fp = Counting()
+        first = lib.diff_iterable(l, r, fingerprinter=fp)
+        warmed = len(combined)
+        del combined[:]
+        second = lib.diff_iterable(l, r, fingerprinter=fp)  # every digest is reused, nothing is rehashed
+        second_combined = len(combined)
+        lib.patch_iterable(l, second, fingerprinter=fp)
+        third = lib.diff_iterable(l, r, fingerprinter=fp)  # the patched path was forgotten, so this is just l == r
+        third_combined = len(combined) - second_combined
+        fp.forget(l, ('g1', 'r1', 1, 'v'))
+        l['g1']['r1'][1]['v'] = 'mutated by hand'
+        fourth = lib.diff_iterable(l, r, fingerprinter=fp)  # only the containers on the patched and mutated paths are rehashed
+        fourth_combined = len(combined) - second_combined - third_combined
+        variables = [
+            lambda: first,
+            lambda: warmed > 0,
+            lambda: second,
+            lambda: second_combined,
+            lambda: third,
+            lambda: third_combined,
+            lambda: fourth,
+            lambda: fourth_combined,
+            lambda: lib.diff_iterable(l, r),  # a fingerprinter never changes the answer
+        ]
+        controls = [
+            [('replace', ('g7', 'r3', 1, 'v'), 'changed')],
+            True,
+            [('replace', ('g7', 'r3', 1, 'v'), 'changed')],
+            0,
+            [],
+            0,
+            [('replace', ('g1', 'r1', 1, 'v'), 1)],
+            7,  # root + 3 below it on each path
+            [('replace', ('g1', 'r1', 1, 'v'), 1)],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+        # without a fingerprinter the diff is a handful of C-speed == passes, about what a plain recursive == diff costs
+        def naive(a, b, path=()):
+            if a == b:
+                return []
+            if isinstance(a, dict) and isinstance(b, dict):
+                return [op for k in a for op in naive(a[k], b[k], path + (k, ))]
+            if isinstance(a, list) and isinstance(b, list):
+                return [op for i, (x, y) in enumerate(zip(a, b)) for op in naive(x, y, path + (i, ))]
+            return [('replace', path, b)]
+
+        l, r = tree(), tree()
+        r['g7']['r3'][1]['v'] = 'changed'
+        naive_s = min(timeit.repeat(lambda: naive(l, r), number=1, repeat=3))
+        diff_s = min(timeit.repeat(lambda: lib.diff_iterable(l, r), number=1, repeat=3))
+        self.assertEqual(lib.diff_iterable(l, r), naive(l, r))
+        self.assertLess(diff_s, naive_s * 5 + 0.005)
+
+
 if __name__ == '__main__':
     tc = TestCase()
     tc.setUp()
@@ -222,5 +727,19 @@ if __name__ == '__main__':
     tc.test_case_1_flatten_iterable()
     tc.test_case_2_keys_isleaf()
     tc.test_case_3_contains()
+    tc.test_case_4_compile_key()
+    tc.test_case_5_iter_flatten()
+    tc.test_case_6_unflatten_stream()
+    tc.test_case_7_flatten_records()
+    tc.test_case_8_fingerprint()
+    tc.test_case_9_diff_patch_iterable()
+    tc.test_case_10_walk()
+    tc.test_case_11_walk_benchmark()
+    tc.test_case_12_query()
+    tc.test_case_13_infer_schema()
+    tc.test_case_14_contains_many()
+    tc.test_case_15_contains_benchmark()
+    tc.test_case_16_flatten_records_dtype()
+    tc.test_case_17_diff_fingerprinter_reuse()
 
     tc.tearDown()
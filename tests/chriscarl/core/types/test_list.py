@@ -9,6 +9,12 @@ Description:
 chriscarl.core.types.list unit test.
 
 Updates:
+    2026-10-18 - tests.chriscarl.core.types.list - n_chunks counts and sizes, dicts are rejected
+    2026-10-18 - tests.chriscarl.core.types.list - top_k benchmark only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.types.list - iter_dedupe benchmark only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.types.list - added chunking over iterators/buffers and chunked_map tests
+    2026-10-18 - tests.chriscarl.core.types.list - added top_k and sketch tests
+    2026-10-18 - tests.chriscarl.core.types.list - added iter_dedupe and BloomFilter tests
     2024-11-25 - tests.chriscarl.core.types.list - initial commit
 '''
 
@@ -16,14 +22,20 @@ Updates:
 from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
 import os
 import sys
+import array
+import heapq
+import collections
 import logging
+import random
+import timeit
 import unittest
+import concurrent.futures
 from typing import List
 
 # third party imports
 
 # project imports (expected to work)
-from chriscarl.core.lib.stdlib.unittest import UnitTest
+from chriscarl.core.lib.stdlib.unittest import UnitTest, benchmark
 
 # test imports
 import chriscarl.core.types.list as lib
@@ -128,6 +140,211 @@ class TestCase(UnitTest):
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_6_iter_dedupe(self):
+        records = [{'a': 1}, {'a': 1}, {'a': 2}, [1, 2], [1, 2], 'a', b'a', 'a']
+        variables = [
+            (lib.iter_dedupe, ([1, 2, 1, 3, 2], )),
+            (lib.iter_dedupe, (records, )),
+            (lib.iter_dedupe, (range(10), ), dict(key=lambda x: x % 3)),
+            (lib.iter_dedupe, (records, ), dict(approximate=True, capacity=100)),
+            (lib.iter_dedupe, (records, ), dict(approximate=True, max_bytes=64)),
+            (lib.dedupe, ([[1], [1], 2], )),
+            lambda: lib.BloomFilter(0),
+            lambda: lib.BloomFilter(10, error_rate=1),
+        ]
+        controls = [
+            [1, 2, 3],
+            [{'a': 1}, {'a': 2}, [1, 2], 'a', b'a'],
+            [0, 1, 2],
+            [{'a': 1}, {'a': 2}, [1, 2], 'a', b'a'],
+            [{'a': 1}, {'a': 2}, [1, 2], 'a', b'a'],
+            [[1], 2],
+            ValueError,
+            ValueError,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_7_iter_dedupe_benchmark(self):
+        # memory vs accuracy: the set holds every key, the filter is fixed at ~1.44 * log2(1 / error_rate) bits per item
+        n = 20000
+        seen = ['seen-{}'.format(i) for i in range(n)]
+        unseen = ['unseen-{}'.format(i) for i in range(n)]
+        exact = set(seen)
+        exact_bytes = sys.getsizeof(exact) + sum(sys.getsizeof(s) for s in seen)
+        LOGGER.info('set: %d bytes, 0.0 false positives', exact_bytes)
+        for error_rate in [0.1, 0.01, 0.001]:
+            bloom = lib.BloomFilter(n, error_rate=error_rate)
+            for s in seen:
+                bloom.add(s)
+            false_positives = sum(s in bloom for s in unseen) / n
+            LOGGER.info('bloom %s: %d bytes, %d hashes, %0.4f false positives', error_rate, len(bloom.array), bloom.hashes, false_positives)
+            self.assertLess(len(bloom.array), exact_bytes)
+            self.assertLess(false_positives, error_rate * 2)
+            self.assertTrue(all(s in bloom for s in seen))
+
+        data = seen + seen
+        exact_time = timeit.timeit(lambda: list(lib.iter_dedupe(data)), number=1)
+        bloom_time = timeit.timeit(lambda: list(lib.iter_dedupe(data, approximate=True, capacity=n)), number=1)
+        LOGGER.info('iter_dedupe %d items: exact %0.4fs, approximate %0.4fs', len(data), exact_time, bloom_time)
+
+    def test_case_8_top_k(self):
+        text = 'abracadabra'
+        stream = ['x'] * 3000 + ['y'] * 2000 + ['z'] * 1000 + list(range(10_000))
+        random.Random(0).shuffle(stream)
+        exact = collections.Counter(stream)
+        cms = lib.CountMinSketch(width=1024, depth=4, k=2)
+        cms.update(text)
+        mg = lib.MisraGries(3)
+        mg.update(text)
+        variables = [
+            (lib.top_k, (text, 2)),
+            (lib.top_k, (cms, 2)),
+            (lib.top_k, (mg, 2)),
+            (lib.top_k, ([], 2)),
+            (lib.sorted_list_by_frequency, (self.num_list, ), dict(sketch=lib.MisraGries(10))),
+            (lib.sorted_list_by_frequency, (self.num_list, ), dict(ascending=False, sketch=lib.CountMinSketch(k=10))),
+            lambda: lib.CountMinSketch(width=0),
+            lambda: lib.MisraGries(1),
+            # more distinct elements than max_distinct, so counting carries on in a bounded summary
+            lambda: [item for item, _ in lib.top_k(stream, 3, max_distinct=100)],
+            lambda: all(count <= exact[item] for item, count in lib.top_k(stream, 3, max_distinct=100)),
+            lambda: lib.top_k(stream, 3, max_distinct=100) == lib.top_k(stream, 3)[:3],  # under-counted, so not equal
+            lambda: lib.top_k(iter(stream), 3) == heapq.nlargest(3, exact.items(), key=lambda tpl: tpl[1]),
+            # the sketch handed in isnt the one that gets updated
+            lambda: lib.sorted_list_by_frequency(self.num_list, sketch=mg) and mg.total,
+            lambda: lib.sorted_list_by_frequency(self.num_list, sketch=cms) and (cms.total, cms.most_common()),
+        ]
+        controls = [
+            [('a', 5), ('b', 2)],
+            [('a', 5), ('b', 2)],
+            [('a', 2)],
+            [],
+            [1, 2, 3],
+            [3, 2, 1],
+            ValueError,
+            ValueError,
+            ['x', 'y', 'z'],
+            True,
+            False,
+            True,
+            len(text),
+            (len(text), [('a', 5), ('b', 2)]),
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_9_sketch_merge(self):
+        left, right = 'aaab', 'aacc'
+        cms_left, cms_right = lib.CountMinSketch(k=2), lib.CountMinSketch(k=2)
+        cms_left.update(left)
+        cms_right.update(right)
+        mg_left, mg_right = lib.MisraGries(3), lib.MisraGries(3)
+        mg_left.update(left)
+        mg_right.update(right)
+        variables = [
+            lambda: cms_left.merge(cms_right).most_common(),
+            lambda: cms_left.total,
+            lambda: mg_left.merge(mg_right).most_common(),
+            lambda: mg_left.total,
+            lambda: lib.CountMinSketch(width=8).merge(lib.CountMinSketch(width=16)),
+            lambda: lib.MisraGries(3).merge(lib.MisraGries(4)),
+        ]
+        controls = [
+            [('a', 5), ('c', 2)],
+            8,
+            [('a', 4), ('c', 1)],
+            8,
+            ValueError,
+            ValueError,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_10_top_k_benchmark(self):
+        # a few heavy hitters with distinct counts, shuffled into a long tail of distinct keys
+        data = [i for i in range(10) for _ in range(500 + 50 * i)] + list(range(1000, 21000))
+        random.Random(0).shuffle(data)
+        exact = lib.top_k(data, 10)
+        sort_time = timeit.timeit(lambda: sorted(lib.frequency_table(data).items(), key=lambda tpl: tpl[1], reverse=True)[:10], number=3)
+        heap_time = timeit.timeit(lambda: lib.top_k(data, 10), number=3)
+        LOGGER.info('top_k over %d items: full sort %0.4fs, heap %0.4fs', len(data), sort_time, heap_time)
+        for sketch in [lib.CountMinSketch.from_error(epsilon=0.001, delta=0.01, k=10), lib.MisraGries(100)]:
+            sketch_time = timeit.timeit(lambda: sketch.update(data), number=1)
+            approximate = sketch.most_common(10)
+            LOGGER.info('%s: %0.4fs, %d/10 of the exact top 10', type(sketch).__name__, sketch_time, len({k for k, _ in exact} & {k for k, _ in approximate}))
+            self.assertEqual({k for k, _ in exact}, {k for k, _ in approximate})
+
+    def test_case_11_chunks_iterators_and_buffers(self):
+        buffer = bytearray(b'abcdefg')
+        numbers = array.array('q', self.ten)
+        variables = [
+            (lib.n_sized_chunks, (iter(self.ten), 4)),
+            (lib.n_sized_chunks, (iter([]), 4)),
+            (lib.n_chunks, (iter(self.ten), 4)),
+            lambda: [bytes(chunk) for chunk in lib.n_sized_chunks(buffer, 3, zero_copy=True)],
+            lambda: [chunk.tolist() for chunk in lib.n_chunks(numbers, 3, zero_copy=True)],
+            lambda: all(isinstance(chunk, memoryview) for chunk in lib.n_chunks(b'abc', 2, zero_copy=True)),
+            lambda: [chunk.obj is buffer for chunk in lib.n_chunks(buffer, 2, zero_copy=True)],
+            (lib.n_sized_chunks, (iter(self.ten), 0)),
+        ]
+        controls = [
+            [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]],
+            [],
+            [[0, 1, 2], [3, 4, 5], [6, 7], [8, 9]],
+            [b'abc', b'def', b'g'],
+            [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]],
+            True,
+            [True, True],
+            ValueError,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_12_chunked_map(self):
+        numbers = list(range(-50, 50))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            variables = [
+                (lib.chunked_map, (abs, numbers), dict(chunks=4)),
+                (lib.chunked_map, (abs, iter(numbers)), dict(chunks=3, executor='thread')),
+                (lib.chunked_map, (len, [b'ab', b'c']), dict(chunks=8, executor=executor)),
+                (lib.chunked_map, (abs, []), dict(chunks=2, executor='thread')),
+                (lib.chunked_map, (abs, numbers), dict(executor='fiber')),
+            ]
+            controls = [
+                [abs(n) for n in numbers],
+                [abs(n) for n in numbers],
+                [2, 1],
+                [],
+                ValueError,
+            ]
+            self.assert_null_hypothesis(variables, controls)
+
+    def test_case_13_chunk_counts_and_sizes(self):
+        variables = [
+            lambda: [list(chunk) for chunk in lib.n_chunks(range(5), 3)],
+            lambda: [len(chunk) for chunk in lib.n_chunks(range(100), 8)],
+            lambda: [len(chunk) for chunk in lib.n_chunks(range(7), 7)],
+            lambda: [len(chunk) for chunk in lib.n_chunks(range(3), 8)],
+            lambda: [len(chunk) for chunk in lib.n_chunks([], 3)],
+            lambda: all(len(list(lib.n_chunks(range(length), n))) == min(n, length) for length in range(50) for n in range(1, 12)),
+            (lib.chunked_map, (str, range(10)), dict(chunks=3, executor='thread')),
+            (lib.n_sized_chunks, ({'a': 1, 'b': 2}, 1)),
+            (lib.n_chunks, ({'a': 1, 'b': 2}, 1)),
+            (lib.n_sized_chunks, (list({'a': 1, 'b': 2}.items()), 1)),
+        ]
+        controls = [
+            [[0, 1], [2, 3], [4]],
+            [13, 13, 13, 13, 12, 12, 12, 12],
+            [1, 1, 1, 1, 1, 1, 1],
+            [1, 1, 1],
+            [],
+            True,
+            [str(i) for i in range(10)],
+            TypeError,
+            TypeError,
+            [[('a', 1)], [('b', 2)]],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
 
 if __name__ == '__main__':
     tc = TestCase()
@@ -139,5 +356,13 @@ if __name__ == '__main__':
     tc.test_case_3_as_list()
     tc.test_case_4_n_sized_chunks()
     tc.test_case_5_n_chunks()
+    tc.test_case_6_iter_dedupe()
+    tc.test_case_7_iter_dedupe_benchmark()
+    tc.test_case_8_top_k()
+    tc.test_case_9_sketch_merge()
+    tc.test_case_10_top_k_benchmark()
+    tc.test_case_11_chunks_iterators_and_buffers()
+    tc.test_case_12_chunked_map()
+    tc.test_case_13_chunk_counts_and_sizes()
 
     tc.tearDown()
@@ -9,6 +9,19 @@ Description:
 chriscarl.core.types.string unit test.
 
 Updates:
+    2026-10-18 - tests.chriscarl.core.types.string - fuzzy benchmark only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.types.string - CaseInsensitiveIndex only builds n-grams past build_after, its timings moved to a benchmark
+    2026-10-18 - tests.chriscarl.core.types.string - bulk size timings moved to a benchmark that only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.types.string - MultiPatternMatcher benchmark only runs with CHRISCARL_BENCHMARK set
+    2026-10-18 - tests.chriscarl.core.types.string - _Fuzzy cannot be instantiated without a query
+    2026-10-18 - tests.chriscarl.core.types.string - CaseInsensitiveIndex long tokens whose n-grams are all present but apart
+    2026-10-18 - tests.chriscarl.core.types.string - signed sizes and plural units still parse
+    2026-10-18 - tests.chriscarl.core.types.string - MultiPatternMatcher case-insensitive offsets when lower() grows the text
+    2026-10-18 - tests.chriscarl.core.types.string - added FuzzyIndex and BKTree tests and benchmark
+    2026-10-18 - tests.chriscarl.core.types.string - added CaseInsensitiveIndex tests
+    2026-10-18 - tests.chriscarl.core.types.string - added size unit and bulk size tests
+    2026-10-18 - tests.chriscarl.core.types.string - added LineIndex tests
+    2026-10-18 - tests.chriscarl.core.types.string - added MultiPatternMatcher tests and benchmark
     2024-11-26 - tests.chriscarl.core.types.string - initial commit
 '''
 
@@ -16,13 +29,17 @@ Updates:
 from __future__ import absolute_import, print_function, division, with_statement  # , unicode_literals
 import os
 import sys
+import re
+import random
+import string
 import logging
+import timeit
 import unittest
 
 # third party imports
 
 # project imports (expected to work)
-from chriscarl.core.lib.stdlib.unittest import UnitTest
+from chriscarl.core.lib.stdlib.unittest import UnitTest, benchmark
 
 # test imports
 import chriscarl.core.types.str as lib
@@ -117,6 +134,285 @@ class TestCase(UnitTest):
         ]
         self.assert_null_hypothesis(variables, controls)
 
+    def test_case_4_multi_pattern_matcher(self):
+        mpm = lib.MultiPatternMatcher(['he', 'she', 'his', 'hers'])
+        variables = [
+            (mpm.findall, 'ushers'),
+            (mpm.findall, 'nothing'),
+            (mpm.found, 'this shell'),
+            (mpm.search, 'ahis'),
+            (lib.MultiPatternMatcher(['abc', 'bcd', 'c']).findall, 'xabcdx'),
+            (lib.MultiPatternMatcher(['Ab', 'b'], case_insensitive=True).findall, 'aBAB'),
+            (lib.MultiPatternMatcher([b'ab', b'b']).findall, b'abab'),
+            lambda: mpm.findall(b'ushers'),
+            lambda: lib.MultiPatternMatcher(['a', b'b']),
+            lambda: lib.MultiPatternMatcher(['a', '']),
+            (lib.find_index, ('aa', 'aaaa')),
+            (lib.find_index, ('', 'aaaa')),
+            (lib.MultiPatternMatcher(['b', 'ab'], case_insensitive=True).findall, '\u0130xAB'),
+            (lib.MultiPatternMatcher(['\u0130x'], case_insensitive=True).findall, 'a\u0130X'),
+        ]
+        controls = [
+            [(1, 1), (2, 0), (2, 3)],
+            [],
+            {0, 1, 2},
+            True,
+            [(1, 0), (3, 2), (2, 1)],
+            [(0, 0), (1, 1), (2, 0), (3, 1)],
+            [(0, 0), (1, 1), (2, 0), (3, 1)],
+            TypeError,
+            TypeError,
+            ValueError,
+            [0, 1, 2],
+            [],
+            [(2, 1), (3, 0)],  # 'İ' lowers to 2 chars, offsets still index the original text
+            [(1, 0)],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_5_multi_pattern_matcher_benchmark(self):
+        # scaled down from 1,000 patterns over 100 MB so the suite stays quick, the ratio is what matters
+        rng = random.Random(0)
+        alphabet = string.ascii_lowercase[:8]
+        patterns = sorted({''.join(rng.choice(alphabet) for _ in range(rng.randint(4, 8))) for _ in range(1000)})
+        text = ''.join(rng.choice(alphabet + ' ') for _ in range(200_000))
+        mpm = lib.MultiPatternMatcher(patterns)
+        expected = sorted((offset, pid) for pid, pattern in enumerate(patterns) for offset in lib.find_index(pattern, text))
+        self.assertEqual(sorted(mpm.findall(text)), expected)
+
+        build_time = timeit.timeit(lambda: lib.MultiPatternMatcher(patterns), number=1)
+        single_pass = timeit.timeit(lambda: mpm.findall(text), number=1)
+        per_pattern = timeit.timeit(lambda: [list(lib.find_index(pattern, text)) for pattern in patterns], number=1)
+        per_pattern_re = timeit.timeit(lambda: [[mo.start() for mo in re.finditer(re.escape(pattern), text)] for pattern in patterns], number=1)
+        LOGGER.info(
+            '%d patterns over %d chars: build %0.4fs, one pass %0.4fs, per-pattern str.find %0.4fs, per-pattern re %0.4fs',
+            len(patterns), len(text), build_time, single_pass, per_pattern, per_pattern_re
+        )
+
+    def test_case_6_line_index(self):
+        text = 'ab\r\ncd\nef\x85g'
+        li = lib.LineIndex(text)
+        bli = lib.LineIndex(b'ab\r\ncd\n')
+        variables = [
+            lambda: len(li),
+            lambda: [li.line(lineno) for lineno in range(1, len(li) + 1)],
+            (li.lineno_colno, 0),
+            (li.lineno_colno, 5),
+            (li.lineno_colno, len(text)),
+            (li.offset, (3, 2)),
+            (bli.lineno_colno, 4),
+            (bli.line, 2),
+            (li.lineno_colno, len(text) + 1),
+            (li.offset, 0),
+        ]
+        controls = [
+            4,
+            text.splitlines(),
+            (1, 1),
+            (2, 2),
+            (4, 2),
+            8,
+            (2, 1),
+            b'cd',
+            IndexError,
+            IndexError,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_7_size_units(self):
+        variables = [
+            (lib.size_to_bytes, '1.5 GiB'),
+            (lib.size_to_bytes, '1kb', dict(si=True)),
+            (lib.size_to_bytes, '1KiB', dict(si=True)),
+            (lib.size_to_bytes, '10 bytes'),
+            (lib.size_to_bytes, '.5k'),
+            (lib.size_to_bytes, '0x400'),
+            (lib.size_to_bytes, '1024', dict(into='kib')),
+            (lib.size_to_bytes, 2048, dict(into='k')),
+            (lib.size_to_bytes, '1 zb'),
+            (lib.size_to_bytes, '1ib'),
+            (lib.size_to_bytes, '1 k b'),
+            (lib.size_to_bytes, ''),
+            (lib.size_to_bytes, '1k', dict(into='lol')),
+            (lib.size_to_bytes, '-1k'),
+            (lib.size_to_bytes, '-5'),
+            (lib.size_to_bytes, '10kbs'),
+            (lib.size_to_bytes, '2 KiBs'),
+            (lib.size_to_bytes, '1mb', dict(into='kbs')),
+            (lib.size_to_bytes, '10s'),
+            (lib.bytes_to_size, 1500, dict(si=True)),
+            (lib.bytes_to_size, 1024**6),
+        ]
+        controls = [
+            1.5 * 1024**3,
+            1000,
+            1024,
+            10,
+            512,
+            1024,
+            1,
+            2,
+            ValueError,
+            ValueError,
+            ValueError,
+            ValueError,
+            ValueError,
+            -1024,
+            -5,
+            10240,
+            2048,
+            1024,
+            ValueError,
+            '1.50k',
+            '1024.00p',
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_8_sizes_bulk(self):
+        sizes = ['1k', '2 MiB', '3', ' 4 g ', '1.5e3 b']
+        variables = [
+            lambda: lib.sizes_to_bytes(sizes).tolist(),
+            lambda: lib.sizes_to_bytes(sizes, into='k', si=True).tolist(),
+            lambda: lib.sizes_to_bytes([1024, '1k']).tolist(),
+            lambda: lib.sizes_to_bytes(['1k', 'bad']),
+            lambda: lib.sizes_to_bytes(['1k\n2k', 'bad']),
+            (lib.bytes_to_sizes, ([1, 2048, 1.5 * 1024**3], )),
+            (lib.bytes_to_sizes, ([1500], ), dict(upper=True, si=True)),
+        ]
+        controls = [
+            [lib.size_to_bytes(size) for size in sizes],
+            [1.0, 2097.152, 0.003, 4000000.0, 1.5],
+            [1024.0, 1024.0],
+            ValueError,
+            ValueError,
+            ['1.00b', '2.00k', '1.50g'],
+            ['1.50K'],
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_9_case_insensitive_index(self):
+        cii = lib.CaseInsensitiveIndex('Hello World, hello Python 3')
+        variables = [
+            (cii.contains_all, (['HELLO', 'python'], )),
+            (cii.contains_any, (['java', 'rust'], )),
+            (cii.contains_all, (['lo wo', 'd, h', 'n', 3], )),
+            (cii.contains_any, ('World, hellp', )),
+            (cii.contains_all, ('java', ), dict(exc=True)),
+            (lib.contains_all_insensitive, (cii, ['WORLD', 'py'])),
+            (lib.contains_insensitive, ('ABC123', 'a')),
+            (lib.CaseInsensitiveIndex('ab').contains_all, (['a', 'b', 'ab', ''], )),
+            (lib.CaseInsensitiveIndex('').contains_any, ('a', )),
+            lambda: lib.CaseInsensitiveIndex('abc', n=0),
+            (lib.CaseInsensitiveIndex('abcd bcde', build_after=0).contains_any, ('ABCDE', )),
+            (lib.CaseInsensitiveIndex('xabab abababc', build_after=0).contains_all, (['ababc', 'XABAB ABA'], )),
+            (lib.CaseInsensitiveIndex('abcd bcde').contains_any, ('ABCDE', )),
+            (lib.contains_insensitive, (cii, ['hello', 'java']), dict(func=lambda found: sum(found) == 1)),
+            lambda: cii._positions is None,  # a handful of tokens never pays for the n-grams
+        ]
+        controls = [
+            True,
+            False,
+            True,
+            False,
+            ValueError,
+            True,
+            True,
+            True,
+            False,
+            ValueError,
+            False,  # every 3-gram is in there, but never all together
+            True,
+            False,
+            True,
+            True,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    def test_case_10_fuzzy(self):
+        names = ['run_functions_by_dot_path', 'create_modules_and_tests', 'audit_banned', 'Create', 'book', 'books', 'boo']
+        fi = lib.FuzzyIndex(names)
+        bk = lib.BKTree(names)
+        variables = [
+            (lib.edit_distance, ('kitten', 'sitting')),
+            (lib.edit_distance, ('kitten', 'sitting'), dict(max_distance=1)),
+            (lib.edit_distance, ('', 'abc')),
+            (fi.did_you_mean, 'run_function_by_dot_path'),
+            (fi.did_you_mean, 'crate'),
+            (fi.did_you_mean, 'xyz'),
+            (fi.query, 'bok', dict(max_distance=1)),
+            (fi.top_k, 'bo', dict(k=2)),
+            (bk.did_you_mean, 'run_function_by_dot_path'),
+            (bk.query, 'bok', dict(max_distance=1)),
+            (bk.top_k, 'bo', dict(k=2)),
+            (lib.FuzzyIndex(['Abc'], case_insensitive=False).query, 'abc', dict(max_distance=0)),
+            (lib.BKTree([]).query, 'abc'),
+            lambda: lib.FuzzyIndex(names, n=0),
+            lambda: lib._Fuzzy(),  # pylint: disable=abstract-class-instantiated
+        ]
+        controls = [
+            3,
+            2,
+            3,
+            'run_functions_by_dot_path',
+            'Create',
+            None,
+            [('book', 1), ('boo', 1)],
+            [('boo', 1), ('book', 2)],
+            'run_functions_by_dot_path',
+            [('book', 1), ('boo', 1)],
+            [('boo', 1), ('book', 2)],
+            [],
+            [],
+            ValueError,
+            TypeError,
+        ]
+        self.assert_null_hypothesis(variables, controls)
+
+    @benchmark
+    def test_case_11_fuzzy_benchmark(self):
+        rng = random.Random(0)
+        parts = [''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9))) for _ in range(300)]
+        names = list({'{}.{}.{}'.format(rng.choice(parts), rng.choice(parts), rng.choice(parts)) for _ in range(100_000)})
+        queries = []
+        for name in rng.sample(names, 100):
+            typo = list(name)
+            typo[rng.randrange(len(typo))] = rng.choice(string.ascii_lowercase)
+            queries.append(''.join(typo))
+        fi = lib.FuzzyIndex(names)
+        bk = lib.BKTree(names[:2_000])
+        fuzzy = timeit.timeit(lambda: [fi.did_you_mean(query, max_distance=1) for query in queries], number=1) / len(queries)
+        tree = timeit.timeit(lambda: [bk.did_you_mean(query, max_distance=1) for query in queries], number=1) / len(queries)
+        linear = timeit.timeit(lambda: min(names[:10_000], key=lambda name: lib.edit_distance(queries[0], name, max_distance=1)), number=1)
+        LOGGER.info('did you mean per query: FuzzyIndex %d names %0.3fms, BKTree %d names %0.3fms, linear scan %d names %0.3fms', len(names), fuzzy * 1000, 2_000, tree * 1000, 10_000, linear * 1000)
+        self.assertTrue(all(fi.did_you_mean(query, max_distance=1) is not None for query in queries))
+
+    @benchmark
+    def test_case_12_sizes_bulk_benchmark(self):
+        inventory = ['{}{}'.format(i % 997, 'bkmgtp'[i % 6]) for i in range(200_000)]
+        one_by_one = timeit.timeit(lambda: [lib.size_to_bytes(size) for size in inventory], number=1)
+        bulk = timeit.timeit(lambda: lib.sizes_to_bytes(inventory), number=1)
+        parsed = lib.sizes_to_bytes(inventory)
+        formatted = timeit.timeit(lambda: lib.bytes_to_sizes(parsed), number=1)
+        LOGGER.info('%d sizes: size_to_bytes each %0.4fs, sizes_to_bytes %0.4fs, bytes_to_sizes %0.4fs', len(inventory), one_by_one, bulk, formatted)
+
+    @benchmark
+    def test_case_13_case_insensitive_index_benchmark(self):
+        rng = random.Random(0)
+        words = [''.join(rng.choice(string.ascii_letters) for _ in range(rng.randint(3, 10))) for _ in range(2000)]
+        tokens = [rng.choice(words).upper() for _ in range(50)] + ['missing-token', 'zzzzzzzz']
+        for size in [10_000, 1_000_000]:
+            text = ' '.join(rng.choice(words) for _ in range(size // 7))
+            cii = lib.CaseInsensitiveIndex(text)
+            first = timeit.timeit(lambda: cii.contains_any(tokens), number=1)  # first time through remembers the answers
+            indexed = timeit.timeit(lambda: cii.contains_all(tokens), number=100)
+            scanned = timeit.timeit(lambda: lib.contains_all_insensitive(text, tokens), number=100)
+            ngrams = timeit.timeit(lambda: lib.CaseInsensitiveIndex(text).positions, number=1)
+            LOGGER.info(
+                '%d chars, %d tokens x100: CaseInsensitiveIndex %0.4fs (first probe %0.4fs), contains_all_insensitive %0.4fs, n-gram build %0.4fs', len(text),
+                len(tokens), indexed, first, scanned, ngrams
+            )
+
 
 if __name__ == '__main__':
     tc = TestCase()
@@ -126,5 +422,15 @@ if __name__ == '__main__':
     tc.test_case_1_size_to_bytes()
     tc.test_case_2_unicode()
     tc.test_case_3_contains()
+    tc.test_case_4_multi_pattern_matcher()
+    tc.test_case_5_multi_pattern_matcher_benchmark()
+    tc.test_case_6_line_index()
+    tc.test_case_7_size_units()
+    tc.test_case_8_sizes_bulk()
+    tc.test_case_9_case_insensitive_index()
+    tc.test_case_10_fuzzy()
+    tc.test_case_11_fuzzy_benchmark()
+    tc.test_case_12_sizes_bulk_benchmark()
+    tc.test_case_13_case_insensitive_index_benchmark()
 
     tc.tearDown()
@@ -9,6 +9,7 @@ Description:
 chriscarl.tools.shed.dev unit test.
 
 Updates:
+    2026-10-18 - tests.chriscarl.tools.shed.dev - audit_banned filename matches are case-sensitive
     2024-11-25 - tests.chriscarl.tools.shed.dev - initial commit
 '''
 
@@ -198,6 +199,9 @@ class TestCase(UnitTest):
 
         words = ['SUPERBANNED']
         write_text_file(abspath(self.tempdir, 'src/test/lol.py'), 'SUPERBANNED')
+        # filenames match case-sensitively no matter what word_case_insensitive says
+        write_text_file(abspath(self.tempdir, 'src/test/superbanned.py'), 'clean')
+        write_text_file(abspath(self.tempdir, 'src/test/SUPERBANNED_too.py'), 'clean')
         variables = [
             (lib.audit_banned, (self.tempdir, words), dict(include=included_dirs)),
         ]
@@ -205,7 +209,10 @@ class TestCase(UnitTest):
             {
                 'src/test/lol.py': {
                     'SUPERBANNED': [(1, 1), ],
-                }
+                },
+                'src/test/SUPERBANNED_too.py': {
+                    'SUPERBANNED': [(0, 0), ],
+                },
             },
         ]
         self.assert_null_hypothesis(variables, controls)